@@ -5,6 +5,7 @@
 """
 from abc import ABC, abstractmethod
 from enum import Enum
+from weakref import WeakValueDictionary
 from typing import Dict, List, Tuple, Any
 
 from janis_core.tool.tool import TInput, TOutput
@@ -45,9 +46,13 @@ class NodeType(Enum):
 
 
 class Node(object):
+    # nodes are created in large numbers, so instance attributes live in slots.
+    # subclasses which need arbitrary attributes (StepNode) don't declare __slots__.
+    __slots__ = ('wf', 'node_type', 'identifier', 'depth', 'sources', '_nodeId', '__weakref__')
 
     _N_counter: int = 1
-    _N_nodeId_map: Dict[int, Any] = {}
+    # weak, so a workflow's nodes are freed along with it
+    _N_nodeId_map: WeakValueDictionary[int, Any] = WeakValueDictionary()
 
     def __init__(self, wf, node_type: NodeType, identifier: NodeLabel, depth=0):
 
@@ -66,6 +71,16 @@ class Node(object):
         # Map the node, so we can look it up later
         self._N_nodeId_map[self._nodeId] = self
 
+    def __setstate__(self, state):
+        # unpickled nodes (eg from the ingest cache) are renumbered,
+        # as node ids are only unique within the process which created them
+        attrs, slots = state if isinstance(state, tuple) else (state, None)
+        for name, value in {**(attrs or {}), **(slots or {})}.items():
+            object.__setattr__(self, name, value)
+        self._nodeId = Node._N_counter
+        Node._N_counter += 1
+        self._N_nodeId_map[self._nodeId] = self
+
     def id(self) -> str:
         return self.identifier
 
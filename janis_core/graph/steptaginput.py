@@ -24,6 +24,8 @@ def full_dot(node: Node, tag: Optional[str]) -> str:
 
 
 class Edge:
+    __slots__ = ('_uuid', 'source', 'finish', 'ftag', 'compatible_types', 'should_scatter')
+
     def __init__(
         self, source: Selector, finish: Node, ftag: Optional[str], should_scatter: Optional[bool]=None
     ):
@@ -31,7 +33,7 @@ class Edge:
             f"Creating edge: ({source} → "
             f"({NodeType.to_str(finish.node_type)}) '{finish.id()}.{ftag}'"
         )
-        self.uuid: str = str(uuid4())
+        self._uuid: Optional[str] = None
         self.source = source
         self.finish: Node = finish
         self.ftag: Optional[str] = ftag
@@ -40,6 +42,13 @@ class Edge:
         self.validate_tags()
         self.check_types()
 
+    @property
+    def uuid(self) -> str:
+        # generated on first use: most edges never have a message logged against them
+        if self._uuid is None:
+            self._uuid = str(uuid4())
+        return self._uuid
+
     def validate_tags(self):
         if self.finish.node_type == NodeType.STEP:
             if self.ftag not in self.finish.inputs():
@@ -107,14 +116,22 @@ class StepTagInput:
     This class represents the connections that a single input on a step has. 
     A step will have one StepTagInput for each potential input of the tool.
     """
+    __slots__ = ('_uuid', 'finish', 'ftag', 'multiple_inputs', 'source_map')
 
     def __init__(self, finish: Node, finish_tag: str):
-        self.uuid: str = str(uuid4())
+        self._uuid: Optional[str] = None
         self.finish: Node = finish
         self.ftag: Optional[str] = finish_tag
         self.multiple_inputs = False
         self.source_map: list[Edge] = []
 
+    @property
+    def uuid(self) -> str:
+        # generated on first use (see Edge.uuid)
+        if self._uuid is None:
+            self._uuid = str(uuid4())
+        return self._uuid
+
     def add_source(self, operator: Selector, should_scatter: Optional[bool]=None) -> Edge:
         """
         Add a connection
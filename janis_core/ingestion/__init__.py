@@ -3,4 +3,5 @@
 # public ingest api
 
 from .main import ingest
+from .bulk import ingest_many
 from .SupportedIngestion import SupportedIngestion
@@ -0,0 +1,47 @@
+import sys
+import argparse
+
+from .SupportedIngestion import SupportedIngestion
+from .bulk import ingest_many
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m janis_core.ingestion', description='ingest many source documents')
+    parser.add_argument('paths', nargs='+', help='documents, or directories to search for documents')
+    parser.add_argument('--format', required=True, choices=SupportedIngestion.all(), help='source format')
+    parser.add_argument('--jobs', type=int, default=1, help='number of worker processes')
+    parser.add_argument('--translate', action='append', help='translate each document to this format (repeatable)')
+    parser.add_argument('--out', help='output directory for translations')
+    parser.add_argument('--messages', help='directory for per-document message logs')
+    parser.add_argument('--manifest', help='write the manifest json here')
+    parser.add_argument('--include-dependencies', action='store_true', help='also ingest documents which other documents depend on')
+    parser.add_argument('--cache', action='store_true', default=None, help='reuse ingest results of unchanged documents (see janis_core.ingestion.cache)')
+    parser.add_argument('--no-cache', action='store_false', dest='cache', help="don't read or write the ingest cache")
+    args = parser.parse_args()
+
+    manifest = ingest_many(
+        args.paths,
+        args.format,
+        jobs=args.jobs,
+        translate_to=args.translate,
+        export_dir=args.out,
+        messages_dir=args.messages,
+        skip_dependencies=not args.include_dependencies,
+        cache=args.cache,
+    )
+    for record in manifest.records:
+        print(f'{record.status:10} {record.seconds:8.3f}s  {record.path}')
+        if record.error:
+            print(f'           {record.error}')
+        for dest, error in record.translation_errors.items():
+            print(f'           [{dest}] {error}')
+    
+    counts = manifest.to_dict()['counts']
+    print(f"{counts['ingested']} ingested, {counts['failed']} failed, {counts['dependencies']} dependencies in {manifest.seconds:.1f}s")
+    if args.manifest:
+        manifest.write(args.manifest)
+    return 1 if manifest.failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,387 @@
+"""
+    Bulk ingestion - ingest (and optionally translate) many source documents
+
+    Directories are searched recursively for documents of the given format.
+    Documents are ingested in a process pool, each with its own message log,
+    and a manifest of timings & failures is returned:
+
+        manifest = ingest_many(['tools/', 'workflows/'], 'cwl', jobs=8, translate_to='nextflow', export_dir='out')
+        print(manifest.failures)
+        manifest.write('manifest.json')
+
+    Documents which another input document depends on (eg a CWL tool used as a step)
+    are ingested as part of that document rather than again on their own,
+    unless skip_dependencies=False.
+
+    From the command line:
+
+        python -m janis_core.ingestion tools/ workflows/ --format cwl --jobs 8 --translate nextflow --out out
+
+    --cache reuses the results of documents which are unchanged since a previous run,
+    and --no-cache ignores the cache even when settings.ingest.CACHE is set.
+"""
+import os
+import re
+import sys
+import json
+import time
+import pickle
+import importlib
+import multiprocessing
+from collections import deque
+from xml.etree import ElementTree
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Optional
+
+import yaml
+
+from janis_core import Tool
+from janis_core import settings
+from janis_core import messages
+from janis_core.messages import configure_logging
+from janis_core.messages.logfile import LogFile
+
+from .SupportedIngestion import SupportedIngestion
+from .main import ingest
+
+
+EXTENSIONS: dict[str, tuple[str, ...]] = {
+    'cwl': ('.cwl',),
+    'wdl': ('.wdl',),
+    'galaxy': ('.ga', '.xml'),      # .xml: only tool wrappers (see _is_document)
+}
+
+
+@dataclass
+class IngestRecord:
+    """
+    the outcome for one document.
+    status is 'ok', 'failed', or 'dependency' (ingested as part of 'included_in').
+    """
+    path: str
+    status: str = 'ok'
+    error: Optional[str] = None
+    seconds: float = 0.0
+    messages_path: Optional[str] = None
+    message_counts: dict[str, int] = field(default_factory=dict)
+    included_in: Optional[str] = None
+    translations: dict[str, str] = field(default_factory=dict)          # dest -> export path
+    translation_errors: dict[str, str] = field(default_factory=dict)    # dest -> error
+    tool: Optional[Tool] = None     # only kept when ingesting in-process (jobs=1)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'path': self.path,
+            'status': self.status,
+            'error': self.error,
+            'seconds': round(self.seconds, 4),
+            'messages_path': self.messages_path,
+            'message_counts': self.message_counts,
+            'included_in': self.included_in,
+            'translations': self.translations,
+            'translation_errors': self.translation_errors,
+        }
+
+
+@dataclass
+class IngestManifest:
+    format: str
+    jobs: int
+    seconds: float = 0.0
+    records: list[IngestRecord] = field(default_factory=list)
+
+    @property
+    def ingested(self) -> list[IngestRecord]:
+        return [r for r in self.records if r.status == 'ok']
+
+    @property
+    def failures(self) -> list[IngestRecord]:
+        return [r for r in self.records if r.status == 'failed' or r.translation_errors]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'format': self.format,
+            'jobs': self.jobs,
+            'seconds': round(self.seconds, 4),
+            'counts': {
+                'documents': len(self.records),
+                'ingested': len(self.ingested),
+                'failed': len([r for r in self.records if r.status == 'failed']),
+                'dependencies': len([r for r in self.records if r.status == 'dependency']),
+            },
+            'records': [r.to_dict() for r in self.records],
+        }
+
+    def write(self, path: str) -> None:
+        with open(path, 'w') as fp:
+            json.dump(self.to_dict(), fp, indent=2)
+
+
+@dataclass
+class _IngestTask:
+    path: str
+    format: str
+    messages_path: str
+    translate_to: list[str]
+    export_path: Optional[str]      # '{dest}' is replaced by each translation dest
+    keep_tool: bool
+    cache: bool
+
+
+def ingest_many(
+    paths: Iterable[str],
+    format: str,
+    jobs: int = 1,
+    translate_to: Optional[str | list[str]] = None,
+    export_dir: Optional[str] = None,
+    messages_dir: Optional[str] = None,
+    skip_dependencies: bool = True,
+    cache: Optional[bool] = None,
+    ) -> IngestManifest:
+    """
+    ingests each document in 'paths' (files, or directories searched for 'format' documents).
+
+    jobs:               number of worker processes. with jobs=1 documents are ingested
+                        in this process, and each record keeps its ingested tool.
+    translate_to:       translate each ingested document to these dest formats.
+                        output is written to 'export_dir/<document>/<dest>'.
+    messages_dir:       where per-document message logs are written
+                        (default: '.janis/messages' in the working directory).
+    skip_dependencies:  don't separately ingest documents another input document depends on.
+    cache:              reuse ingest results of unchanged documents (default settings.ingest.CACHE).
+                        see janis_core.ingestion.cache.
+    """
+    assert(format in SupportedIngestion.all())  # validate format
+    dests = [translate_to] if isinstance(translate_to, str) else list(translate_to or [])
+    if dests and not export_dir:
+        raise ValueError('export_dir is required when translating')
+    messages_dir = messages_dir or os.path.join(os.path.dirname(messages.main.MESSAGE_LOG_PATH), 'messages')
+    cache = settings.ingest.CACHE if cache is None else cache
+    os.makedirs(messages_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    documents = collect_documents(paths, format)
+    included_in = find_included_documents(documents, format) if skip_dependencies else {}
+    root = os.path.commonpath([os.path.dirname(d) for d in documents]) if documents else ''
+
+    # tasks for each document not ingested as part of another
+    records: dict[str, IngestRecord] = {}
+    tasks: list[_IngestTask] = []
+    for doc in documents:
+        if doc in included_in:
+            records[doc] = IngestRecord(doc, status='dependency', included_in=included_in[doc])
+            continue
+        name = os.path.splitext(os.path.relpath(doc, root))[0]
+        tasks.append(_IngestTask(
+            path=doc,
+            format=format,
+            messages_path=os.path.join(messages_dir, f'{name.replace(os.sep, "__")}.log'),
+            translate_to=dests,
+            export_path=os.path.join(export_dir, name, '{dest}') if export_dir else None,
+            keep_tool=jobs <= 1,
+            cache=cache,
+        ))
+
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            records[task.path] = _ingest_document(task)
+    else:
+        # spawned rather than forked: a fork could copy a lock held by the logger's writer thread
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(_settings_snapshot(),),
+        ) as pool:
+            for record in pool.map(_ingest_document, tasks):
+                records[record.path] = record
+
+    manifest = IngestManifest(format=format, jobs=jobs)
+    manifest.records = [records[doc] for doc in documents]
+    manifest.seconds = time.perf_counter() - start
+    return manifest
+
+
+### DOCUMENTS ###
+
+def collect_documents(paths: Iterable[str], format: str) -> list[str]:
+    """
+    absolute paths of each document in 'paths', in order & without duplicates.
+    directories are searched (recursively, skipping hidden directories) by file extension.
+    """
+    out: dict[str, None] = {}
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+                for filename in sorted(filenames):
+                    filepath = os.path.join(dirpath, filename)
+                    if filename.endswith(EXTENSIONS[format]) and _is_document(filepath, format):
+                        out.setdefault(os.path.realpath(filepath))
+        else:
+            out.setdefault(os.path.realpath(path))
+    return list(out)
+
+def _is_document(path: str, format: str) -> bool:
+    # galaxy tool wrappers share the .xml extension with macro files, tool_data_table_conf etc
+    if format == 'galaxy' and path.endswith('.xml'):
+        try:
+            for _, elem in ElementTree.iterparse(path, events=('start',)):
+                return elem.tag == 'tool'
+        except (OSError, ElementTree.ParseError):
+            pass
+        return False
+    return True
+
+def find_included_documents(documents: list[str], format: str) -> dict[str, str]:
+    """
+    maps each document which is ingested as a dependency of another to the
+    top-level document it will be ingested with.
+    """
+    docset = set(documents)
+    dependencies = {doc: [d for d in find_dependencies(doc, format) if d in docset and d != doc] for doc in documents}
+    dependents = {d for deps in dependencies.values() for d in deps}
+
+    # walk from top-level documents. documents only reachable through a cycle become top-level.
+    included_in: dict[str, str] = {}
+    for top in [d for d in documents if d not in dependents] + documents:
+        if top in included_in:
+            continue
+        queue = deque(dependencies[top])
+        while queue:
+            dep = queue.popleft()
+            if dep == top or dep in included_in:
+                continue
+            included_in[dep] = top
+            queue.extend(dependencies[dep])
+    return included_in
+
+def find_dependencies(path: str, format: str) -> set[str]:
+    """local documents which 'path' imports, as absolute paths"""
+    try:
+        if format == 'cwl':
+            return _cwl_dependencies(path)
+        elif format == 'wdl':
+            return _wdl_dependencies(path)
+        elif format == 'galaxy' and path.endswith('.xml'):
+            return _galaxy_tool_dependencies(path)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
+        pass
+    # galaxy workflows embed their subworkflows
+    return set()
+
+# the libyaml loader is much faster where pyyaml was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def _cwl_dependencies(path: str) -> set[str]:
+    with open(path, 'r') as fp:
+        doc = yaml.load(fp, Loader=YAML_LOADER)
+    out: set[str] = set()
+    stack: list[Any] = [doc]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            run = item.get('run')
+            if isinstance(run, str) and not run.startswith('#') and '://' not in run.replace('file://', ''):
+                run = run.replace('file://', '').split('#', 1)[0]
+                out.add(os.path.realpath(os.path.join(os.path.dirname(path), run)))
+            for directive in ('$import', '$include'):
+                ref = item.get(directive)
+                if isinstance(ref, str) and '://' not in ref.replace('file://', ''):
+                    out.add(os.path.realpath(os.path.join(os.path.dirname(path), ref.replace('file://', ''))))
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return out
+
+WDL_IMPORT_PATTERN = re.compile(r'^\s*import\s+["\']([^"\']+)["\']', re.MULTILINE)
+
+def _wdl_dependencies(path: str) -> set[str]:
+    with open(path, 'r') as fp:
+        text = fp.read()
+    out: set[str] = set()
+    for uri in WDL_IMPORT_PATTERN.findall(text):
+        if '://' not in uri:
+            out.add(os.path.realpath(os.path.join(os.path.dirname(path), uri)))
+    return out
+
+GALAXY_MACRO_PATTERN = re.compile(r'<import>\s*([^<\s]+)\s*</import>')
+
+def _galaxy_tool_dependencies(path: str) -> set[str]:
+    # macro files imported by a local tool xml
+    with open(path, 'r') as fp:
+        text = fp.read()
+    return {os.path.realpath(os.path.join(os.path.dirname(path), m)) for m in GALAXY_MACRO_PATTERN.findall(text)}
+
+
+### INGESTING ###
+
+def _settings_snapshot() -> dict[str, dict[str, Any]]:
+    # spawned workers import settings afresh, so are given the values set in this process
+    snapshot: dict[str, dict[str, Any]] = {}
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == 'janis_core.settings' or name.startswith('janis_core.settings.')):
+            continue
+        values = {k: v for k, v in vars(module).items() if k.isupper() and not k.startswith('_')}
+        snapshot[name] = {k: v for k, v in values.items() if _picklable(v)}
+    return snapshot
+
+def _picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return False
+    return True
+
+def _init_worker(snapshot: dict[str, dict[str, Any]]) -> None:
+    for name, values in snapshot.items():
+        module = importlib.import_module(name)
+        for key, value in values.items():
+            setattr(module, key, value)
+
+def _ingest_document(task: _IngestTask) -> IngestRecord:
+    # runs in a worker process (or in-process when jobs=1)
+    record = IngestRecord(task.path, messages_path=task.messages_path)
+    default_log_path = messages.main.MESSAGE_LOG_PATH
+    start = time.perf_counter()
+    try:
+        configure_logging(task.messages_path)
+        tool = ingest(task.path, task.format, cache=task.cache)
+    except Exception as e:
+        record.status = 'failed'
+        record.error = f'{type(e).__name__}: {e}'
+    else:
+        for dest in task.translate_to:
+            _translate_document(record, tool, dest, task.export_path)
+        if task.keep_tool:
+            record.tool = tool
+    finally:
+        record.seconds = time.perf_counter() - start
+        record.message_counts = _count_messages(task.messages_path)
+        messages.main.MESSAGE_LOG_PATH = default_log_path
+    return record
+
+def _translate_document(record: IngestRecord, tool: Tool, dest: str, export_path: Optional[str]) -> None:
+    from janis_core.translations import translate
+    assert(export_path)
+    export_path = export_path.replace('{dest}', dest)
+    if dest == 'nextflow':
+        # module-level registers which would otherwise carry over from the previous document
+        from janis_core.translations import nextflow
+        nextflow.task_inputs.clear()
+        nextflow.params.clear()
+    try:
+        translate(tool, dest, export_path=export_path, to_console=False)
+        record.translations[dest] = export_path
+    except Exception as e:
+        record.translation_errors[dest] = f'{type(e).__name__}: {e}'
+
+def _count_messages(path: str) -> dict[str, int]:
+    if not os.path.exists(path):
+        return {}
+    counts: dict[str, int] = {}
+    for loglines in LogFile(path).messages.values():
+        for line in loglines:
+            counts[line.level] = counts.get(line.level, 0) + 1
+    return counts
@@ -0,0 +1,237 @@
+"""
+    Ingest cache - reuse ingest() results for unchanged source documents
+
+    Opt-in with settings.ingest.CACHE = True, or ingest(..., cache=True).
+    Entries are keyed by a digest of the source document, the local documents it
+    imports (cwl run: / $import / $include, wdl imports, galaxy tool macros - transitively),
+    the janis_core version and the ingest settings. Each entry is the pickled Janis model,
+    along with the messages logged while ingesting it, which are replayed on a hit.
+
+    Entries unused for settings.ingest.CACHE_MAX_AGE_DAYS are evicted, then the least recently
+    used entries until the cache is under settings.ingest.CACHE_MAX_SIZE_MB.
+
+    Galaxy toolshed ids aren't cached (there is no local document to digest).
+    Galaxy workflows pin their tool wrapper revisions, so only the .ga file is digested.
+    Results aren't cached if a container lookup couldn't reach its registry, as the
+    affected tools fall back to a default container. (failed wrapper downloads raise.)
+"""
+import os
+import time
+import pickle
+import hashlib
+import tempfile
+from types import ModuleType
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from janis_core import Tool
+from janis_core import settings
+from janis_core import messages
+from janis_core.__meta__ import __version__
+
+from .bulk import find_dependencies
+
+
+ENTRY_SUFFIX = '.pickle'
+
+
+@dataclass
+class CacheEntry:
+    tool: Tool
+    messages: str = ''                                          # message log written while ingesting
+    source_files: Optional[list[Tuple[str, str]]] = None        # settings.translate.general.SOURCE_FILES (galaxy)
+
+
+def cached_ingest(path: str, format: str, ingest_func: Callable[[str], Tool]) -> Tool:
+    """ingest_func(path), or the cached result if 'path' and its dependencies are unchanged"""
+    key = cache_key(path, format)
+    if key is None:
+        return ingest_func(path)
+
+    cache = IngestCache()
+    entry = cache.get(key)
+    if entry is not None and _restore(entry):
+        return entry.tool
+
+    failed_lookups = _failed_lookups(format)
+    tool = ingest_func(path)
+    if _failed_lookups(format) == failed_lookups:
+        cache.add(key, _capture(tool, format))
+        cache.evict()
+    return tool
+
+def _failed_lookups(format: str) -> int:
+    # galaxy container lookups which couldn't reach a registry, so far in this process
+    if format != 'galaxy':
+        return 0
+    from janis_core.ingestion.galaxy.containers.fetch import unreachable_lookups
+    return unreachable_lookups()
+
+def _capture(tool: Tool, format: str) -> CacheEntry:
+    log_path = messages.main.MESSAGE_LOG_PATH
+    log = ''
+    if os.path.exists(log_path):
+        with open(log_path, 'r') as fp:
+            log = fp.read()
+    source_files = settings.translate.general.SOURCE_FILES if format == 'galaxy' else None
+    return CacheEntry(tool, log, list(source_files) if source_files else None)
+
+def _restore(entry: CacheEntry) -> bool:
+    # galaxy wrapper files are copied to the translation output, so must still exist
+    if entry.source_files and not all(os.path.exists(src) for src, _ in entry.source_files):
+        return False
+    if entry.source_files is not None:
+        settings.translate.general.SOURCE_FILES = list(entry.source_files)
+    if entry.messages:
+        with open(messages.main.MESSAGE_LOG_PATH, 'a') as fp:
+            fp.write(entry.messages)
+    return True
+
+
+### KEYS ###
+
+def cache_key(path: str, format: str) -> Optional[str]:
+    """digest of the source documents, janis_core version & ingest settings. None if 'path' isn't a local file"""
+    if not os.path.isfile(path):
+        return None
+    hasher = hashlib.sha256()
+    hasher.update(f'{__version__}\n{format}\n{_settings_fingerprint()}\n'.encode())
+    for doc in source_documents(path, format):
+        hasher.update(f'{doc}\n'.encode())
+        try:
+            with open(doc, 'rb') as fp:
+                hasher.update(hashlib.sha256(fp.read()).digest())
+        except OSError:
+            hasher.update(b'missing')
+    return hasher.hexdigest()
+
+def source_documents(path: str, format: str) -> list[str]:
+    """'path' and the local documents it transitively imports, as absolute paths"""
+    root = os.path.realpath(path)
+    found: set[str] = {root}
+    stack = [root]
+    while stack:
+        for dep in find_dependencies(stack.pop(), format):
+            if dep not in found:
+                found.add(dep)
+                stack.append(dep)
+    return [root] + sorted(found - {root})
+
+def _settings_fingerprint() -> str:
+    modules: list[ModuleType] = [
+        settings.ingest,
+        settings.ingest.cwl,
+        settings.ingest.galaxy,
+        settings.datatypes,
+        settings.graph,
+        settings.validation,
+    ]
+    # individual settings from modules which otherwise don't affect ingest
+    single_settings: list[tuple[ModuleType, str]] = [
+        (settings.translate, 'MODE'),
+        (settings.testing, 'TESTING_USE_DEFAULT_CONTAINER'),
+    ]
+    lines: list[str] = []
+    for module in modules:
+        for name, value in sorted(vars(module).items()):
+            if not name.isupper() or name.startswith('CACHE') or name.startswith('_'):
+                continue
+            if isinstance(value, (str, int, float, bool, tuple, list, type(None))):
+                lines.append(f'{module.__name__}.{name}={value!r}')
+    for module, name in single_settings:
+        lines.append(f'{module.__name__}.{name}={getattr(module, name)!r}')
+    return '\n'.join(lines)
+
+
+### STORAGE ###
+
+class IngestCache:
+    """
+    one pickle file per entry in 'directory' (default settings.ingest.CACHE_DIR).
+    an entry's modification time is when it was last used.
+    """
+
+    def __init__(self, directory: Optional[str]=None) -> None:
+        self.directory = directory or settings.ingest.CACHE_DIR
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as fp:
+                entry = pickle.load(fp)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # unreadable, or written by incompatible code
+            self._remove(path)
+            return None
+        if not isinstance(entry, CacheEntry):
+            self._remove(path)
+            return None
+        os.utime(path)
+        return entry
+
+    def add(self, key: str, entry: CacheEntry) -> bool:
+        """stores 'entry'. returns False if it can't be pickled"""
+        os.makedirs(self.directory, exist_ok=True)
+        # written to a temp file then renamed, so a partial entry is never read
+        fd, tmp = tempfile.mkstemp(prefix='.tmp.', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                pickle.dump(entry, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            self._remove(tmp)
+            return False
+        except BaseException:
+            self._remove(tmp)
+            raise
+        return True
+
+    def evict(self, max_size_mb: Optional[float]=None, max_age_days: Optional[float]=None) -> list[str]:
+        """removes stale entries, then least recently used entries while over size. returns the removed keys"""
+        max_size_mb = max_size_mb if max_size_mb is not None else settings.ingest.CACHE_MAX_SIZE_MB
+        max_age_days = max_age_days if max_age_days is not None else settings.ingest.CACHE_MAX_AGE_DAYS
+        max_bytes = max_size_mb * 1024 * 1024
+        oldest = time.time() - max_age_days * 24 * 60 * 60
+
+        removed: list[str] = []
+        entries = sorted(self._entries(), key=lambda x: x[1])   # least recently used first
+        total = sum(size for _, _, size in entries)
+        for key, mtime, size in entries:
+            if mtime >= oldest and total <= max_bytes:
+                break
+            self._remove(self._path(key))
+            removed.append(key)
+            total -= size
+        return removed
+
+    def clear(self) -> None:
+        for key, _, _ in self._entries():
+            self._remove(self._path(key))
+
+    def keys(self) -> list[str]:
+        return [key for key, _, _ in self._entries()]
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        # (key, last used, size)
+        out: list[tuple[str, float, int]] = []
+        if not os.path.isdir(self.directory):
+            return out
+        for filename in os.listdir(self.directory):
+            if filename.endswith(ENTRY_SUFFIX) and not filename.startswith('.'):
+                try:
+                    stat = os.stat(os.path.join(self.directory, filename))
+                except OSError:
+                    continue
+                out.append((filename[:-len(ENTRY_SUFFIX)], stat.st_mtime, stat.st_size))
+        return out
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}{ENTRY_SUFFIX}')
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
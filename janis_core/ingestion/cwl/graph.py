@@ -63,6 +63,7 @@ def add_step_edges_to_graph(jstep: StepNode, wf: Workflow) -> None:
     connections = jstep.tool.connections
     tinputs = jstep.tool.inputs_map()
     jstep.sources = {}
+    wf.invalidate_graph_index()
     
     added_edges = []
     for (k, v) in connections.items():
@@ -3,7 +3,6 @@
 from typing import Any, Optional, Tuple
 import regex as re
 from copy import deepcopy
-import sys
 import inspect
 
 from janis_core import JanisShed
@@ -244,7 +243,8 @@ class CWLTypeParser:
 
     def get_data_type_from_secondaries(self) -> DataType:
         # TODO needs work here - add galaxy secondary types
-        sec_types = inspect.getmembers(sys.modules['janis_core.redefinitions.types'], inspect.isclass)
+        from janis_core.redefinitions import types as redefinition_types
+        sec_types = inspect.getmembers(redefinition_types, inspect.isclass)
         sec_types = [x[1] for x in sec_types if issubclass(x[1], DataType)]
         sec_types = [x for x in sec_types if x.secondary_files()]
         sec_types_map = {}
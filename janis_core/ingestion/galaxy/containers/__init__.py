@@ -2,4 +2,5 @@
 
 
 from .main import resolve_dependencies_as_container
+from .prefetch import prefetch_containers
 from .Container import Container
\ No newline at end of file
@@ -37,6 +37,10 @@ class ContainerCache:
             return Container(cache[versioned_tool_id])
         return None
 
+    def get_all(self) -> set[str]:
+        """returns the versioned tool ids which have a cached container"""
+        return set(self._load().keys())
+
     def add(self, versioned_tool_id:str, container: Container):
         cache = self._load()
         cache[versioned_tool_id] = container.__dict__
@@ -1,11 +1,13 @@
 
 
+import threading
 from typing import Optional
 
 from janis_core.ingestion.galaxy.gxtool.model import XMLRequirement, XMLCondaRequirement, XMLContainerRequirement
 
 from .Container import Container
 
+from .fetching import utils as fetch_utils
 from .fetching.Fetcher import Fetcher
 from .fetching.ContainerReqFetcher import ContainerReqFetcher
 from .fetching.QuayIOFetcher import QuayIOFetcher
@@ -22,12 +24,51 @@ DEFAULT_CONTAINER = Container({
 # def _fetch_presets(requirement: XMLRequirement) -> list[Container]:
 #     return get_images_preset(requirement)
 
+# results of fetch_online() for this process, including misses (None). 
+# lookups which failed because a registry couldn't be reached are not kept.
+# populated ahead of time for whole workflows by prefetch_containers().
+_fetched: dict[tuple[str, str, str], Optional[Container]] = {}
+_fetched_lock = threading.Lock()
+
+# lookups in this process which failed because a registry couldn't be reached. 
+# tools resolved during those lookups fall back to DEFAULT_CONTAINER. 
+_unreachable_count = 0
+
+def requirement_key(requirement: XMLRequirement) -> tuple[str, str, str]:
+    return (requirement.subtype, requirement.name, requirement.version)  # type: ignore
+
 def fetch_online(requirement: XMLRequirement) -> Optional[Container]:
+    global _unreachable_count
+    key = requirement_key(requirement)
+    with _fetched_lock:
+        if key in _fetched:
+            return _fetched[key]
+    
+    fetch_utils.reset_unreachable()
+    container = _fetch_online(requirement)
+    if container is None and fetch_utils.was_unreachable():
+        with _fetched_lock:
+            _unreachable_count += 1
+        return None
+    with _fetched_lock:
+        _fetched[key] = container
+    return container
+
+def unreachable_lookups() -> int:
+    """number of fetch_online() lookups in this process which couldn't reach a registry"""
+    return _unreachable_count
+
+def clear_fetched() -> None:
+    with _fetched_lock:
+        _fetched.clear()
+
+def _fetch_online(requirement: XMLRequirement) -> Optional[Container]:
     strategy = _select_strategy(requirement)
     containers = strategy.fetch(requirement)
     if containers:
         container = select_best_container_match(containers, requirement)
         return container
+    return None
     
 def _select_strategy(requirement: XMLRequirement) -> Fetcher:
     match requirement:
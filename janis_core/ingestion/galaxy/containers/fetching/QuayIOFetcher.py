@@ -8,6 +8,7 @@ from ..Container import Container
 from ..fetching.Fetcher import Fetcher
 from . import utils
 
+QUAY_API_URL = 'https://quay.io/api/v1/repository/biocontainers'
 
 class QuayIOFetcher(Fetcher):
 
@@ -39,7 +40,7 @@ class QuayIOFetcher(Fetcher):
 class QuayInteractor:
 
     def request_tool_data(self, name: str) -> dict[str, Any]:
-        endpoint = f'https://quay.io/api/v1/repository/biocontainers/{name}'
+        endpoint = f'{QUAY_API_URL}/{name}'
         return utils.make_api_request(endpoint)
 
 
@@ -2,34 +2,84 @@
 
 
 import json
+import time
+import threading
 import requests
 from typing import Any, Optional
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 
+REQUEST_TIMEOUT = 5
+MAX_ATTEMPTS = 5
+BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+POOL_SIZE = 16
 
+# one pooled session is shared by all fetchers (and all prefetch worker threads)
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# urls which are known not to exist (404 etc). these are never requested twice.
+# urls which couldn't be reached (timeouts, connection errors, transient server errors) are not misses.
+_misses: set[str] = set()
+
+# per thread: whether a request couldn't be reached since reset_unreachable()
+_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+        return _session
+
+def clear_misses() -> None:
+    _misses.clear()
+
+def reset_unreachable() -> None:
+    _local.unreachable = False
+
+def was_unreachable() -> bool:
+    return getattr(_local, 'unreachable', False)
 
 def make_api_request(request_url: str) -> Any:
     response = make_request(request_url)
-    return handle_response(response)
+    return handle_response(request_url, response)
 
 def make_request(request_url: str) -> Optional[Response]:
-    # make requests to get information about tools with similar name
-    iterations = 1
+    # make requests to get information about tools with similar name.
+    # retries timeouts, connection errors & transient server errors with exponential backoff.
+    if request_url in _misses:
+        return None
+    
+    session = get_session()
     response: Optional[Response] = None
-    while response is None:
-        if iterations > 5:
-            break
+    for attempt in range(MAX_ATTEMPTS):
+        if attempt > 0:
+            time.sleep(BACKOFF_FACTOR * (2 ** (attempt - 1)))
         try:
-            response = requests.get(request_url, timeout=5)
-        except requests.exceptions.Timeout:
+            response = session.get(request_url, timeout=REQUEST_TIMEOUT)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
             response = None
-        iterations += 1
+            continue
+        if response.status_code not in RETRY_STATUS_CODES:
+            break
     return response
 
-def handle_response(response: Optional[Response]) -> Any:
-    if response is None or response.status_code != 200:
+def handle_response(request_url: str, response: Optional[Response]) -> Any:
+    if response is None or response.status_code in RETRY_STATUS_CODES:
+        # unreachable after all retries. may succeed later, so not a miss.
+        _local.unreachable = True
+        return None
+    elif response.status_code != 200:
         # logging.no_ga4gh_data()
+        # a definite miss (eg 404)
+        _misses.add(request_url)
         return None
     else:
-        return json.loads(response.text)
\ No newline at end of file
+        return json.loads(response.text)
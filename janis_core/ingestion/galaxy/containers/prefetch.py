@@ -0,0 +1,48 @@
+
+from concurrent.futures import ThreadPoolExecutor
+
+from janis_core import settings
+from janis_core.ingestion.galaxy.gxtool.model import XMLRequirement
+from janis_core.ingestion.galaxy.gxtool.model import XMLTool
+
+from .fetch import fetch_online
+from .fetch import requirement_key
+from .cache import init_cache
+
+
+def prefetch_containers(xmltools: list[XMLTool]) -> None:
+    """
+    Resolves the requirements of many tools concurrently, ahead of resolve_dependencies_as_container().
+    Requirements are de-duplicated across tools, and tools which already have a cached container are skipped. 
+    Results (including misses) are held by fetch_online(), so later per-tool resolution does not make requests. 
+    """
+    if settings.testing.TESTING_USE_DEFAULT_CONTAINER:
+        return 
+    
+    requirements = _gather_requirements(xmltools)
+    if not requirements:
+        return
+    
+    workers = min(settings.ingest.galaxy.CONTAINER_FETCH_WORKERS, len(requirements))
+    if workers <= 1:
+        for req in requirements:
+            fetch_online(req)
+        return
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() to propagate any exceptions raised in workers
+        list(executor.map(fetch_online, requirements))
+
+def _gather_requirements(xmltools: list[XMLTool]) -> list[XMLRequirement]:
+    cache = init_cache()
+    cached = cache.get_all()
+    
+    out: dict[tuple[str, str, str], XMLRequirement] = {}
+    for xmltool in xmltools:
+        if xmltool.metadata.versioned_id in cached:
+            continue
+        for req in xmltool.metadata.requirements:
+            key = requirement_key(req)
+            if key not in out:
+                out[key] = req
+    return list(out.values())
@@ -1,6 +1,7 @@
 
 
 from .main import get
+from .main import get_class
 from .main import populate
 from .JanisDatatype import JanisDatatype
 
@@ -1,6 +1,8 @@
 
 
-from typing import Optional, Any
+from typing import Optional, Any, Type
+
+from janis_core.types import DataType
 
 from .JanisDatatype import JanisDatatype
 from .strategies import strategy_map
@@ -19,6 +21,9 @@ def get(entity: Any, entity_type: Optional[str]=None, source: str='galaxy') -> J
     # core_types = janis_to_core(jtypes)
     # return select_primary_core_type(core_types)
 
+def get_class(jtype: JanisDatatype) -> Type[DataType]:
+    return register.get_class(jtype)
+
 def populate() -> None:
     register.populate()
 
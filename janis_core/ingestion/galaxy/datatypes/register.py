@@ -2,7 +2,9 @@
 
 
 import yaml
-from typing import Optional
+import importlib
+from typing import Optional, Type
+from janis_core.types import DataType
 from janis_core.settings.ingest.galaxy import DATATYPES_YAML
 
 from .JanisDatatype import JanisDatatype
@@ -22,6 +24,14 @@ class DatatypeRegister:
         if format in self.format_map:
             return self.format_map[format]
 
+    def get_class(self, janistype: JanisDatatype) -> Type[DataType]:
+        """
+        the janis DataType class for a datatype, via its 'import_path' & 'classname'.
+        galaxy datatype classes are generated on first lookup (see .galaxy).
+        """
+        module = importlib.import_module(janistype.import_path)
+        return getattr(module, janistype.classname)
+
     def populate(self) -> None:
         """
         func loads the combined datatype yaml then converts it to dict with format as keys
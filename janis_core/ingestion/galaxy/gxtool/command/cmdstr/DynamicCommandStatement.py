@@ -1,8 +1,8 @@
 
 
-from copy import deepcopy
 from typing import Iterable
 
+from janis_core import settings
 from ..tokens import Token
 from ..epath.ExecutionPath import ExecutionPath
 from .RealisedTokenValues import RealisedTokens
@@ -30,7 +30,7 @@ class DynamicCommandStatement:
     def __init__(self, cmdline: str, realised_tokens: list[RealisedTokens]):
         self.cmdline = cmdline
         self.realised_tokens = realised_tokens
-        self.max_paths = 10
+        self.max_paths = settings.ingest.galaxy.MAX_EXECUTION_PATHS
 
     def get_tokens(self) -> list[Token]:
         return [rt.get_original_token() for rt in self.realised_tokens]
@@ -52,22 +52,28 @@ class DynamicCommandStatement:
         each of these ExecutionPaths are fed into the program later when attempting
         to understand the tool Command()
 
+        the ith ExecutionPath uses the ith realised value of each position which has
+        one, and the default token elsewhere. at most self.max_paths of these are
+        created (settings.ingest.galaxy.MAX_EXECUTION_PATHS).
+        
+        tokens are not copied: each ExecutionPath holds its own positions, but the 
+        tokens are shared between ExecutionPaths (and with self.realised_tokens).
+        annotation only sets position.component, so the tokens are never modified.
+
         """ 
-        # get all tokens as defaults
-        epaths: list[ExecutionPath] = []
         default_tokens = [rtvs.get_default_token() for rtvs in self.realised_tokens]
         max_divergence = max([len(rtv.tlists) for rtv in self.realised_tokens])
         num_epaths = min(max_divergence, self.max_paths)
         
-        for i in range(1, num_epaths + 1):
+        epaths: list[ExecutionPath] = []
+        for i in range(num_epaths):
             this_epath_tokens: list[Token] = []
-            for j in range(len(self.realised_tokens)):
-                if len(self.realised_tokens[j].tlists) >= i:
-                    this_epath_tokens += self.realised_tokens[j].tlists[i - 1]
+            for j, rtvs in enumerate(self.realised_tokens):
+                if len(rtvs.tlists) > i:
+                    this_epath_tokens += rtvs.tlists[i]
                 else:
-                    this_epath_tokens.append(deepcopy(default_tokens[j]))
-            epath = ExecutionPath(this_epath_tokens)
-            epaths.append(epath)
+                    this_epath_tokens.append(default_tokens[j])
+            epaths.append(ExecutionPath(this_epath_tokens))
 
         # yield the default tokens as final ExecutionPath
         epaths.append(ExecutionPath(default_tokens))
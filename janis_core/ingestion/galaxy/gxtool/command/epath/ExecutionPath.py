@@ -42,11 +42,15 @@ class ExecutionPath:
         gets the CommandComponents in this EPath (unique)
         preserves ordering
         """
-        ignore = [Tee, StreamMerge]
+        ignore = (Tee, StreamMerge)
+        seen: set[int] = set()
         out: list[CommandComponent] = []
         for position in self.positions:
-            if position.component and type(position.component) not in ignore and position.component not in out:
-                out.append(position.component)
+            component = position.component
+            # a component spans many positions (eg an option and its value)
+            if component and type(component) not in ignore and id(component) not in seen:
+                seen.add(id(component))
+                out.append(component)
         return out
 
     def __str__(self) -> str:
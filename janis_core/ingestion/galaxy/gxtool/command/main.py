@@ -3,7 +3,7 @@
 from typing import Optional, Any
 
 from janis_core.ingestion.galaxy.gxtool.model import XMLTool
-from janis_core.ingestion.galaxy.gxworkflow.tool_state.load import load_tool_state
+from janis_core.ingestion.galaxy.gxworkflow.context import get_step_context
 
 from .loading import load_vanilla_command_str
 from .loading import load_templated_command_str
@@ -73,8 +73,7 @@ class CommandFactory:
 
         # templated tool state  
         if self.gxstep:
-            inputs_dict = load_tool_state(
-                self.gxstep, 
+            inputs_dict = get_step_context(self.gxstep).tool_state(
                 additional_filters=[
                     'ReplaceNullWithVarname',
                     'ReplaceBoolWithValue',
@@ -82,12 +81,12 @@ class CommandFactory:
                     'ReplaceRuntimeWithVarname',
                 ]
             )
-            text = load_templated_command_str(inputs_dict)
+            text = load_templated_command_str(self.xmltool, inputs_dict)
             cmdstr = gen_command_string(source=CommandStringSource.TOOL_STATE, text=text, xmltool=self.xmltool)
             cmdstrs.append(cmdstr)
 
         # vanilla xml
-        text = load_vanilla_command_str()
+        text = load_vanilla_command_str(self.xmltool)
         cmdstr = gen_command_string(source=CommandStringSource.XML, text=text, xmltool=self.xmltool)
         cmdstrs.append(cmdstr)
         
@@ -1,3 +1,6 @@
 
 
-from .tool_state.load import load_tool_state
\ No newline at end of file
+from .tool_state.load import load_tool_state
+from .context import StepIngestContext
+from .context import get_step_context
+from .context import clear_step_contexts
@@ -0,0 +1,59 @@
+
+
+from typing import Any, Optional
+
+from janis_core.ingestion.galaxy import runtime
+from janis_core.ingestion.galaxy.gxtool.parsing.main import load_xmltool
+from janis_core.ingestion.galaxy.gxtool.model import XMLTool
+from .tool_state.load import filter_tool_state
+
+
+class StepIngestContext:
+    """
+    Holds the per-step state which is needed by many ingest passes. 
+    The tool XML is parsed once, and each filtered view of the step 'tool_state' 
+    is decoded & filtered once (memoised by the set of filters applied). 
+    
+    Tool state views are shared between callers, so should be treated as read-only. 
+    """
+
+    def __init__(self, tool_path: str, gxstep: Optional[dict[str, Any]]=None):
+        self.tool_path = tool_path
+        self.gxstep = gxstep
+        self._xmltool: Optional[XMLTool] = None
+        self._tool_states: dict[frozenset[str], dict[str, Any]] = {}
+
+    @property
+    def xmltool(self) -> XMLTool:
+        if self._xmltool is None:
+            self._xmltool = load_xmltool(self.tool_path)
+        return self._xmltool
+
+    def tool_state(self, additional_filters: list[str]=[]) -> dict[str, Any]:
+        assert(self.gxstep is not None)
+        key = frozenset(additional_filters)
+        if key not in self._tool_states:
+            self._tool_states[key] = filter_tool_state(self.gxstep, additional_filters, self.xmltool)
+        return self._tool_states[key]
+
+
+# contexts for the workflow currently being ingested. 
+# keyed by (tool path, id(gxstep)) - the gxstep object itself is also checked on lookup.
+_contexts: dict[tuple[str, Optional[int]], StepIngestContext] = {}
+
+def clear_step_contexts() -> None:
+    _contexts.clear()
+
+def get_step_context(gxstep: Optional[dict[str, Any]]=None, tool_path: Optional[str]=None) -> StepIngestContext:
+    """
+    returns the StepIngestContext for a galaxy step, creating it if needed.
+    'tool_path' defaults to the active runtime tool (for standalone tool ingestion).
+    """
+    if tool_path is None:
+        tool_path = runtime.tool.tool_path
+    key = (tool_path, id(gxstep) if gxstep is not None else None)
+    context = _contexts.get(key)
+    if context is None or context.gxstep is not gxstep:
+        context = StepIngestContext(tool_path, gxstep)
+        _contexts[key] = context
+    return context
@@ -2,9 +2,8 @@
 
 from typing import Any
 from janis_core.ingestion.galaxy.internal_model.workflow import StepMetadata
+from janis_core.ingestion.galaxy import gxwrappers
 from janis_core.ingestion.galaxy.gxwrappers import Wrapper
-from janis_core.ingestion.galaxy.gxwrappers import WrapperCache
-from janis_core.ingestion.galaxy.gxwrappers import request_single_wrapper
 
 
 """
@@ -63,41 +62,11 @@ def get_wrapper_builtin(gxstep: dict[str, Any]) -> Wrapper:
     return wrapper
 
 def get_wrapper_toolshed(gxstep: dict[str, Any]) -> Wrapper:
-    wrappers = get_local(gxstep)
-    if not wrappers:
-        wrappers = get_toolshed(gxstep)
-    return most_recent(wrappers)
-        
-def get_local(gxstep: dict[str, Any]) -> list[Wrapper]:
-    cache = WrapperCache()
-    return cache.get(
-        owner=gxstep['tool_shed_repository']['owner'],
-        repo=gxstep['tool_shed_repository']['name'],
-        tool_id=gxstep['tool_id'].rsplit('/', 2)[-2],
-        tool_build=gxstep['tool_version']
-    )
-
-def get_toolshed(gxstep: dict[str, Any]) -> list[Wrapper]:
-    # scrape toolshed for wrappers and update cache
-    wrapper = request_single_wrapper(
+    # uses local cache if possible, else scrapes toolshed for wrappers and updates cache
+    return gxwrappers.get_wrapper(
         tool_shed=gxstep['tool_shed_repository']['tool_shed'],
         owner=gxstep['tool_shed_repository']['owner'],
         repo=gxstep['tool_shed_repository']['name'],
         tool_id=gxstep['tool_id'].rsplit('/', 2)[-2],
         tool_build=gxstep['tool_version']
     )
-    cache = WrapperCache()
-    cache.add(wrapper)
-    
-    # confirm can now load wrapper details from cache
-    local_wrappers = get_local(gxstep)
-    if not local_wrappers:
-        raise RuntimeError()
-    
-    return local_wrappers
-
-def most_recent(wrappers: list[Wrapper]) -> Wrapper:
-    """return the most recent wrapper which matches [version]"""
-    wrappers.sort(key=lambda x: x.date_created, reverse=True)
-    return wrappers[0]
-
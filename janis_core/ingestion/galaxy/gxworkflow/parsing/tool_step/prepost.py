@@ -7,8 +7,7 @@ from janis_core.ingestion.galaxy.gxtool.command.cmdstr.generate import gen_comma
 from janis_core.ingestion.galaxy.gxtool.command.cmdstr.CommandString import CommandStringSource
 from janis_core.ingestion.galaxy.internal_model.workflow.workflow import Workflow
 
-from janis_core.ingestion.galaxy.gxtool.parsing import load_xmltool
-from janis_core.ingestion.galaxy.gxworkflow import load_tool_state
+from janis_core.ingestion.galaxy.gxworkflow.context import get_step_context
 from janis_core.ingestion.galaxy.gxtool.command import load_templated_command_str
 
 from janis_core.ingestion.galaxy import internal_mapping
@@ -25,9 +24,9 @@ def ingest_prepost(g_step: dict[str, Any], janis: Workflow, galaxy: dict[str, An
     j_step = internal_mapping.step(g_step['id'], janis, galaxy)
     runtime.tool.set(from_wrapper=j_step.metadata.wrapper)
 
-    xmltool = load_xmltool(runtime.tool.tool_path)
-    tool_state = load_tool_state(
-        g_step, 
+    context = get_step_context(g_step)
+    xmltool = context.xmltool
+    tool_state = context.tool_state(
         additional_filters=[
             'ReplaceBoolWithValue',
             'ReplaceNullWithVarname',
@@ -35,7 +34,7 @@ def ingest_prepost(g_step: dict[str, Any], janis: Workflow, galaxy: dict[str, An
             'ReplaceRuntimeWithVarname',
         ]
     )
-    command = load_templated_command_str(inputs_dict=tool_state)
+    command = load_templated_command_str(xmltool, inputs_dict=tool_state)
     cmdstr = gen_command_string(source=CommandStringSource.XML, text=command, xmltool=xmltool)
     j_step.preprocessing = extract_cmdline(cmdstr.preprocessing)
     j_step.postprocessing = extract_cmdline(cmdstr.postprocessing)
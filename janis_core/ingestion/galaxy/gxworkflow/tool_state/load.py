@@ -5,9 +5,6 @@
 from typing import Any, Type
 import json
 
-from copy import deepcopy
-from janis_core.ingestion.galaxy import runtime
-from janis_core.ingestion.galaxy.gxtool.parsing.main import load_xmltool
 from janis_core.ingestion.galaxy.gxtool.model import XMLTool
 
 from .filters import (
@@ -29,10 +26,18 @@ def load_tool_state(
     """ 
     loads the 'tool_state' from a galaxy step into a json dict. 
     performs optional filtering on the dict to resolve values and remove unnecessary keys.
+    the result is memoised on the step's StepIngestContext, so should be treated as read-only.
     """
+    from ..context import get_step_context
+    return get_step_context(step).tool_state(additional_filters)
+
+def filter_tool_state(
+    step: dict[str, Any], 
+    additional_filters: list[str], 
+    xmltool: XMLTool
+    ) -> dict[str, Any]:
     local_filters = get_local_filters_to_apply(additional_filters)
     global_filters = get_global_filters_to_apply(additional_filters)
-    xmltool = load_xmltool(runtime.tool.tool_path)
     tool_state = json.loads(step['tool_state'])
     tool_state = apply_local_filters(local_filters, tool_state, xmltool)
     tool_state = apply_global_filters(global_filters, tool_state, xmltool)
@@ -50,8 +55,7 @@ def do_apply_local_filters(filters: list[Type[Filter]], tool_state: dict[str, An
     
     for key, value in tool_state.items():
         if isinstance(value, dict):
-            curr_path = deepcopy(path)
-            curr_path.append(key)
+            curr_path = path + [key]
             tool_state[key] = do_apply_local_filters(filters, value, curr_path, xmltool)  # type: ignore
     
     return tool_state
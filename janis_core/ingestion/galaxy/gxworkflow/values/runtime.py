@@ -11,7 +11,7 @@ if TYPE_CHECKING:
 from janis_core.ingestion.galaxy.internal_model.workflow import WorkflowInput
 from janis_core.ingestion.galaxy.internal_model.workflow import InputValue
 from janis_core.ingestion.galaxy.internal_model.workflow import WorkflowInputInputValue
-from janis_core.ingestion.galaxy.gxworkflow import load_tool_state
+from janis_core.ingestion.galaxy.gxworkflow.context import get_step_context
 
 from janis_core.ingestion.galaxy.gxtool.command.components import InputComponent
 
@@ -39,7 +39,7 @@ class RuntimeInputIngestor:
     def ingest_runtime(self, g_step: dict[str, Any]) -> None:
         j_step = internal_mapping.step(g_step['id'], self.janis, self.galaxy)
         runtime.tool.set(from_wrapper=j_step.metadata.wrapper)
-        tool_state = load_tool_state(g_step, additional_filters=['Flatten', 'DeNestClass'])
+        tool_state = get_step_context(g_step).tool_state(additional_filters=['Flatten', 'DeNestClass'])
         g_targets = [key for key, val in tool_state.items() if val == 'RuntimeValue']
 
         for g_target in g_targets:
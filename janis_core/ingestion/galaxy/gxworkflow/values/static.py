@@ -8,8 +8,7 @@ if TYPE_CHECKING:
 from janis_core.ingestion.galaxy.internal_model.workflow import WorkflowInput
 
 
-from janis_core.ingestion.galaxy.gxtool.parsing import load_xmltool
-from janis_core.ingestion.galaxy.gxworkflow import load_tool_state
+from janis_core.ingestion.galaxy.gxworkflow.context import get_step_context
 
 from janis_core.ingestion.galaxy.gxtool.command.cmdstr import gen_command_string
 from janis_core.ingestion.galaxy.gxtool.command.cmdstr.CommandString import CommandStringSource
@@ -82,9 +81,9 @@ class CheetahInputIngestor:
                     pass
 
     def prepare_command(self) -> str:
-        xmltool = load_xmltool(runtime.tool.tool_path)
-        tool_state = load_tool_state(
-            self.g_step, 
+        context = get_step_context(self.g_step)
+        xmltool = context.xmltool
+        tool_state = context.tool_state(
             additional_filters=[
                 'ReplaceBoolWithValue',
                 # 'ReplaceNullWithVarname',
@@ -92,7 +91,7 @@ class CheetahInputIngestor:
                 'ReplaceRuntimeWithVarname',
             ]
         )
-        command = load_templated_command_str(inputs_dict=tool_state)
+        command = load_templated_command_str(xmltool, inputs_dict=tool_state)
         cmdstr = gen_command_string(source=CommandStringSource.TOOL_STATE, text=command, xmltool=xmltool)
         stmtstr = cmdstr.main.cmdline
         # logging.runtime_data(command)
@@ -178,7 +177,7 @@ class StaticInputIngestor:
         self.g_step = g_step
         self.i_step = i_step
         self.i_workflow = i_workflow
-        self.tool_state = load_tool_state(self.g_step, additional_filters=['Flatten', 'DeNestClass'])
+        self.tool_state = get_step_context(self.g_step).tool_state(additional_filters=['Flatten', 'DeNestClass'])
 
     def ingest(self) -> None:
         for component in self.get_linkable_components():
@@ -4,3 +4,4 @@ from .downloads.wrappers import fetch_xml
 from .wrappers.Wrapper import Wrapper
 from .wrappers.WrapperCache import WrapperCache
 from .requests.versions import request_single_wrapper
+from .requests.versions import get_wrapper
@@ -1,40 +1,149 @@
-
-
 import os
+import json
+import shutil
 import tarfile
-from typing import Optional
-from janis_core.settings.ingest.galaxy import DOWNLOADED_WRAPPERS_DIR
+import tempfile
+import threading
+from typing import Any, Optional
+from janis_core import settings
 from janis_core.ingestion.galaxy.fileio import safe_init_folder
 
 
+MANIFEST_NAME = '.janis_manifest.json'
+
+
 class DownloadCache:
     """
     keeps track of the location of downloaded wrapper folders.
     DownloadCache.get() will return the local path to a tool xml if already downloaded
-    DownloadCache.add() saves a tar as a download and notes its path. 
+    DownloadCache.add() saves a tar as a download and notes its path.
+
+    the download directory is listed once per process. the listing is indexed by
+    (repo, revision) and updated as new tars are extracted by DownloadCache.add().
+
+    tars are read as a stream, and everything except test data (WRAPPER_ARCHIVE_EXCLUDED_DIRS) is kept.
+    each wrapper folder is staged in a temp directory then renamed into place alongside
+    a manifest of its files, so a partial download is never seen as cached.
     """
 
+    _path: Optional[str] = None
+    _folders: dict[tuple[str, str], str] = {}
+    _validated: set[str] = set()
+    _lock = threading.Lock()
+
     def get(self, query_repo: str, query_revision: str) -> Optional[str]:
         """returns the local file path for the tool xml if already downloaded or None"""
-        path = DOWNLOADED_WRAPPERS_DIR
-        for folder in self._load():
-            repo, revision = folder.split('-', 1)
-            if repo == query_repo and revision == query_revision:
-                return f'{path}{os.sep}{folder}'
+        path = settings.ingest.galaxy.DOWNLOADED_WRAPPERS_DIR
+        folders = self._load()
+        folder = folders.get((query_repo, query_revision))
+        if folder is not None and self._is_valid(f'{path}{os.sep}{folder}'):
+            return f'{path}{os.sep}{folder}'
         return None
 
-    def add(self, tar: tarfile.TarFile) -> None:
-        self._save(tar)
+    def add(self, tar: tarfile.TarFile, etag: Optional[str]=None) -> None:
+        self._save(tar, etag)
 
-    def _save(self, tar: tarfile.TarFile) -> None:
-        path = DOWNLOADED_WRAPPERS_DIR
+    def _save(self, tar: tarfile.TarFile, etag: Optional[str]=None) -> None:
+        path = settings.ingest.galaxy.DOWNLOADED_WRAPPERS_DIR
         safe_init_folder(path)
-        tar.extractall(path=path)
+        # staging inside the download dir keeps the final rename on one filesystem
+        staging = tempfile.mkdtemp(prefix='.staging.', dir=path)
+        try:
+            manifests = self._extract(tar, staging)
+            folders = self._load()
+            for folder, manifest in manifests.items():
+                manifest['etag'] = etag
+                with open(os.path.join(staging, folder, MANIFEST_NAME), 'w') as fp:
+                    json.dump(manifest, fp)
+                self._move_into_place(os.path.join(staging, folder), f'{path}{os.sep}{folder}')
+                if '-' in folder:
+                    with self._lock:
+                        folders[self._split_folder(folder)] = folder
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
 
-    def _load(self) -> set[str]:
-        path = DOWNLOADED_WRAPPERS_DIR
-        safe_init_folder(path)
-        folders = os.listdir(path)
-        folders = [f for f in folders if os.path.isdir(f'{path}{os.sep}{f}')]
-        return set(folders)
+    def _extract(self, tar: tarfile.TarFile, staging: str) -> dict[str, dict[str, Any]]:
+        # iterating the tar (rather than getmembers()) reads it in a single pass
+        manifests: dict[str, dict[str, Any]] = {}
+        for member in tar:
+            relpath = self._wanted_relpath(member)
+            if relpath is None:
+                continue
+            folder, filepath = relpath
+            target = os.path.join(staging, folder, *filepath.split('/'))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            src = tar.extractfile(member)
+            assert(src is not None)
+            with open(target, 'wb') as fp:
+                shutil.copyfileobj(src, fp)
+            # keep permissions (eg executable wrapper scripts), as extractall() would
+            os.chmod(target, member.mode & 0o777)
+            manifest = manifests.setdefault(folder, {'size': 0, 'files': {}})
+            manifest['files'][filepath] = member.size
+            manifest['size'] += member.size
+        return manifests
+
+    def _wanted_relpath(self, member: tarfile.TarInfo) -> Optional[tuple[str, str]]:
+        """(wrapper folder, path within folder) for files which should be extracted"""
+        if not member.isfile():
+            return None
+        parts = member.name.split('/')
+        if len(parts) < 2 or member.name.startswith('/') or '..' in parts or '' in parts[:-1]:
+            return None
+        if any(p in settings.ingest.galaxy.WRAPPER_ARCHIVE_EXCLUDED_DIRS for p in parts[1:-1]):
+            return None
+        return parts[0], '/'.join(parts[1:])
+
+    def _move_into_place(self, src: str, dest: str) -> None:
+        try:
+            os.rename(src, dest)
+        except OSError:
+            # dest exists. keep it if complete (eg another process finished first), else replace.
+            if self._is_valid(dest, recheck=True):
+                return
+            shutil.rmtree(dest, ignore_errors=True)
+            os.rename(src, dest)
+        with self._lock:
+            DownloadCache._validated.add(dest)
+
+    def _is_valid(self, folder: str, recheck: bool=False) -> bool:
+        """
+        checks a wrapper folder against its manifest.
+        folders without a manifest (eg added by hand) are trusted.
+        """
+        if folder in DownloadCache._validated and not recheck:
+            return True
+        manifest_path = os.path.join(folder, MANIFEST_NAME)
+        valid = os.path.isdir(folder)
+        if valid and os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, 'r') as fp:
+                    files: dict[str, int] = json.load(fp)['files']
+                valid = all(
+                    os.path.getsize(os.path.join(folder, *filepath.split('/'))) == size
+                    for filepath, size in files.items()
+                )
+            except (OSError, ValueError, KeyError):
+                valid = False
+        with self._lock:
+            if valid:
+                DownloadCache._validated.add(folder)
+            else:
+                DownloadCache._validated.discard(folder)
+        return valid
+
+    def _load(self) -> dict[tuple[str, str], str]:
+        path = settings.ingest.galaxy.DOWNLOADED_WRAPPERS_DIR
+        with self._lock:
+            if DownloadCache._path != path:
+                safe_init_folder(path)
+                folders = os.listdir(path)
+                folders = [f for f in folders if '-' in f and not f.startswith('.') and os.path.isdir(f'{path}{os.sep}{f}')]
+                DownloadCache._folders = {self._split_folder(f): f for f in folders}
+                DownloadCache._validated = set()
+                DownloadCache._path = path
+            return DownloadCache._folders
 
+    def _split_folder(self, folder: str) -> tuple[str, str]:
+        repo, revision = folder.split('-', 1)
+        return (repo, revision)
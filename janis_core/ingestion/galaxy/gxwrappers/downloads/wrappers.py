@@ -70,16 +70,16 @@ def _fetch_toolshed(owner: str, repo: str, revision: str, tool_id: str) -> Optio
     # download and add to cache
     url = _get_url_via_revision(owner, repo, revision)
     # logging.msg_downloading_tool(url)
-    tar = _download_wrapper(url)
-    CACHE.add(tar)
+    with requests.get(url, stream=True) as response:
+        response.raise_for_status()
+        with _open_wrapper_archive(response) as tar:
+            CACHE.add(tar, etag=response.headers.get('ETag'))
     # fetch from cache
     return _fetch_cache(repo, revision, tool_id)
 
 def _get_url_via_revision(owner: str, repo: str, revision: str) -> str:
     return f'https://toolshed.g2.bx.psu.edu/repos/{owner}/{repo}/archive/{revision}.tar.gz'
 
-def _download_wrapper(url: str) -> tarfile.TarFile:
-    response = requests.get(url, stream=True)
-    return tarfile.open(fileobj=response.raw, mode='r:gz')
-
-
+def _open_wrapper_archive(response: requests.Response) -> tarfile.TarFile:
+    # stream mode: members are read in order as the response arrives
+    return tarfile.open(fileobj=response.raw, mode='r|gz')
@@ -4,15 +4,36 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from bioblend.toolshed import ToolShedInstance
 
+from janis_core import settings
 from janis_core.ingestion.galaxy.gxtool.model import XMLRequirement
 from janis_core.ingestion.galaxy.gxtool.model import XMLCondaRequirement
 from janis_core.ingestion.galaxy.gxwrappers import Wrapper
+from janis_core.ingestion.galaxy.gxwrappers import WrapperCache
 from janis_core.ingestion.galaxy.runtime.dates import JANIS_DATE_FMT
 from janis_core.ingestion.galaxy.runtime.dates import TOOLSHED_DATE_FMT
 
 
+def get_wrapper(tool_shed: str, owner: str, repo: str, tool_id: str, tool_build: str) -> Wrapper:
+    """
+    cache-first wrapper lookup keyed by (owner, repo, tool_id, tool_build). 
+    only makes toolshed API requests if no matching wrapper is cached. 
+    """
+    cache = WrapperCache()
+    wrappers = cache.get(owner=owner, repo=repo, tool_id=tool_id, tool_build=tool_build)
+    if wrappers:
+        return most_recent(wrappers)
+    
+    wrapper = request_single_wrapper(tool_shed, owner, repo, tool_id, tool_build)
+    cache.add(wrapper)
+    return wrapper
+
+def most_recent(wrappers: list[Wrapper]) -> Wrapper:
+    """return the most recent wrapper"""
+    return sorted(wrappers, key=lambda x: x.date_created, reverse=True)[0]
+
 def request_single_wrapper(tool_shed: str, owner: str, repo: str, tool_id: str, tool_build: str) -> Wrapper:
     api_interactor = ToolshedAPIInteractor(tool_shed, owner, repo, tool_id, tool_build)
     print(f"making galaxy API request for {api_interactor.tool_id} v{api_interactor.tool_build}")
@@ -30,19 +51,35 @@ class ToolshedAPIInteractor:
 
     # TODO MULTIPLE REQUEST ATTEMPTS WITH TIMEOUT???
     def get_single_wrapper(self) -> Wrapper:
+        """
+        finds the newest installable revision which contains the tool at tool_build. 
+        revision metadata is requested concurrently, but results are checked newest-first. 
+        once a match is found, outstanding requests for older revisions are cancelled. 
+        """
         ts = ToolShedInstance(f"https://{self.tool_shed}/")
         revisions = ts.repositories.get_ordered_installable_revisions(self.repo, self.owner) # type: ignore
         if not revisions:
             raise RuntimeError
-        for revision in reversed(revisions):
-            revision_data = ts.repositories.get_repository_revision_install_info(self.repo, self.owner, revision) # type: ignore
-            if revision_data and len(revision_data[0]) > 0:  # type: ignore
-                repo_wrappers = self._galaxy_revision_info_to_wrappers(revision_data) # type: ignore
-                tool_wrapper = self._select_version_match_strict(repo_wrappers)
-                if tool_wrapper:
-                    return tool_wrapper
+        
+        revisions = list(reversed(revisions))
+        workers = max(1, min(settings.ingest.galaxy.TOOLSHED_FETCH_WORKERS, len(revisions)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [executor.submit(self._get_revision_info, ts, rev) for rev in revisions]
+            for future in futures:
+                revision_data = future.result()
+                if revision_data and len(revision_data[0]) > 0:  # type: ignore
+                    repo_wrappers = self._galaxy_revision_info_to_wrappers(revision_data) # type: ignore
+                    tool_wrapper = self._select_version_match_strict(repo_wrappers)
+                    if tool_wrapper:
+                        return tool_wrapper
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         raise RuntimeError
 
+    def _get_revision_info(self, ts: ToolShedInstance, revision: str) -> Any:
+        return ts.repositories.get_repository_revision_install_info(self.repo, self.owner, revision) # type: ignore
+
     def _select_version_match_strict(self, wrappers: list[Wrapper]) -> Optional[Wrapper]:
         for wrapper in wrappers:
             if wrapper.tool_id == self.tool_id and wrapper.tool_build == self.tool_build:
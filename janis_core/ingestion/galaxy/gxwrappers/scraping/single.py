@@ -25,7 +25,8 @@ def do_wrappers_scrape(owner: str, repo: str) -> None:
     for revision in scrapable_revisions(owner, repo):
         wrappers = revision.get_wrappers()
         for wrapper in wrappers:
-            cache.add(wrapper)  # save
+            cache.add(wrapper)
+    cache.flush()  # save
 
 def scrapable_revisions(owner: str, repo: str) -> Iterable[Revision]:
     revision_data = utils.load_data(utils.REVISION_DATA_PATH)
@@ -111,6 +111,7 @@ class WrapperScraper:
                     self.cache.add(wrapper)
             except Exception as e:
                 print(e)
+        self.cache.flush()
 
     def get_scrapable_revisions(self) -> list[Revision]:
         revision_data = utils.load_data(utils.REVISION_DATA_PATH)
@@ -2,10 +2,12 @@
 
 import json
 import os
-from typing import Optional
+import atexit
+import threading
+from typing import Any, Optional
+from janis_core import settings
 from janis_core.ingestion.galaxy.gxwrappers import Wrapper
 from janis_core.ingestion.galaxy.fileio import safe_init_file
-from janis_core.settings.ingest.galaxy import WRAPPER_CACHE
 
 
 """
@@ -26,8 +28,82 @@ WrapperCache flat file structure:
         ]
     }
 }
+
+The flat file is loaded once per process into a shared _WrapperIndex.
+Additions are applied to the index immediately, and written to file in batches 
+(see WrapperCache.flush(), which is also called at exit).
 """
 
+WrapperKey = tuple[str, str, str, str, str]     # (tool_id, tool_build, owner, repo, revision)
+LookupKey = tuple[str, str, str, str]           # (tool_id, tool_build, owner, repo)
+
+
+class _WrapperIndex:
+    def __init__(self, path: str):
+        self.path = path
+        self.by_key: dict[WrapperKey, Wrapper] = {}
+        self.by_lookup: dict[LookupKey, list[Wrapper]] = {}
+        self.by_tool_id: dict[str, list[Wrapper]] = {}
+        self.pending: list[dict[str, Any]] = []
+        self.lock = threading.RLock()
+        for entries in self._read().values():
+            for entry in entries:
+                self.insert(entry)
+
+    def insert(self, entry: dict[str, Any]) -> bool:
+        """adds a wrapper (dict form) to the index. returns False if already present"""
+        key: WrapperKey = (entry['tool_id'], entry['tool_build'], entry['owner'], entry['repo'], entry['revision'])
+        if key in self.by_key:
+            return False
+        wrapper = Wrapper(entry)
+        self.by_key[key] = wrapper
+        self.by_lookup.setdefault(key[:4], []).append(wrapper)  # type: ignore
+        self.by_tool_id.setdefault(wrapper.tool_id, []).append(wrapper)
+        return True
+
+    def exists(self, tool_id: str, revision: str) -> bool:
+        return any(w.revision == revision for w in self.by_tool_id.get(tool_id, []))
+
+    def flush(self) -> None:
+        """merges pending additions into the flat file"""
+        with self.lock:
+            if not self.pending:
+                return
+            cache = self._read()
+            for entry in self.pending:
+                entries = cache.setdefault(entry['tool_id'], [])
+                if not any(e['revision'] == entry['revision'] for e in entries):
+                    entries.append(entry)
+            self.pending = []
+            with open(self.path, 'w') as fp:
+                json.dump(cache, fp)
+
+    def _read(self) -> dict[str, list[dict[str, Any]]]:
+        if not os.path.exists(self.path):
+            safe_init_file(self.path, contents='{}')
+        with open(self.path, 'r') as fp:
+            return json.load(fp)
+
+
+_index: Optional[_WrapperIndex] = None
+_index_lock = threading.Lock()
+
+def _get_index() -> _WrapperIndex:
+    """returns the process-wide index for the current settings.ingest.galaxy.WRAPPER_CACHE"""
+    global _index
+    path = settings.ingest.galaxy.WRAPPER_CACHE
+    with _index_lock:
+        if _index is None or _index.path != path:
+            if _index is not None:
+                _index.flush()
+            _index = _WrapperIndex(path)
+        return _index
+
+def _flush_at_exit() -> None:
+    if _index is not None:
+        _index.flush()
+
+atexit.register(_flush_at_exit)
 
 
 class WrapperCache:
@@ -40,69 +116,40 @@ class WrapperCache:
         repo: Optional[str]=None,
         revision: Optional[str]=None
     ) -> list[Wrapper]:
-        """loads cache then returns each Wrapper satisfying the query"""
-        # load cache and get relevant wrapper in dict form
-        cache = self._load()
-
-        wrappers: list[dict[str, str]] = []
-        for wrapper_list in cache.values():
-            wrappers += wrapper_list
+        """returns each Wrapper satisfying the query"""
+        index = _get_index()
+        with index.lock:
+            if tool_id and tool_build and owner and repo:
+                if revision:
+                    wrapper = index.by_key.get((tool_id, tool_build, owner, repo, revision))
+                    return [wrapper] if wrapper else []
+                wrappers = index.by_lookup.get((tool_id, tool_build, owner, repo), [])
+            elif tool_id:
+                wrappers = index.by_tool_id.get(tool_id, [])
+            else:
+                wrappers = list(index.by_key.values())
         
-        # this can be more elegant ofc
-        if tool_id:
-            wrappers = [x for x in wrappers if x['tool_id'] == tool_id]
-        if tool_build:
-            wrappers = [x for x in wrappers if x['tool_build'] == tool_build]
-        if owner:
-            wrappers = [x for x in wrappers if x['owner'] == owner]
-        if repo:
-            wrappers = [x for x in wrappers if x['repo'] == repo]
-        if revision:
-            wrappers = [x for x in wrappers if x['revision'] == revision]
-        
-        # cast to Wrapper instances
-        return [Wrapper(w) for w in wrappers]
+        return [
+            w for w in wrappers
+            if (not tool_build or w.tool_build == tool_build)
+            and (not owner or w.owner == owner)
+            and (not repo or w.repo == repo)
+            and (not revision or w.revision == revision)
+        ]
     
     def add(self, wrapper: Wrapper) -> None:
-        """adds the Wrapper to our cache and saves to file"""
-        # load cache 
-        cache = self._load() 
-
-        # alter cache if needed
-        self._ensure_key(wrapper.tool_id, cache)
-        if not self.exists(wrapper, cache):
-            cache[wrapper.tool_id].append(wrapper.to_dict())
-        
-        # write
-        self._save(cache) 
+        """adds the Wrapper to our cache. written to file on the next flush()"""
+        index = _get_index()
+        with index.lock:
+            if not self.exists(wrapper):
+                entry = wrapper.to_dict()
+                index.insert(entry)
+                index.pending.append(entry)
 
-    def exists(self, wrapper: Wrapper, cache: dict[str, list[dict[str, str]]]) -> bool:
+    def exists(self, wrapper: Wrapper) -> bool:
         """checks if the wrapper is already in cache"""
-        if wrapper.tool_id in cache:
-            for entry in cache[wrapper.tool_id]:
-                if entry['revision'] == wrapper.revision:
-                    return True
-        return False
-
-    def _load(self) -> dict[str, list[dict[str, str]]]:
-        """loads cache from flat file"""
-        path = WRAPPER_CACHE
-        if not os.path.exists(path):
-            safe_init_file(path, contents='{}')
-        with open(path, 'r') as fp:
-            return json.load(fp)
-    
-    def _save(self, cache: dict[str, list[dict[str, str]]]) -> None:
-        """saves our cache to file"""
-        path = WRAPPER_CACHE
-        if not os.path.exists(path):
-            safe_init_file(path, contents='{}')
-        with open(path, 'w') as fp:
-            json.dump(cache, fp)
-
-    def _ensure_key(self, key: str, cache: dict[str, list[dict[str, str]]]) -> None:    
-        """ensures { key: [] } in cache"""
-        if key not in cache:
-            cache[key] = []
-            
-    
+        return _get_index().exists(wrapper.tool_id, wrapper.revision)
+
+    def flush(self) -> None:
+        """writes any added wrappers to the cache file"""
+        _get_index().flush()
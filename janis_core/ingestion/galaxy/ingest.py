@@ -5,12 +5,15 @@ import os
 from typing import Any, Optional, Tuple
 from janis_core import settings
 from janis_core import Tool
+from janis_core.utils import profiling
 from janis_core.ingestion.galaxy import runtime
 from janis_core.ingestion.galaxy import internal_mapping
 from janis_core.ingestion.galaxy.runtime.startup import tool_setup
-from janis_core.ingestion.galaxy.gxtool.parsing import load_xmltool
+from janis_core.ingestion.galaxy.gxworkflow import get_step_context
+from janis_core.ingestion.galaxy.gxworkflow import clear_step_contexts
 from janis_core.ingestion.galaxy.gxtool.command import gen_command
 from janis_core.ingestion.galaxy.containers import resolve_dependencies_as_container
+from janis_core.ingestion.galaxy.containers import prefetch_containers
 
 from janis_core.ingestion.galaxy.internal_model.tool.generate import gen_tool
 from janis_core.ingestion.galaxy.internal_model.tool import ITool as InternalTool
@@ -23,7 +26,7 @@ from janis_core.ingestion.galaxy.gxworkflow.parsing.inputs import ingest_workflo
 from janis_core.ingestion.galaxy.gxworkflow.parsing.step import ingest_workflow_steps
 from janis_core.ingestion.galaxy.gxworkflow.parsing.tool_step.prepost import ingest_workflow_steps_prepost
 from janis_core.ingestion.galaxy.gxworkflow.parsing.tool_step.outputs import ingest_workflow_steps_outputs
-from janis_core.ingestion.galaxy.gxwrappers import request_single_wrapper
+from janis_core.ingestion.galaxy.gxwrappers import get_wrapper
 
 from janis_core.ingestion.galaxy.gxworkflow.values import handle_step_connection_inputs
 from janis_core.ingestion.galaxy.gxworkflow.values import handle_step_runtime_inputs
@@ -64,6 +67,7 @@ def parse_galaxy(uri: str) -> Tool:
             revision= wrapper.revision,
             tool_id= wrapper.tool_id
         )
+        WrapperCache().flush()
         info_ingesting_tool('galaxy', wrapper.tool_id)
         internal_tool = ingest_tool(wrapper_path)
         _set_wrapper_export_paths(wrapper)
@@ -73,8 +77,10 @@ def parse_galaxy(uri: str) -> Tool:
         name = os.path.splitext(uri)[0]
         info_ingesting_workflow('galaxy', name)
         internal_workflow = ingest_workflow(uri)
+        WrapperCache().flush()
         _set_wrapper_export_paths(internal_workflow)
-        return to_janis_workflow(internal_workflow)
+        with profiling.span('galaxy.to_janis', category='ingest'):
+            return to_janis_workflow(internal_workflow)
     
     else:
         raise ValueError("file uri for galaxy ingestion must be either:\n- a tool id (starting with toolshed.g2.bx.psu.edu/)\n- a path ending in '.xml' (local tool)\n - a path ending in '.ga' (local workflow)")
@@ -87,8 +93,11 @@ def ingest_tool(path: str, gxstep: Optional[dict[str, Any]]=None) -> InternalToo
     """
     # setup_data_folder()
     datatypes.populate()
+    if gxstep is None:
+        # standalone tool: don't reuse (or keep) the parse from an earlier ingest of this file
+        clear_step_contexts()
     runtime.tool.tool_path = path
-    galaxy = load_xmltool(path)
+    galaxy = get_step_context(gxstep, tool_path=path).xmltool
     command = gen_command(galaxy, gxstep)
     container = resolve_dependencies_as_container(galaxy)
     internal = gen_tool(galaxy, command, container, gxstep)
@@ -108,27 +117,35 @@ def ingest_workflow(path: str) -> Workflow:
     """
     # setup_data_folder()
     datatypes.populate()
+    clear_step_contexts()
     galaxy = _load_galaxy_workflow(path)
     internal = Workflow()
 
     # ingesting workflow entities to internal
-    ingest_metadata(internal, galaxy)
-    ingest_workflow_inputs(internal, galaxy)
-    ingest_workflow_steps(internal, galaxy)         # creates steps, but only the metadata
-    ingest_workflow_tools(internal, galaxy)         # has to happen after ingesting step metadata, but before step inputs / outputs
-    ingest_workflow_steps_prepost(internal, galaxy)
-    ingest_workflow_steps_outputs(internal, galaxy) 
+    with profiling.span('galaxy.metadata', category='ingest'):
+        ingest_metadata(internal, galaxy)
+        ingest_workflow_inputs(internal, galaxy)
+    with profiling.span('galaxy.steps', category='ingest', steps=len(galaxy['steps'])):
+        ingest_workflow_steps(internal, galaxy)     # creates steps, but only the metadata
+    with profiling.span('galaxy.tools', category='ingest'):
+        ingest_workflow_tools(internal, galaxy)     # has to happen after ingesting step metadata, but before step inputs / outputs
+    with profiling.span('galaxy.step_io', category='ingest'):
+        ingest_workflow_steps_prepost(internal, galaxy)
+        ingest_workflow_steps_outputs(internal, galaxy) 
 
     # assigning step input values
-    handle_step_connection_inputs(internal, galaxy)   # all these have to happen after step outputs are parsed
-    handle_step_runtime_inputs(internal, galaxy)
-    handle_step_script_configfile_inputs(internal)
-    handle_step_static_inputs(internal, galaxy)
-    handle_step_default_inputs(internal)
+    with profiling.span('galaxy.values', category='ingest'):
+        handle_step_connection_inputs(internal, galaxy)   # all these have to happen after step outputs are parsed
+        handle_step_runtime_inputs(internal, galaxy)
+        handle_step_script_configfile_inputs(internal)
+        handle_step_static_inputs(internal, galaxy)
+        handle_step_default_inputs(internal)
 
     # post ingestion tasks
-    update_component_knowledge(internal)
-    handle_scattering(internal)
+    with profiling.span('galaxy.updates', category='ingest'):
+        update_component_knowledge(internal)
+        handle_scattering(internal)
+    clear_step_contexts()
     return internal
 
 
@@ -136,12 +153,25 @@ def ingest_workflow(path: str) -> Workflow:
 
 # (this function should probably be elsewhere)
 def ingest_workflow_tools(janis: Workflow, galaxy: dict[str, Any]) -> None:
+    # setup each tool step & locate its wrapper xml
+    tool_steps: list[Tuple[dict[str, Any], dict[str, Any], str]] = []
     for gx_step in galaxy['steps'].values():
         if gx_step['type'] == 'tool':
             j_step = internal_mapping.step(gx_step['id'], janis, galaxy)
             args = _gen_ingest_settings_for_step(j_step.metadata)
             tool_setup(args)
-            tool = ingest_tool(runtime.tool.tool_path, gx_step)
+            tool_steps.append((gx_step, args, runtime.tool.tool_path))
+
+    # resolve containers for every tool requirement in the workflow up front (concurrently)
+    with profiling.span('galaxy.containers', category='ingest', tools=len(tool_steps)):
+        prefetch_containers([get_step_context(gx_step, tool_path=path).xmltool for gx_step, _, path in tool_steps])
+
+    # ingest each tool
+    for gx_step, args, path in tool_steps:
+        with profiling.span('galaxy.tool', category='ingest', step=gx_step['id'], tool=gx_step['tool_id']):
+            j_step = internal_mapping.step(gx_step['id'], janis, galaxy)
+            runtime.tool.set(from_args=args)
+            tool = ingest_tool(path, gx_step)
             j_step.set_tool(tool)
 
 def _is_galaxy_local_tool(uri: str) -> bool:
@@ -162,18 +192,15 @@ def _is_galaxy_workflow(uri: str) -> bool:
     return False
 
 def _request_wrapper_info(uri: str) -> Wrapper:
-    # scrape toolshed for wrappers and update cache
+    # use cached wrapper if known, else scrape toolshed for wrappers and update cache
     shed, _, owner, repo, tool_id, tool_build = uri.split('/')
-    wrapper = request_single_wrapper(
+    return get_wrapper(
         tool_shed=shed,
         owner=owner,
         repo=repo,
         tool_id=tool_id,
         tool_build=tool_build
     )
-    cache = WrapperCache()
-    cache.add(wrapper)
-    return wrapper
 
 def _load_galaxy_workflow(path: str) -> dict[str, Any]:
     with open(path, 'r') as fp:
@@ -15,7 +15,7 @@ from janis_core.ingestion.galaxy.gxtool.command.components import Flag
 from janis_core.ingestion.galaxy.gxtool.command.components import Option
 from janis_core.ingestion.galaxy.gxtool.command.components import Positional
 from janis_core.ingestion.galaxy.gxtool.command.components import factory as component_factory
-from janis_core.ingestion.galaxy.gxworkflow import load_tool_state
+from janis_core.ingestion.galaxy.gxworkflow.context import get_step_context
 from janis_core.ingestion.galaxy.gxtool.model import XMLTool
 from janis_core.ingestion.galaxy.gxtool.model import (
     XMLParam, 
@@ -130,7 +130,7 @@ class InputExtractor:
         unlinked_params: list[XMLParam] = []
         uncaptured_inputs: list[InputComponent] = []
 
-        tool_state = load_tool_state(self.gxstep, additional_filters=['Flatten', 'DeNestClass'])
+        tool_state = get_step_context(self.gxstep).tool_state(additional_filters=['Flatten', 'DeNestClass'])
         for pname, pvalue in tool_state.items():
             param = self.xmltool.inputs.get(pname)
             if param:
@@ -1,6 +1,6 @@
 
 
-from typing import Optional
+from typing import Callable, Optional
 
 from ..step.inputs import InputValue, WorkflowInputInputValue
 from ..step.inputs import ConnectionInputValue
@@ -10,6 +10,8 @@ from ..step.inputs import ConnectionInputValue
 class StepInputRegister:
     def __init__(self):
         self.inputs: list[InputValue] = []
+        # called with each added InputValue (lets the owning Workflow index connections)
+        self.on_add: Optional[Callable[[InputValue], None]] = None
 
     @property
     def all(self) -> list[InputValue]:
@@ -33,6 +35,8 @@ class StepInputRegister:
 
     def add(self, invalue: InputValue) -> None:
         self.inputs.append(invalue)
+        if self.on_add:
+            self.on_add(invalue)
     
     def get(self, query_uuid: str) -> Optional[InputValue]:
         for invalue in self.inputs:
@@ -1,15 +1,21 @@
 
 
 
+from typing import Callable, Optional
+
 from ..step.outputs import StepOutput
 
 
 class StepOutputRegister:
     def __init__(self):
         self.register: list[StepOutput] = []
+        # called with each added StepOutput (lets the owning Workflow index outputs)
+        self.on_add: Optional[Callable[[StepOutput], None]] = None
 
     def add(self, step_output: StepOutput) -> None:
         self.register.append(step_output)
+        if self.on_add:
+            self.on_add(step_output)
 
     def list(self) -> list[StepOutput]:
         return self.register
@@ -2,8 +2,10 @@
 
 from typing import Optional
 from uuid import uuid4
+from functools import partial
 from janis_core.ingestion.galaxy import tags
 
+from .step.inputs import InputValue, ConnectionInputValue, WorkflowInputInputValue
 from .step.outputs import StepOutput
 from .step.step import WorkflowStep
 from .metadata import WorkflowMetadata
@@ -18,12 +20,21 @@ class Workflow:
     step_ids are used to lookup key information. 
     each input, step, and output is stored with step_id as key. 
     that way everything can be referenced properly. 
+
+    inputs, steps and step outputs are indexed by uuid as they are added, 
+    as are the steps consuming each input / step (via step.inputs). 
     """
     def __init__(self):
         self.uuid: str = str(uuid4())
         self.inputs: list[WorkflowInput] = []
         self._steps: list[WorkflowStep] = []
         self._metadata: Optional[WorkflowMetadata] = None
+        self._sorted_steps: Optional[list[WorkflowStep]] = None
+        self._inputs_by_uuid: dict[str, WorkflowInput] = {}
+        self._steps_by_uuid: dict[str, WorkflowStep] = {}
+        self._step_outputs_by_uuid: dict[str, StepOutput] = {}
+        self._input_children: dict[str, list[WorkflowStep]] = {}
+        self._step_children: dict[str, list[WorkflowStep]] = {}
 
     @property
     def name(self) -> str:
@@ -35,9 +46,9 @@ class Workflow:
     
     @property
     def steps(self) -> list[WorkflowStep]:
-        the_list = self._steps
-        the_list = sorted(the_list, key=lambda x: x.metadata.step_id)
-        return the_list
+        if self._sorted_steps is None:
+            self._sorted_steps = sorted(self._steps, key=lambda x: x.metadata.step_id)
+        return list(self._sorted_steps)
 
     @property
     def metadata(self) -> WorkflowMetadata:
@@ -63,45 +74,51 @@ class Workflow:
         tags.switch_group(self.uuid)
         tags.register(w_inp)
         self.inputs.append(w_inp)
+        self._inputs_by_uuid.setdefault(w_inp.uuid, w_inp)
 
     def add_step(self, step: WorkflowStep) -> None:
         tags.switch_group(self.uuid)
         tags.register(step)
         self._steps.append(step)
+        self._sorted_steps = None
+        self._steps_by_uuid.setdefault(step.uuid, step)
+        
+        # index the step's current & future inputs / outputs
+        for invalue in step.inputs.all:
+            self._index_step_input(step, invalue)
+        for s_out in step.outputs.list():
+            self._index_step_output(s_out)
+        step.inputs.on_add = partial(self._index_step_input, step)
+        step.outputs.on_add = self._index_step_output
+
+    def _index_step_input(self, step: WorkflowStep, invalue: InputValue) -> None:
+        if isinstance(invalue, WorkflowInputInputValue):
+            self._input_children.setdefault(invalue.input_uuid, []).append(step)
+        elif isinstance(invalue, ConnectionInputValue):
+            self._step_children.setdefault(invalue.step_uuid, []).append(step)
+
+    def _index_step_output(self, s_out: StepOutput) -> None:
+        self._step_outputs_by_uuid.setdefault(s_out.tool_output.uuid, s_out)
 
     def get_input(self, query_uuid: str) -> WorkflowInput:
-        for winp in self.inputs:
-            if winp.uuid == query_uuid:
-                return winp
+        if query_uuid in self._inputs_by_uuid:
+            return self._inputs_by_uuid[query_uuid]
         raise RuntimeError('could not find input with uuid')
     
     def get_input_children(self, query_uuid: str) -> list[WorkflowStep]:
-        out: list[WorkflowStep] = []
-        for step in self.steps:
-            for winp_connection in step.inputs.workflow_inputs:
-                if winp_connection.input_uuid == query_uuid:
-                    out.append(step)
-        return out
+        children = self._input_children.get(query_uuid, [])
+        return sorted(children, key=lambda x: x.metadata.step_id)
     
     def get_step(self, query_uuid: str) -> WorkflowStep:
-        for step in self.steps:
-            if step.uuid == query_uuid:
-                return step
+        if query_uuid in self._steps_by_uuid:
+            return self._steps_by_uuid[query_uuid]
         raise RuntimeError('could not find step with uuid')
     
     def get_step_children(self, query_uuid: str) -> list[WorkflowStep]:
-        out: list[WorkflowStep] = []
-        for step in self.steps:
-            for connection in step.inputs.connections:
-                if connection.step_uuid == query_uuid:
-                    out.append(step)
-        return out
+        children = self._step_children.get(query_uuid, [])
+        return sorted(children, key=lambda x: x.metadata.step_id)
     
     def get_step_output(self, query_uuid: str) -> StepOutput:
-        for step in self.steps:
-            for s_out in step.outputs.list():
-                if s_out.tool_output.uuid == query_uuid:
-                    return s_out
+        if query_uuid in self._step_outputs_by_uuid:
+            return self._step_outputs_by_uuid[query_uuid]
         raise RuntimeError('could not find step output with uuid')
-    
-
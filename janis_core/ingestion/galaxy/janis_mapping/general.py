@@ -21,6 +21,7 @@ from janis_core.ingestion.galaxy.gxtool.model import XMLDataOutputParam
 from janis_core.ingestion.galaxy.gxtool.model import XMLCollectionOutputParam
 
 from janis_core.ingestion.galaxy import tags
+from janis_core.ingestion.galaxy import datatypes
 from janis_core.ingestion.galaxy.internal_model.workflow.input import WorkflowInput
 from janis_core.ingestion.galaxy.internal_model.workflow.step.outputs import StepOutput
 from janis_core.ingestion.galaxy.gxtool.command.components import (
@@ -39,8 +40,6 @@ datatype_map = {
     'Directory': Directory(),
 }
 
-import importlib
-
 
 DATATYPE_COMPONENT = InputComponent | OutputComponent | WorkflowInput | StepOutput
 
@@ -48,12 +47,8 @@ def to_janis_datatype(component: DATATYPE_COMPONENT) -> DataType:
     if isinstance(component, StepOutput):
         component = component.tool_output
     
-    module_name = component.datatype.import_path
-    class_name = component.datatype.classname
-    
     # the underlying datatype, regardless of stdout / array / optionality
-    module = importlib.import_module(module_name)
-    class_ = getattr(module, class_name)
+    class_ = datatypes.get_class(component.datatype)
     dtype = class_()
 
     # modifying dtype in array case
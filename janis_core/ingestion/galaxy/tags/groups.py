@@ -11,6 +11,8 @@ class TagGroup:
         self.section = section
         self.uuids_basetags: dict[str, str] = {}
         self.basetags_uuids: dict[str, list[str]] = {}
+        # (basetag, uuid) -> position of uuid within basetags_uuids[basetag]
+        self.basetag_positions: dict[tuple[str, str], int] = {}
         self.active: bool = False
 
     def exists(self, uuid: str) -> bool:
@@ -33,13 +35,14 @@ class TagGroup:
         self.uuids_basetags[uuid] = basetag
         if basetag not in self.basetags_uuids:
             self.basetags_uuids[basetag] = []
+        self.basetag_positions.setdefault((basetag, uuid), len(self.basetags_uuids[basetag]))
         self.basetags_uuids[basetag].append(uuid)
 
     def _generate_tag(self, basetag: str, query_uuid: str) -> Optional[str]:
         stored_uuids = self.basetags_uuids[basetag]
         if len(stored_uuids) <= 1:
             return basetag # only 1 object using this basetag
-        for i, uuid in enumerate(stored_uuids):
-            if uuid == query_uuid:
-                return f'{basetag}{i+1}' # appends '1', '2' etc if basetag is shared by multiple objects
+        i = self.basetag_positions.get((basetag, query_uuid))
+        if i is not None:
+            return f'{basetag}{i+1}' # appends '1', '2' etc if basetag is shared by multiple objects
         return None
@@ -1,16 +1,24 @@
 
 
-from typing import Any
+from typing import Any, Optional
 from .groups import TagGroup
 
 groups: dict[str, TagGroup] = {}
 
+# entity uuid -> uuid of the first TagGroup (in creation order) it was registered in
+_owners: dict[str, str] = {}
+# TagGroup uuid -> creation order
+_positions: dict[str, int] = {}
+# uuid of the active TagGroup
+_active: Optional[str] = None
+
 
 def register(entity: Any) -> None:  
     """register a tag in the active TagGroup"""
     group = _get_active()
     basename = get_basename(entity)
     group.register(basename, entity) 
+    _set_owner(entity.uuid, _active)  # type: ignore
 
 def get_basename(entity: Any) -> str:
     """get the basename of an entity"""
@@ -21,8 +29,8 @@ def get_basename(entity: Any) -> str:
 def get(uuid: str) -> str:
     """get a tag from any TagGroup"""
     global groups
-    for group in groups.values():
-        tag = group.get(uuid)
+    if uuid in _owners:
+        tag = groups[_owners[uuid]].get(uuid)
         if tag:
             return tag
     raise RuntimeError('No tag registered')
@@ -33,7 +41,10 @@ def new_group(section: str, uuid: str):
     then switch to that TagGroup to start registering tags
     """
     global groups
+    if uuid in groups:
+        _forget_group(uuid)
     groups[uuid] = TagGroup(section)
+    _positions.setdefault(uuid, len(_positions))
     switch_group(uuid)
 
 def switch_group(uuid: str):
@@ -44,26 +55,38 @@ def switch_group(uuid: str):
 
 def _get_active() -> TagGroup:
     global groups
-    for group in groups.values():
-        if group.active:
-            return group
+    if _active is not None:
+        return groups[_active]
     raise RuntimeError('no active group')
 
 def _set_active(query_uuid: str):
-    global groups
-    for uuid, group in groups.items():
-        if uuid == query_uuid:
-            group.active = True
-            return
+    global groups, _active
+    if query_uuid in groups:
+        groups[query_uuid].active = True
+        _active = query_uuid
+        return
     raise RuntimeError('group doesnt exist')
 
 def _clear_active():
-    global groups
-    for group in groups.values():
-        group.active = False
-
-
-
-
-
-
+    global groups, _active
+    if _active is not None:
+        groups[_active].active = False
+        _active = None
+
+def _set_owner(uuid: str, group_uuid: str) -> None:
+    # get() prefers the earliest created group holding the uuid
+    owner = _owners.get(uuid)
+    if owner is None or _positions[group_uuid] < _positions[owner]:
+        _owners[uuid] = group_uuid
+
+def _forget_group(group_uuid: str) -> None:
+    # a group is being replaced: its registered uuids fall back to other groups
+    old_uuids = set(groups[group_uuid].uuids_basetags)
+    for uuid in old_uuids:
+        if _owners.get(uuid) == group_uuid:
+            del _owners[uuid]
+    for other_uuid, group in groups.items():
+        if other_uuid == group_uuid:
+            continue
+        for uuid in old_uuids & group.uuids_basetags.keys():
+            _set_owner(uuid, other_uuid)
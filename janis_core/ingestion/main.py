@@ -1,21 +1,28 @@
 
 
+from typing import Optional
+
 from janis_core import Tool
 from janis_core import settings
 from janis_core.messages import configure_logging
+from janis_core.utils import profiling
 
 from .SupportedIngestion import SupportedIngestion
-from .galaxy import parse_galaxy
-from .cwl import parse as parse_cwl
-from .wdl import WdlParser
+
+# ingestion backends are imported on first use. 
+# the galaxy stack (galaxy.tools, Cheetah, sqlalchemy), cwl_utils parsers and miniwdl 
+# are expensive to import, and most callers only need a single source format. 
 
 def ingest_galaxy(uri: str) -> Tool:
+    from .galaxy import parse_galaxy
     return parse_galaxy(uri)
 
 def ingest_cwl(path: str) -> Tool:
+    from .cwl import parse as parse_cwl
     return parse_cwl(path)
 
 def ingest_wdl(path: str) -> Tool:
+    from .wdl import WdlParser
     return WdlParser.from_doc(path)
 
 
@@ -31,7 +38,13 @@ def ingest(
     path: str, 
     format: str, 
     build_galaxy_tool_images: bool = False, 
+    cache: Optional[bool] = None,
     ) -> Tool:
+    """
+    ingests the source document at 'path' into a Janis model.
+    cache: reuse the result of a previous ingest of the unchanged document 
+    (default settings.ingest.CACHE, see janis_core.ingestion.cache). 
+    """
     # setup logging
     configure_logging()                         
     
@@ -45,5 +58,11 @@ def ingest(
     # do ingest
     assert(format in SupportedIngestion.all())  # validate format
     ingest_func = ingestor_map[format]          # select ingestor
-    internal = ingest_func(path)                # ingest
-    return internal
\ No newline at end of file
+    use_cache = settings.ingest.CACHE if cache is None else cache
+    with profiling.span('ingest', category='ingest', format=format, path=path):
+        if use_cache:
+            from .cache import cached_ingest
+            internal = cached_ingest(path, format, ingest_func)
+        else:
+            internal = ingest_func(path)        # ingest
+    return internal
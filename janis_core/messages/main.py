@@ -57,10 +57,15 @@ PACKAGE_DIR = (os.path.dirname(os.path.realpath(__file__)))  #the directory wher
 CONFIG_FILE_PATH = f'{PACKAGE_DIR}/config.yaml'
 MESSAGE_LOG_PATH = f'{WORK_DIR}/.janis/messages.log'
 
-def configure_logging() -> None:
+def configure_logging(log_path: Optional[str]=None) -> None:
+    # optionally log messages to a different file from now on (eg one per ingested document)
+    global MESSAGE_LOG_PATH
+    if log_path is not None:
+        MESSAGE_LOG_PATH = log_path
+
     # ensure we create the folder
     if not os.path.exists(os.path.dirname(MESSAGE_LOG_PATH)):
-        os.mkdir(os.path.dirname(MESSAGE_LOG_PATH))
+        os.makedirs(os.path.dirname(MESSAGE_LOG_PATH))
 
     # delete previous log
     path = Path(MESSAGE_LOG_PATH)
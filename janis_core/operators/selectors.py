@@ -10,6 +10,9 @@ from janis_core.utils.logger import Logger
 from janis_core.utils.errors import UnsupportedError
 
 class Selector(ABC):
+    # empty, so subclasses may declare __slots__ (InputNodeSelector, StepOutputSelector)
+    __slots__ = ()
+
     @staticmethod
     def is_selector():
         return True
@@ -337,6 +340,8 @@ class InputSelector(Selector):
 
 
 class InputNodeSelector(Selector):
+    __slots__ = ('input_node',)
+
     def __init__(self, input_node):
         from janis_core.workflow.workflow import InputNode
 
@@ -378,6 +383,8 @@ class InputNodeSelector(Selector):
 
 
 class StepOutputSelector(Selector):
+    __slots__ = ('node', 'tag')
+
     def __init__(self, node, tag):
 
         outputs = node.outputs()
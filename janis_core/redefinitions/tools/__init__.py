@@ -1,28 +1,90 @@
 
 
 
-from .bioinformaticstool import *
-from .fastqc import *
-from .cat import Cat
-from .echo import Echo
-from .bwamem_samtoolsview import BwaMem_SamToolsView
-from .cutadapt import *
-from .gatk4 import *
-from .uncompressarchive import UncompressArchive
-from .bcftools import *
-from .vardict import *
-from .bgzip import *
-from .gridss import *
-from .addbamstats import *
-from .samtools import *
-from .combinevariants import *
-from .generate import *
-from .parse import *
-from .performancesummary import *
-from .bedtoolsgenomecoverage import *
-from .splitmultiallele import *
-from .vcftools import *
-from .strelka import *
-from .manta import *
-from .tabix import *
-from .trimiupac import *
\ No newline at end of file
+"""
+Tool classes are resolved lazily: 'from janis_core.redefinitions.tools import Gatk4SortSam_4_1_2'
+only imports gatk4.py (and whatever it imports), rather than every tool module.
+Names are found by scanning the modules below for top-level definitions.
+"""
+
+import os
+import re
+import importlib
+from typing import Any, Optional
+
+
+# modules in the order they were previously star-imported.
+# a name defined in more than one module resolves to the last.
+_MODULES = [
+    'bioinformaticstool',
+    'fastqc',
+    'cat',
+    'echo',
+    'bwamem_samtoolsview',
+    'cutadapt',
+    'gatk4',
+    'uncompressarchive',
+    'bcftools',
+    'vardict',
+    'bgzip',
+    'gridss',
+    'addbamstats',
+    'samtools',
+    'combinevariants',
+    'generate',
+    'parse',
+    'performancesummary',
+    'bedtoolsgenomecoverage',
+    'splitmultiallele',
+    'vcftools',
+    'strelka',
+    'manta',
+    'tabix',
+    'trimiupac',
+]
+
+_DEFINITION_PATTERN = re.compile(
+    r'^(?:class|def)\s+([A-Za-z]\w*)|^([A-Za-z]\w*)\s*(?::[^=\n]*)?=(?!=)', re.MULTILINE
+)
+
+_index: Optional[dict[str, str]] = None
+
+
+def _name_index() -> dict[str, str]:
+    """public top-level name -> module which defines it"""
+    global _index
+    if _index is None:
+        index: dict[str, str] = {}
+        for module in _MODULES:
+            with open(os.path.join(os.path.dirname(__file__), f'{module}.py'), 'r') as fp:
+                for match in _DEFINITION_PATTERN.finditer(fp.read()):
+                    index[match.group(1) or match.group(2)] = module
+        _index = index
+    return _index
+
+
+def __getattr__(name: str) -> Any:
+    if name == '__all__':
+        return sorted(_name_index())
+    if name.startswith('__'):
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    module = _name_index().get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    else:
+        # not a top-level definition (eg a type a tool module imports): search every module
+        for module in reversed(_MODULES):
+            loaded = importlib.import_module(f'.{module}', __name__)
+            if hasattr(loaded, name):
+                value = getattr(loaded, name)
+                break
+        else:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_name_index()))
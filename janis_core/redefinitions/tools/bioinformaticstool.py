@@ -7,6 +7,8 @@ from janis_core import CommandTool, PythonTool
 BIOINFORMATICS_MODULE = "bioinformatics"
 
 class BioinformaticsTool(CommandTool, ABC):
+    SHARED_DEFINITIONS = True
+
     def tool_module(self):
         return BIOINFORMATICS_MODULE
 
@@ -15,6 +17,8 @@ class BioinformaticsPythonTool(PythonTool, ABC):
         return BIOINFORMATICS_MODULE
     
 class UnixTool(CommandTool, ABC):
+    SHARED_DEFINITIONS = True
+
     def tool_module(self):
         return "unix"
 
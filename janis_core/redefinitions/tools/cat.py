@@ -6,6 +6,8 @@ from janis_core import ToolInput, ToolOutput, Stdout, Array, File, ToolMetadata,
 
 
 class Cat(CommandTool):
+    SHARED_DEFINITIONS = True
+
     def tool_module(self):
         return "unix"
     
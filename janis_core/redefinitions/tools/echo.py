@@ -3,6 +3,7 @@ from janis_core import String, ToolInput, ToolOutput, Stdout, Boolean, ToolMetad
 
 
 class Echo(CommandTool):
+    SHARED_DEFINITIONS = True
 
     def tool_module(self):
         return "unix"
@@ -7,4 +7,5 @@ from . import translate
 from . import testing
 from . import validation
 from . import datatypes
-from . import graph
\ No newline at end of file
+from . import graph
+from . import profiling
\ No newline at end of file
@@ -13,8 +13,12 @@ _GALAXY_DATA_DIR = os.path.join(_JANIS_INSTALL_DIR, 'ingestion', 'data', 'galaxy
 
 GEN_IMAGES = False
 DISABLE_CONTAINER_CACHE = False
+CONTAINER_FETCH_WORKERS = 8
+TOOLSHED_FETCH_WORKERS = 8
+MAX_EXECUTION_PATHS = 10        # realised command lines annotated per galaxy command statement
 GALAXY_CONFIG = f'{_GALAXY_DATA_DIR}/galaxy_config.yaml'
 DATATYPES_YAML = f'{_INGEST_DATA_DIR}/janis_types.yaml'
 CONTAINER_CACHE = f'{_JANIS_DATA_DIR}/galaxy_containers/cache.json'
 WRAPPER_CACHE = f'{_JANIS_DATA_DIR}/galaxy_wrappers/cache.json'   
 DOWNLOADED_WRAPPERS_DIR = f'{_JANIS_DATA_DIR}/galaxy_wrappers'
+WRAPPER_ARCHIVE_EXCLUDED_DIRS = ('test-data',)  # not extracted from downloaded wrapper archives
@@ -1,3 +1,11 @@
 
+import os
+
 SOURCE: str = ''        # ingest source: one of 'galaxy' | 'cwl' | 'wdl'
 SAFE_MODE: bool = True  # master controller for whether exceptions halt program, or are handled. 
+
+# ingest cache (see janis_core.ingestion.cache)
+CACHE: bool = False                                             # reuse ingest() results for unchanged source documents
+CACHE_DIR: str = os.path.join(os.getcwd(), '.janis', 'ingest_cache')
+CACHE_MAX_SIZE_MB: int = 512                                    # least recently used entries are evicted beyond this size
+CACHE_MAX_AGE_DAYS: int = 30                                    # entries unused for this long are evicted
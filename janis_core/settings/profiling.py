@@ -0,0 +1,10 @@
+
+
+from typing import Optional
+
+
+ENABLED:            bool = False            # whether ingest() / translate() record phase spans (see janis_core.utils.profiling)
+CPROFILE_PHASE:     Optional[str] = None    # span name to capture under cProfile, eg 'translate_workflow_internal' or 'galaxy.tool'.
+                                            # works independently of ENABLED. repeated spans accumulate into one profile.
+CPROFILE_PATH:      Optional[str] = None    # file to dump pstats to when a CPROFILE_PHASE span finishes. 
+                                            # stats are also kept in memory (profiling.cprofile_stats())
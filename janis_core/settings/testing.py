@@ -1,3 +1,4 @@
 
 
-TESTING_USE_DEFAULT_CONTAINER: bool = False
\ No newline at end of file
+TESTING_USE_DEFAULT_CONTAINER: bool = False
+TEST_SUITE_WORKERS: int = 4              # how many test cases ToolTestSuiteRunner.run_test_cases() runs concurrently
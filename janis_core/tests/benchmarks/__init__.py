@@ -0,0 +1,27 @@
+"""
+Translation benchmark suite over the bundled test corpus.
+Times every ingest source x translate dest pair per phase, records peak memory
+and object counts, and compares against JSON baselines to flag regressions.
+
+baselines.json (committed) holds each case's status & workflow size. Timings and memory
+depend on the machine, so are kept in baselines.local.json (not committed): run with
+--update on a machine before using it to check for performance regressions.
+
+    python -m janis_core.tests.benchmarks               # run & compare against baselines
+    python -m janis_core.tests.benchmarks --update      # run & record new baselines
+    python -m janis_core.tests.benchmarks --memory-builds 1000     # bytes per node of 1000 live workflows
+    python -m janis_core.tests.benchmarks --epaths      # galaxy ExecutionPath generation for bundled wrappers
+"""
+
+from .corpus import BenchmarkSource
+from .corpus import SOURCES
+from .corpus import TRANSLATE_DESTS
+from .corpus import EPATH_WRAPPERS
+from .harness import PHASES
+from .harness import run_benchmarks
+from .harness import run_case
+from .harness import measure_build_memory
+from .harness import measure_execution_paths
+from .harness import load_baselines
+from .harness import save_baselines
+from .harness import find_regressions
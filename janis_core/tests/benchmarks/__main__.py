@@ -0,0 +1,69 @@
+
+import os
+import sys
+import argparse
+
+from .corpus import SOURCES, TRANSLATE_DESTS
+from .harness import (
+    BASELINES_PATH,
+    LOCAL_BASELINES_PATH,
+    DEFAULT_TOLERANCE,
+    DEFAULT_MEMORY_WORKFLOW,
+    run_benchmarks,
+    measure_build_memory,
+    measure_execution_paths,
+    load_baselines,
+    save_baselines,
+    find_regressions,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m janis_core.tests.benchmarks')
+    parser.add_argument('--source', action='append', help='only run sources of this format (repeatable)')
+    parser.add_argument('--dest', action='append', choices=TRANSLATE_DESTS, help='only translate to this dest (repeatable)')
+    parser.add_argument('--baselines', default=BASELINES_PATH, help='baseline json file (statuses)')
+    parser.add_argument('--local-baselines', default=LOCAL_BASELINES_PATH, help='baseline json file for this machine (timings & memory)')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='allowed relative slowdown before flagging')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--memory-builds', type=int, metavar='N', help='only build the memory workflow N times and report bytes per node')
+    parser.add_argument('--memory-workflow', default=DEFAULT_MEMORY_WORKFLOW, help="janis workflow for --memory-builds ('module:ClassName')")
+    parser.add_argument('--epaths', action='store_true', help='only time galaxy ExecutionPath generation for the bundled tool wrappers')
+    parser.add_argument('--update', action='store_true', help='record results as the new baselines')
+    args = parser.parse_args()
+
+    if args.memory_builds:
+        memory = measure_build_memory(args.memory_builds, args.memory_workflow)
+        print(f'{memory.name} x{memory.builds}: {memory.nodes} nodes')
+        print(f'  live      {memory.live_bytes // 1024} KB ({memory.bytes_per_node:.0f} bytes/node, {memory.bytes_per_build:.0f} bytes/build)')
+        print(f'  retained  {memory.retained_bytes // 1024} KB after release')
+        return 0
+
+    if args.epaths:
+        for name, epaths in measure_execution_paths().items():
+            print(f'{name}: {epaths.statements} statements, {epaths.paths} paths, {epaths.positions} positions ({epaths.distinct_tokens} distinct tokens)')
+            print(f'  {epaths.seconds * 1000:.2f} ms')
+        return 0
+
+    sources = [s for s in SOURCES if not args.source or s.format in args.source]
+    results = run_benchmarks(sources, args.dest, memory=not args.no_memory)
+    for name, result in results.items():
+        print(f'{result.status:11} {result.total_seconds:8.3f}s  {name}')
+        if result.error:
+            print(f'            {result.error}')
+
+    if args.update:
+        save_baselines(results, args.baselines, args.local_baselines)
+        print(f'baselines written to {args.baselines} and {args.local_baselines}')
+        return 0
+
+    if not os.path.exists(args.local_baselines):
+        print(f'no timing baselines for this machine at {args.local_baselines} (run with --update first): only comparing statuses')
+    regressions = find_regressions(results, load_baselines(args.baselines, args.local_baselines), args.tolerance)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
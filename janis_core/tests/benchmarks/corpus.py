@@ -0,0 +1,70 @@
+
+
+import os
+from dataclasses import dataclass
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+TRANSLATE_DESTS = ['cwl', 'nextflow', 'wdl']
+
+
+@dataclass
+class BenchmarkSource:
+    """
+    a workflow from the bundled test corpus.
+    'path' is relative to janis_core/tests/data, except for 'janis' sources,
+    where it is a 'module:ClassName' import path.
+    """
+    format: str
+    path: str
+
+    @property
+    def uri(self) -> str:
+        if self.format == 'janis':
+            return self.path
+        return os.path.join(DATA_DIR, self.path)
+
+    @property
+    def available(self) -> bool:
+        if self.format == 'janis':
+            return True
+        return os.path.exists(self.uri)
+
+
+SOURCES: list[BenchmarkSource] = [
+    # cwl
+    BenchmarkSource('cwl', 'cwl/workflows/analysis-workflows/subworkflows/align_sort_markdup.cwl'),
+    BenchmarkSource('cwl', 'cwl/workflows/kf-somatic-workflow/workflow/kfdrc_production_manta_wf.cwl'),
+    BenchmarkSource('cwl', 'cwl/workflows/ebi-metagenomics/workflows/amplicon-wf--v.5-cond.cwl'),
+    BenchmarkSource('cwl', 'cwl/workflows/ebi-metagenomics/workflows/assembly-wf--v.5-cond.cwl'),
+    BenchmarkSource('cwl', 'cwl/workflows/m-unlock/workflows/ngtax.cwl'),
+    BenchmarkSource('cwl', 'cwl/workflows/m-unlock/workflows/metagenomics_GEM.cwl'),
+
+    # galaxy (wrappers are read from the local wrapper cache or downloaded)
+    BenchmarkSource('galaxy', 'galaxy/fastqc_wf.ga'),
+    BenchmarkSource('galaxy', 'galaxy/cutadapt_wf.ga'),
+    BenchmarkSource('galaxy', 'galaxy/nanoplot_wf.ga'),
+    BenchmarkSource('galaxy', 'galaxy/unicycler_assembly.ga'),
+    BenchmarkSource('galaxy', 'galaxy/rna_seq_reads_to_counts.ga'),
+
+    # wdl
+    BenchmarkSource('wdl', 'wdl/Reads2Map/pipelines/PreprocessingReads/PreprocessingReads.wdl'),
+    BenchmarkSource('wdl', 'wdl/somatic_wf.wdl'),
+    BenchmarkSource('wdl', 'wdl/Multisample_jointgt_GATK4.wdl'),
+
+    # janis redefinitions
+    BenchmarkSource('janis', 'janis_core.redefinitions.workflows:WGSGermlineMultiCallers'),
+
+    # synthetic
+    BenchmarkSource('janis', 'janis_core.tests.benchmarks.synthetic:ScatterHeavyWorkflow'),
+    BenchmarkSource('janis', 'janis_core.tests.benchmarks.synthetic:NestedSubworkflowsWorkflow'),
+]
+
+
+# galaxy tool wrappers for the execution path benchmark.
+# paths are relative to janis_core/tests/data. wrappers which are not bundled are
+# looked up in settings.ingest.galaxy.DOWNLOADED_WRAPPERS_DIR ('<repo>-<revision>/<file>').
+EPATH_WRAPPERS: dict[str, str] = {
+    'hisat2': 'galaxy/hisat2-6c19daec423d/hisat2.xml',
+    'cutadapt': 'cutadapt/cutadapt.xml',
+}
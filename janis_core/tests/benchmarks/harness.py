@@ -0,0 +1,485 @@
+
+
+import os
+import io
+import gc
+import glob
+import json
+import time
+import shutil
+import tempfile
+import tracemalloc
+import importlib
+import contextlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import requests
+import bioblend
+
+from janis_core import settings
+from janis_core import Tool, WorkflowBase, WorkflowBuilder
+from janis_core.utils.logger import Logger
+from janis_core.translation_deps.exportpath import ExportPathKeywords
+
+from .corpus import BenchmarkSource, SOURCES, TRANSLATE_DESTS, DATA_DIR, EPATH_WRAPPERS
+
+
+PHASES = ['ingest', 'to_builders', 'prune_workflow', 'translate', 'stringify', 'write']
+# statuses & workflow sizes, which are the same on any machine (committed)
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'baselines.json')
+# timings & memory, which are only comparable on the machine which recorded them (not committed)
+LOCAL_BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'baselines.local.json')
+
+# results which are compared against & saved as baselines
+RECORDED_STATUSES = ('ok', 'error')
+# failures to reach a network resource (eg galaxy toolshed) rather than of janis itself
+UNAVAILABLE_ERRORS = (
+    requests.exceptions.RequestException,
+    bioblend.ConnectionError,
+    ConnectionError,
+    TimeoutError,
+)
+
+# a phase is only flagged if it is both relatively and absolutely slower / larger
+DEFAULT_TOLERANCE = 0.25
+MIN_SECONDS_DELTA = 0.05
+MIN_PEAK_KB_DELTA = 1024
+
+
+@dataclass
+class PhaseResult:
+    seconds: float = 0.0
+    peak_kb: Optional[int] = None
+    objects: Optional[int] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'seconds': round(self.seconds, 4), 'peak_kb': self.peak_kb, 'objects': self.objects}
+
+
+@dataclass
+class CaseResult:
+    """
+    status is 'ok', 'error', 'missing' (source not in the corpus), or 'unavailable' 
+    (a network resource, eg a galaxy tool wrapper, couldn't be fetched).
+    """
+    name: str
+    status: str = 'ok'
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    nodes: Optional[int] = None         # of the ingested workflow, including subworkflows
+    phases: dict[str, PhaseResult] = field(default_factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(p.seconds for p in self.phases.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'status': self.status,
+            'error': self.error,
+            'nodes': self.nodes,
+            'total_seconds': round(self.total_seconds, 4),
+            'phases': {name: p.to_dict() for name, p in self.phases.items()},
+        }
+
+    def to_baseline_dict(self) -> dict[str, Any]:
+        # error messages can hold object addresses etc, so only the exception type is recorded
+        return {'status': self.status, 'error': self.error_type, 'nodes': self.nodes}
+
+    def to_local_baseline_dict(self) -> dict[str, Any]:
+        return {'total_seconds': round(self.total_seconds, 4), 'phases': {name: p.to_dict() for name, p in self.phases.items()}}
+
+
+@dataclass
+class BuildMemoryResult:
+    """memory held by 'builds' live copies of a janis workflow, and what remains once they are released"""
+    name: str
+    builds: int
+    nodes: int
+    live_bytes: int
+    retained_bytes: int
+
+    @property
+    def bytes_per_node(self) -> float:
+        return self.live_bytes / self.nodes if self.nodes else 0.0
+
+    @property
+    def bytes_per_build(self) -> float:
+        return self.live_bytes / self.builds if self.builds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'builds': self.builds,
+            'nodes': self.nodes,
+            'live_kb': self.live_bytes // 1024,
+            'retained_kb': self.retained_bytes // 1024,
+            'bytes_per_node': round(self.bytes_per_node),
+            'bytes_per_build': round(self.bytes_per_build),
+        }
+
+
+@dataclass
+class Regression:
+    case: str
+    phase: str
+    metric: str
+    baseline: Any
+    current: Any
+
+    def __str__(self) -> str:
+        return f'{self.case} [{self.phase}] {self.metric}: {self.baseline} -> {self.current}'
+
+
+### RUNNING
+
+@dataclass
+class ExecutionPathResult:
+    """ExecutionPath generation for every command statement of a galaxy tool wrapper"""
+    name: str
+    statements: int
+    paths: int
+    positions: int
+    distinct_tokens: int
+    seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'statements': self.statements,
+            'paths': self.paths,
+            'positions': self.positions,
+            'distinct_tokens': self.distinct_tokens,
+            'seconds': round(self.seconds, 4),
+        }
+
+
+def case_name(source: BenchmarkSource, dest: str) -> str:
+    return f'{source.format}:{source.path}->{dest}'
+
+def run_benchmarks(
+    sources: Optional[list[BenchmarkSource]]=None,
+    dests: Optional[list[str]]=None,
+    memory: bool=True,
+) -> dict[str, CaseResult]:
+    """runs every (source, dest) pair. sources missing from the corpus are recorded as 'missing'."""
+    sources = sources if sources is not None else SOURCES
+    dests = dests if dests is not None else TRANSLATE_DESTS
+    results: dict[str, CaseResult] = {}
+    for source in sources:
+        for dest in dests:
+            name = case_name(source, dest)
+            if not source.available:
+                results[name] = CaseResult(name, status='missing')
+                continue
+            results[name] = run_case(source, dest, memory=memory)
+    return results
+
+def run_case(source: BenchmarkSource, dest: str, memory: bool=True) -> CaseResult:
+    """
+    runs a single ingest -> translate case.
+    timings are taken on a clean pass; if 'memory', a second pass under tracemalloc
+    records per-phase peak memory and gc object counts (tracemalloc would distort timings).
+    """
+    result = CaseResult(case_name(source, dest))
+    try:
+        with tempfile.TemporaryDirectory() as outdir, _quiet():
+            for phase, seconds in _run_phases(source, dest, outdir, _timed, result):
+                result.phases[phase] = PhaseResult(seconds=seconds)
+            if memory:
+                for phase, (peak_kb, objects) in _run_phases(source, dest, outdir, _traced, result):
+                    result.phases[phase].peak_kb = peak_kb
+                    result.phases[phase].objects = objects
+    except Exception as e:
+        result.status = 'unavailable' if isinstance(e, UNAVAILABLE_ERRORS) else 'error'
+        result.error = f'{type(e).__name__}: {e}'
+        result.error_type = type(e).__name__
+    return result
+
+def _run_phases(
+    source: BenchmarkSource,
+    dest: str,
+    outdir: str,
+    measure: Callable[[Callable[[], Any]], tuple[Any, Any]],
+    result: CaseResult,
+) -> list[tuple[str, Any]]:
+    from janis_core.translations import get_translator
+    from janis_core.translations.common import to_builders, prune_workflow
+    _reset_state(dest, outdir)
+    out: list[tuple[str, Any]] = []
+
+    entity, metric = measure(lambda: _ingest(source))
+    out.append(('ingest', metric))
+    if not isinstance(entity, WorkflowBase):
+        raise RuntimeError(f'{source.path} is not a workflow')
+    result.nodes = _count_nodes(entity)
+
+    entity, metric = measure(lambda: to_builders(entity))
+    out.append(('to_builders', metric))
+
+    def prune() -> None:
+        if settings.translate.MODE in ['skeleton', 'regular'] and isinstance(entity, WorkflowBuilder):
+            prune_workflow(entity)
+    _, metric = measure(prune)
+    out.append(('prune_workflow', metric))
+
+    translator = get_translator(dest)
+    translator.basedir = ExportPathKeywords.resolve(
+        settings.translate.EXPORT_PATH, workflow_spec=translator.name, workflow_name=entity.versioned_id()
+    )
+    def translate() -> tuple[Any, Any, Any, Any]:
+        tr_workflow, tr_tools = translator.translate_workflow_internal(entity)
+        tr_helpers = translator.translate_helper_files(entity)
+        tr_inp = translator.build_inputs_dict(entity)
+        return tr_workflow, tr_tools, tr_helpers, tr_inp
+    (tr_workflow, tr_tools, tr_helpers, tr_inp), metric = measure(translate)
+    out.append(('translate', metric))
+
+    def stringify() -> dict[str, str]:
+        files = {translator.workflow_filename(entity): translator.stringify_translated_workflow(tr_workflow)}
+        for t in tr_tools:
+            path = os.path.join(translator.DIR_TOOLS, translator.tool_filename(t))
+            files[path] = translator.stringify_translated_workflow(tr_tools[t])
+        for filename, contents in tr_helpers.items():
+            files[os.path.join(translator.DIR_FILES, filename)] = contents
+        files[translator.inputs_filename(entity)] = translator.stringify_translated_inputs(tr_inp)
+        return files
+    files, metric = measure(stringify)
+    out.append(('stringify', metric))
+
+    def write() -> None:
+        basedir = os.path.join(outdir, dest)
+        for path, contents in files.items():
+            path = os.path.join(basedir, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as fp:
+                fp.write(contents if isinstance(contents, str) else str(contents))
+        shutil.rmtree(basedir)
+    _, metric = measure(write)
+    out.append(('write', metric))
+    return out
+
+DEFAULT_MEMORY_WORKFLOW = 'janis_core.redefinitions.workflows:WGSGermlineMultiCallers'
+
+def measure_build_memory(builds: int=1000, path: str=DEFAULT_MEMORY_WORKFLOW) -> BuildMemoryResult:
+    """
+    builds the janis workflow at 'path' ('module:ClassName') 'builds' times and keeps every copy alive.
+    live_bytes is the traced memory held by those copies. retained_bytes is what is still held
+    after they are released (should be close to 0).
+    """
+    module, classname = path.split(':')
+    cls = getattr(importlib.import_module(module), classname)
+    with _quiet():
+        cls()   # warm up: imports, registries & other one-off allocations
+        gc.collect()
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            workflows = [cls() for _ in range(builds)]
+            gc.collect()
+            live = tracemalloc.get_traced_memory()[0] - base
+            nodes = sum(_count_nodes(wf) for wf in workflows)
+            del workflows
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0] - base
+        finally:
+            tracemalloc.stop()
+    return BuildMemoryResult(path, builds, nodes, live, max(retained, 0))
+
+def measure_execution_paths(
+    wrappers: Optional[dict[str, str]]=None,
+    repeats: int=20
+    ) -> dict[str, ExecutionPathResult]:
+    """
+    generates the ExecutionPaths of each command statement in each galaxy tool wrapper
+    ('name' -> xml path, default EPATH_WRAPPERS) 'repeats' times.
+    positions is the number of positions across all paths, distinct_tokens the number
+    of token objects they refer to. wrappers which can't be found are skipped.
+    """
+    from janis_core.ingestion.galaxy import datatypes
+    from janis_core.ingestion.galaxy import runtime
+    from janis_core.ingestion.galaxy.gxworkflow import get_step_context
+    from janis_core.ingestion.galaxy.gxtool.command.loading import load_vanilla_command_str
+    from janis_core.ingestion.galaxy.gxtool.command.cmdstr.generate import gen_command_string
+    from janis_core.ingestion.galaxy.gxtool.command.cmdstr.CommandString import CommandStringSource
+
+    out: dict[str, ExecutionPathResult] = {}
+    for name, relpath in (wrappers if wrappers is not None else EPATH_WRAPPERS).items():
+        path = _find_wrapper(relpath)
+        if path is None:
+            continue
+        with _quiet():
+            datatypes.populate()
+            runtime.tool.tool_path = path
+            xmltool = get_step_context(None, tool_path=path).xmltool
+            text = load_vanilla_command_str(xmltool)
+            cmdstr = gen_command_string(source=CommandStringSource.XML, text=text, xmltool=xmltool)
+        statements = cmdstr.preprocessing + [cmdstr.main] + cmdstr.postprocessing
+        
+        start = time.perf_counter()
+        for _ in range(repeats):
+            epaths = [epath for stmt in statements for epath in stmt.get_execution_paths()]
+        seconds = (time.perf_counter() - start) / repeats
+        
+        positions = [pos for epath in epaths for pos in epath.positions]
+        out[name] = ExecutionPathResult(
+            name=name,
+            statements=len(statements),
+            paths=len(epaths),
+            positions=len(positions),
+            distinct_tokens=len({id(pos.token) for pos in positions}),
+            seconds=seconds,
+        )
+    return out
+
+def _find_wrapper(relpath: str) -> Optional[str]:
+    path = os.path.join(DATA_DIR, relpath)
+    if os.path.exists(path):
+        return path
+    repo, filename = relpath.split('/', 1)
+    downloads = settings.ingest.galaxy.DOWNLOADED_WRAPPERS_DIR
+    matches = sorted(glob.glob(os.path.join(downloads, f'{repo}-*', filename)))
+    return matches[-1] if matches else None
+
+def _count_nodes(workflow: WorkflowBase) -> int:
+    # nodes of the workflow and all nested subworkflows
+    count = len(workflow.nodes)
+    for step in workflow.step_nodes.values():
+        if isinstance(step.tool, WorkflowBase):
+            count += _count_nodes(step.tool)
+    return count
+
+def _ingest(source: BenchmarkSource) -> Tool:
+    if source.format == 'janis':
+        module, classname = source.path.split(':')
+        return getattr(importlib.import_module(module), classname)()
+    from janis_core.ingestion import ingest
+    return ingest(source.uri, source.format)
+
+def _timed(func: Callable[[], Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - start
+
+def _traced(func: Callable[[], Any]) -> tuple[Any, tuple[int, int]]:
+    tracemalloc.start()
+    try:
+        value = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return value, (peak // 1024, len(gc.get_objects()))
+
+def _reset_state(dest: str, outdir: str) -> None:
+    # the permissive ingest settings the translation tests run under,
+    # the settings translate() applies, and a clean slate for backend module-level registers
+    settings.ingest.SAFE_MODE = False
+    settings.ingest.galaxy.GEN_IMAGES = False
+    settings.ingest.cwl.INGEST_JAVASCRIPT_EXPRESSIONS = True
+    settings.ingest.cwl.REQUIRE_CWL_VERSION = False
+    settings.datatypes.ALLOW_UNPARSEABLE_DATATYPES = True
+    settings.graph.ALLOW_UNKNOWN_SOURCE = True
+    settings.graph.ALLOW_UNKNOWN_SCATTER_FIELDS = True
+    settings.graph.ALLOW_INCORRECT_NUMBER_OF_SOURCES = True
+    settings.graph.ALLOW_NON_ARRAY_SCATTER_INPUT = True
+    settings.graph.ALLOW_INCOMPATIBLE_TYPES = True
+    settings.translate.DEST = dest
+    settings.translate.TO_DISK = False
+    settings.translate.TO_CONSOLE = False
+    settings.translate.EXPORT_PATH = outdir
+    settings.validation.STRICT_IDENTIFIERS = False
+    settings.validation.VALIDATE_STRINGFORMATTERS = False
+    if dest == 'nextflow':
+        from janis_core.translations import nextflow
+        nextflow.task_inputs.clear()
+        nextflow.params.clear()
+        nextflow.naming.table.clear()
+
+@contextlib.contextmanager
+def _quiet():
+    Logger.mute()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            yield
+    finally:
+        Logger.unmute()
+
+
+### BASELINES
+
+def results_to_dict(results: dict[str, CaseResult]) -> dict[str, Any]:
+    return {'version': 1, 'cases': {name: r.to_dict() for name, r in sorted(results.items())}}
+
+def load_baselines(path: str=BASELINES_PATH, local_path: Optional[str]=LOCAL_BASELINES_PATH) -> dict[str, Any]:
+    """
+    statuses from 'path', with the timings & memory recorded on this machine (at 'local_path')
+    added to the cases they were recorded for. without local baselines, only statuses are compared.
+    """
+    baselines = _read_baselines(path)
+    local = _read_baselines(local_path) if local_path else {'cases': {}}
+    for name, case in baselines['cases'].items():
+        case.update(local['cases'].get(name, {}))
+    return baselines
+
+def save_baselines(
+    results: dict[str, CaseResult],
+    path: str=BASELINES_PATH,
+    local_path: Optional[str]=LOCAL_BASELINES_PATH
+) -> None:
+    """
+    merges results into the baseline files: statuses into 'path', timings & memory into 'local_path'.
+    cases not run this time are kept.
+    missing & unavailable cases say nothing about performance, so aren't recorded.
+    """
+    _update_baselines(results, path, CaseResult.to_baseline_dict)
+    if local_path:
+        _update_baselines(results, local_path, CaseResult.to_local_baseline_dict)
+
+def _read_baselines(path: str) -> dict[str, Any]:
+    if not os.path.exists(path):
+        return {'version': 1, 'cases': {}}
+    with open(path, 'r') as fp:
+        return json.load(fp)
+
+def _update_baselines(results: dict[str, CaseResult], path: str, to_dict: Callable[[CaseResult], dict[str, Any]]) -> None:
+    baselines = _read_baselines(path)
+    for name, result in results.items():
+        if result.status in RECORDED_STATUSES:
+            baselines['cases'][name] = to_dict(result)
+        else:
+            baselines['cases'].pop(name, None)
+    baselines['cases'] = dict(sorted(baselines['cases'].items()))
+    with open(path, 'w') as fp:
+        json.dump(baselines, fp, indent=2)
+        fp.write('\n')
+
+def find_regressions(
+    results: dict[str, CaseResult],
+    baselines: dict[str, Any],
+    tolerance: float=DEFAULT_TOLERANCE
+) -> list[Regression]:
+    """
+    compares results against baselines. purely offline: a case regresses if it used to
+    succeed and now doesn't, or a phase is slower / uses more memory beyond tolerance
+    (only for cases with local baselines, see load_baselines).
+    """
+    out: list[Regression] = []
+    for name, result in results.items():
+        base = baselines['cases'].get(name)
+        if base is None or base['status'] != 'ok' or result.status not in RECORDED_STATUSES:
+            continue
+        if result.status != 'ok':
+            out.append(Regression(name, '*', 'status', base['status'], result.status))
+            continue
+        for phase, current in result.phases.items():
+            base_phase = base.get('phases', {}).get(phase)
+            if base_phase is None:
+                continue
+            if _regressed(base_phase['seconds'], current.seconds, tolerance, MIN_SECONDS_DELTA):
+                out.append(Regression(name, phase, 'seconds', base_phase['seconds'], round(current.seconds, 4)))
+            if current.peak_kb is not None and base_phase.get('peak_kb') is not None:
+                if _regressed(base_phase['peak_kb'], current.peak_kb, tolerance, MIN_PEAK_KB_DELTA):
+                    out.append(Regression(name, phase, 'peak_kb', base_phase['peak_kb'], current.peak_kb))
+    return out
+
+def _regressed(baseline: float, current: float, tolerance: float, min_delta: float) -> bool:
+    return current > baseline * (1 + tolerance) and current - baseline > min_delta
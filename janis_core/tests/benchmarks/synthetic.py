@@ -0,0 +1,83 @@
+"""
+synthetic workflows for stressing specific translation phases.
+these are 'janis' benchmark sources, so are referenced as 'module:ClassName'.
+"""
+
+from janis_core import Workflow, WorkflowBuilder, CommandToolBuilder, ToolInput, ToolOutput
+from janis_core.types import Array, File, Int, Stdout
+from janis_core.tests.testtools.basics import FileTestTool, ResourcesTestTool
+
+
+class ScatterHeavyWorkflow(Workflow):
+    """
+    300 scattered steps chained in sequence, alternating between two tools.
+    every step gets its own tool instance, so each distinct tool should only
+    be converted once during to_builders().
+    """
+    NUM_STEPS = 300
+
+    def id(self) -> str:
+        return "ScatterHeavyWorkflow"
+
+    def friendly_name(self):
+        return "Scatter heavy workflow"
+
+    def constructor(self):
+        self.input('inFiles', Array(File))
+        self.input('threads', Int)
+
+        source = self.inFiles
+        for i in range(self.NUM_STEPS):
+            if i % 2 == 0:
+                tool = FileTestTool(inp=source)
+            else:
+                tool = ResourcesTestTool(inp=source, threads=self.threads)
+            step = self.step(f"stp{i}", tool, scatter="inp")
+            source = step.out
+
+        self.output("outFiles", source=source)
+
+
+class NestedSubworkflowsWorkflow(Workflow):
+    """
+    NUM_SUBWORKFLOWS sibling subworkflows, each with its own tools and an inner
+    subworkflow (an nf-core style port: many independent subworkflow files).
+    """
+    NUM_SUBWORKFLOWS = 24
+    STEPS_PER_SUBWORKFLOW = 4
+
+    def id(self) -> str:
+        return "NestedSubworkflowsWorkflow"
+
+    def friendly_name(self):
+        return "Nested subworkflows workflow"
+
+    def constructor(self):
+        self.input('inFile', File)
+        for i in range(self.NUM_SUBWORKFLOWS):
+            self.step(f"sub{i}", self.subworkflow(f"sub{i}")(inp=self.inFile))
+            self.output(f"out{i}", source=self[f"sub{i}"].out)
+
+    def subworkflow(self, name: str, inner: bool=False) -> WorkflowBuilder:
+        wf = WorkflowBuilder(name)
+        wf.input('inp', File)
+        source = wf.inp
+        for j in range(self.STEPS_PER_SUBWORKFLOW):
+            step = wf.step(f"stp{j}", _cat_tool(f"{name}_tool{j}")(inp=source))
+            source = step.out
+        if not inner:
+            step = wf.step("inner", self.subworkflow(f"{name}_inner", inner=True)(inp=source))
+            source = step.out
+        wf.output('out', source=source)
+        return wf
+
+
+def _cat_tool(name: str) -> CommandToolBuilder:
+    return CommandToolBuilder(
+        tool=name,
+        base_command=["cat"],
+        inputs=[ToolInput("inp", File, position=1)],
+        outputs=[ToolOutput("out", Stdout)],
+        container="ubuntu:latest",
+        version="TEST",
+    )
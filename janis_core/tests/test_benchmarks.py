@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+
+from janis_core.tests.benchmarks import BenchmarkSource
+from janis_core.tests.benchmarks import PHASES
+from janis_core.tests.benchmarks import run_case
+from janis_core.tests.benchmarks import run_benchmarks
+from janis_core.tests.benchmarks import load_baselines
+from janis_core.tests.benchmarks import save_baselines
+from janis_core.tests.benchmarks import find_regressions
+from janis_core.tests.benchmarks import measure_build_memory
+from janis_core.tests.benchmarks import measure_execution_paths
+from janis_core.tests.benchmarks.harness import CaseResult, PhaseResult
+
+
+NGTAX = BenchmarkSource('cwl', 'cwl/workflows/m-unlock/workflows/ngtax.cwl')
+
+
+def _result(name: str, seconds: float, peak_kb: int=100, status: str='ok') -> CaseResult:
+    result = CaseResult(name, status=status)
+    if status == 'ok':
+        result.phases = {phase: PhaseResult(seconds=seconds, peak_kb=peak_kb, objects=0) for phase in PHASES}
+    return result
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+
+    def test_run_case(self) -> None:
+        result = run_case(NGTAX, 'nextflow')
+        self.assertEqual(result.status, 'ok', result.error)
+        self.assertEqual(list(result.phases), PHASES)
+        self.assertGreater(result.nodes, 0)
+        for phase in result.phases.values():
+            self.assertIsNotNone(phase.peak_kb)
+            self.assertIsNotNone(phase.objects)
+
+    def test_missing_source(self) -> None:
+        source = BenchmarkSource('cwl', 'cwl/workflows/does_not_exist.cwl')
+        results = run_benchmarks([source], ['cwl', 'wdl'], memory=False)
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(r.status == 'missing' for r in results.values()))
+
+    def test_build_memory(self) -> None:
+        result = measure_build_memory(2, 'janis_core.tests.testworkflows.subworkflow:SubworkflowTestWF')
+        self.assertEqual(result.builds, 2)
+        self.assertGreater(result.nodes, 0)
+        self.assertGreater(result.bytes_per_node, 0)
+        self.assertLess(result.retained_bytes, result.live_bytes)
+
+    def test_execution_paths(self) -> None:
+        results = measure_execution_paths({'hisat2': 'galaxy/hisat2-6c19daec423d/hisat2.xml', 'missing': 'missing/missing.xml'}, repeats=1)
+        self.assertEqual(list(results), ['hisat2'])
+        result = results['hisat2']
+        self.assertGreater(result.paths, result.statements)
+        # tokens are shared between paths
+        self.assertLess(result.distinct_tokens, result.positions)
+
+    def test_baselines_roundtrip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'baselines.json')
+            local_path = os.path.join(tmpdir, 'baselines.local.json')
+            save_baselines({'a': _result('a', 1.0)}, path, local_path)
+            save_baselines({'b': _result('b', 2.0)}, path, local_path)
+            baselines = load_baselines(path, local_path)
+            # timings are only kept for this machine
+            portable = load_baselines(path, None)
+        self.assertEqual(list(baselines['cases']), ['a', 'b'])
+        self.assertEqual(baselines['cases']['a']['phases']['ingest']['seconds'], 1.0)
+        self.assertEqual(portable['cases']['a'], {'status': 'ok', 'error': None, 'nodes': None})
+
+    def test_baselines_failures(self) -> None:
+        broken = _result('broken', 0, status='error')
+        broken.error, broken.error_type = 'NotImplementedError: <Edge object at 0x7fa525c52710>', 'NotImplementedError'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'baselines.json')
+            local_path = os.path.join(tmpdir, 'baselines.local.json')
+            save_baselines({'a': _result('a', 1.0), 'broken': broken}, path, local_path)
+            # unavailable (eg offline) & missing cases aren't recorded, and replace earlier records
+            save_baselines({'a': _result('a', 0, status='unavailable'), 'gone': _result('gone', 0, status='missing')}, path, local_path)
+            baselines = load_baselines(path, local_path)
+        self.assertEqual(list(baselines['cases']), ['broken'])
+        self.assertEqual(baselines['cases']['broken']['error'], 'NotImplementedError')
+
+
+class TestFindRegressions(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.baselines = {'version': 1, 'cases': {
+            'ok': _result('ok', 1.0).to_dict(),
+            'broken': _result('broken', 0, status='error').to_dict(),
+        }}
+
+    def test_within_tolerance(self) -> None:
+        results = {'ok': _result('ok', 1.2)}
+        self.assertEqual(find_regressions(results, self.baselines, tolerance=0.25), [])
+
+    def test_slower(self) -> None:
+        results = {'ok': _result('ok', 2.0)}
+        regressions = find_regressions(results, self.baselines, tolerance=0.25)
+        self.assertEqual(len(regressions), len(PHASES))
+        self.assertTrue(all(r.metric == 'seconds' for r in regressions))
+
+    def test_more_memory(self) -> None:
+        results = {'ok': _result('ok', 1.0, peak_kb=10000)}
+        regressions = find_regressions(results, self.baselines, tolerance=0.25)
+        self.assertTrue(all(r.metric == 'peak_kb' for r in regressions))
+        self.assertEqual(len(regressions), len(PHASES))
+
+    def test_status(self) -> None:
+        results = {'ok': _result('ok', 0, status='error'), 'broken': _result('broken', 0, status='error')}
+        regressions = find_regressions(results, self.baselines)
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0].metric, 'status')
+
+    def test_status_only(self) -> None:
+        # without timings recorded on this machine, only statuses are compared
+        baselines = {'version': 1, 'cases': {'ok': _result('ok', 1.0).to_baseline_dict()}}
+        results = {'ok': _result('ok', 100.0, peak_kb=100000)}
+        self.assertEqual(find_regressions(results, baselines), [])
+
+    def test_unavailable_ignored(self) -> None:
+        results = {'ok': _result('ok', 0, status='unavailable')}
+        self.assertEqual(find_regressions(results, self.baselines), [])
+
+    def test_unknown_cases_ignored(self) -> None:
+        results = {'new': _result('new', 100.0)}
+        self.assertEqual(find_regressions(results, self.baselines), [])
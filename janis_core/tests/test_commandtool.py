@@ -1,6 +1,37 @@
 import unittest
+from janis_core import CommandTool, ToolInput, ToolOutput, String, Stdout
 from janis_core.tool.documentation import InputQualityType
 from janis_core.tests.testtools import InputQualityTestTool
+from janis_core.redefinitions import tools as redefined_tools
+
+
+class SharedEchoTool(CommandTool):
+    SHARED_DEFINITIONS = True
+    n_inputs_calls = 0
+
+    def tool(self):
+        return "sharedecho"
+
+    def base_command(self):
+        return "echo"
+
+    def inputs(self):
+        SharedEchoTool.n_inputs_calls += 1
+        return [ToolInput("inp", String(), position=1)]
+
+    def outputs(self):
+        return [ToolOutput("out", Stdout())]
+
+    def container(self):
+        return "ubuntu:latest"
+
+    def version(self):
+        return "TEST"
+
+
+class SharedEchoToolExtended(SharedEchoTool):
+    def inputs(self):
+        return [*super().inputs(), ToolInput("extra", String(optional=True), position=2)]
 
 
 class TestCommandToolInputGeneration(unittest.TestCase):
@@ -51,3 +82,40 @@ class TestCommandToolInputGeneration(unittest.TestCase):
         expected_keys = set(i.id() for i in tool.inputs() if i.id() not in ignore_keys)
         inputs = tool.generate_inputs_override(values_to_ignore=ignore_keys)
         self.assertSetEqual(expected_keys, set(inputs.keys()))
+
+
+class TestSharedDefinitions(unittest.TestCase):
+    def test_built_once_per_class(self):
+        first = SharedEchoTool()
+        inputs = first.inputs()
+        n_calls = SharedEchoTool.n_inputs_calls
+        for _ in range(3):
+            tool = SharedEchoTool()
+            tool.inputs_map()
+            self.assertIs(inputs[0], tool.inputs()[0])
+        self.assertEqual(n_calls, SharedEchoTool.n_inputs_calls)
+        self.assertIs(first.tool_inputs()[0], SharedEchoTool().tool_inputs()[0])
+
+    def test_returned_lists_are_copies(self):
+        SharedEchoTool().inputs().clear()
+        SharedEchoTool().inputs_map().clear()
+        self.assertEqual(["inp"], [i.id() for i in SharedEchoTool().inputs()])
+        self.assertEqual(["inp"], list(SharedEchoTool().inputs_map()))
+
+    def test_subclass(self):
+        self.assertEqual(["inp", "extra"], list(SharedEchoToolExtended().inputs_map()))
+        self.assertEqual(["inp"], list(SharedEchoTool().inputs_map()))
+
+    def test_builder_owns_its_definitions(self):
+        builder = SharedEchoTool().to_command_tool_builder()
+        builder.inputs()[0].default = "changed"
+        self.assertIsNone(SharedEchoTool().inputs()[0].default)
+
+    def test_not_shared_by_default(self):
+        tool = InputQualityTestTool()
+        self.assertIsNot(tool.inputs()[0], tool.inputs()[0])
+
+    def test_redefinitions_shared(self):
+        tool = redefined_tools.Gatk4SortSam_4_1_2
+        self.assertTrue(tool.SHARED_DEFINITIONS)
+        self.assertIs(tool().inputs()[0], tool().inputs()[0])
@@ -0,0 +1,84 @@
+
+import sys
+import subprocess
+from unittest import TestCase
+
+
+# modules which belong to a single ingestion / translation backend.
+# none of these should be loaded by 'import janis_core.ingestion' or 'import janis_core.translations'.
+BACKEND_MODULES = [
+    'galaxy.tools',
+    'Cheetah',
+    'sqlalchemy',
+    'WDL',
+    'janis_core.ingestion.galaxy',
+    'janis_core.ingestion.cwl',
+    'janis_core.ingestion.wdl',
+    'janis_core.translations.cwl',
+    'janis_core.translations.wdl',
+    'janis_core.translations.nextflow',
+    'janis_core.translations.janis',
+]
+
+# cold-start budget (microseconds) for the public ingest / translate api modules, 
+# excluding 'import janis_core' itself. generous to avoid flakiness on slow machines.
+COLD_START_BUDGET_US = 500_000
+
+
+def _importtime(statement: str) -> tuple[dict[str, int], list[str]]:
+    """
+    runs 'statement' in a fresh interpreter with '-X importtime'. 
+    returns cumulative import time (us) per module, and the modules left in sys.modules.
+    """
+    code = f'{statement}\nimport sys\nprint("\\n".join(sys.modules))'
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = [x.strip() for x in line.split(':', 1)[1].split('|')]
+        timings[name] = int(cumulative)
+    return timings, proc.stdout.splitlines()
+
+
+class TestImportTime(TestCase):
+
+    def test_ingestion_backends_lazy(self) -> None:
+        _, modules = _importtime('import janis_core.ingestion')
+        loaded = [m for m in BACKEND_MODULES if m in modules]
+        self.assertEqual(loaded, [])
+
+    def test_translation_backends_lazy(self) -> None:
+        _, modules = _importtime('import janis_core.translations')
+        loaded = [m for m in BACKEND_MODULES if m in modules]
+        self.assertEqual(loaded, [])
+
+    def test_single_backend_loaded(self) -> None:
+        _, modules = _importtime(
+            'from janis_core.translations import get_translator\n'
+            'get_translator("cwl")'
+        )
+        self.assertIn('janis_core.translations.cwl', modules)
+        self.assertNotIn('janis_core.translations.wdl', modules)
+        self.assertNotIn('janis_core.translations.nextflow', modules)
+        self.assertNotIn('janis_core.ingestion.galaxy', modules)
+
+    def test_cold_start_budget(self) -> None:
+        timings, _ = _importtime(
+            'import janis_core\n'
+            'import janis_core.ingestion\n'
+            'import janis_core.translations'
+        )
+        elapsed = timings['janis_core.ingestion'] + timings['janis_core.translations']
+        self.assertLess(elapsed, COLD_START_BUDGET_US)
+
+    def test_redefinition_tools_lazy(self) -> None:
+        _, modules = _importtime('from janis_core.redefinitions.tools import Cat')
+        self.assertIn('janis_core.redefinitions.tools.cat', modules)
+        self.assertNotIn('janis_core.redefinitions.tools.gatk4', modules)
+        self.assertNotIn('janis_core.redefinitions.tools.samtools', modules)
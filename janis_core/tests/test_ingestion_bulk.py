@@ -0,0 +1,165 @@
+import os
+import json
+import tempfile
+import unittest
+
+from janis_core import settings
+from janis_core import CommandToolBuilder, WorkflowBuilder
+from janis_core.messages import main as messages_main
+from janis_core.ingestion import ingest_many
+from janis_core.ingestion.bulk import collect_documents
+from janis_core.ingestion.bulk import find_included_documents
+from janis_core.ingestion.bulk import _settings_snapshot, _init_worker
+from janis_core.ingestion.cache import IngestCache
+
+
+TOOL = """\
+cwlVersion: v1.2
+class: CommandLineTool
+id: {name}
+baseCommand: [echo]
+inputs:
+  text:
+    type: string
+    inputBinding:
+      position: 1
+outputs:
+  out:
+    type: stdout
+"""
+
+WORKFLOW = """\
+cwlVersion: v1.2
+class: Workflow
+id: hello_wf
+inputs:
+  text: string
+outputs:
+  out:
+    type: File
+    outputSource: stp1/out
+steps:
+  stp1:
+    run: ../tools/hello.cwl
+    in:
+      text: text
+    out: [out]
+"""
+
+
+class TestIngestMany(unittest.TestCase):
+
+    def setUp(self) -> None:
+        settings.ingest.SAFE_MODE = False
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        default_log_path = messages_main.MESSAGE_LOG_PATH
+        self.addCleanup(setattr, messages_main, 'MESSAGE_LOG_PATH', default_log_path)
+        self.src = os.path.join(self.tmpdir.name, 'src')
+        self.files = {
+            'tools/hello.cwl': TOOL.format(name='hello'),
+            'tools/goodbye.cwl': TOOL.format(name='goodbye'),
+            'tools/broken.cwl': 'cwlVersion: v1.2\nclass: Nonsense\n',
+            'workflows/hello_wf.cwl': WORKFLOW,
+            'workflows/README.md': '',
+        }
+        for relpath, contents in self.files.items():
+            path = os.path.join(self.src, relpath)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as fp:
+                fp.write(contents)
+
+    def _path(self, relpath: str) -> str:
+        return os.path.realpath(os.path.join(self.src, relpath))
+
+    def test_collect_documents(self) -> None:
+        docs = collect_documents([self.src, self._path('tools/hello.cwl')], 'cwl')
+        expected = ['tools/broken.cwl', 'tools/goodbye.cwl', 'tools/hello.cwl', 'workflows/hello_wf.cwl']
+        self.assertEqual(docs, [self._path(p) for p in expected])
+
+    def test_collect_galaxy_documents(self) -> None:
+        galaxy_files = {
+            'galaxy/wf.ga': '{}',
+            'galaxy/tools/abricate.xml': '<?xml version="1.0"?>\n<tool id="abricate"><macros><import>macros.xml</import></macros></tool>',
+            'galaxy/tools/macros.xml': '<macros><token name="@VERSION@">1.0</token></macros>',
+            'galaxy/tools/broken.xml': '<tool',
+        }
+        for relpath, contents in galaxy_files.items():
+            path = os.path.join(self.src, relpath)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as fp:
+                fp.write(contents)
+        docs = collect_documents([os.path.join(self.src, 'galaxy')], 'galaxy')
+        self.assertEqual(docs, [self._path('galaxy/wf.ga'), self._path('galaxy/tools/abricate.xml')])
+
+    def test_included_documents(self) -> None:
+        docs = collect_documents([self.src], 'cwl')
+        included = find_included_documents(docs, 'cwl')
+        self.assertEqual(included, {self._path('tools/hello.cwl'): self._path('workflows/hello_wf.cwl')})
+
+    def test_ingest_many(self) -> None:
+        messages_dir = os.path.join(self.tmpdir.name, 'messages')
+        manifest = ingest_many([self.src], 'cwl', messages_dir=messages_dir)
+        records = {os.path.relpath(r.path, self.src): r for r in manifest.records}
+        self.assertEqual(records['tools/hello.cwl'].status, 'dependency')
+        self.assertEqual(records['tools/broken.cwl'].status, 'failed')
+        self.assertIsNotNone(records['tools/broken.cwl'].error)
+        self.assertEqual(records['tools/goodbye.cwl'].status, 'ok')
+        self.assertIsInstance(records['tools/goodbye.cwl'].tool, CommandToolBuilder)
+        self.assertIsInstance(records['workflows/hello_wf.cwl'].tool, WorkflowBuilder)
+        self.assertEqual([r.path for r in manifest.failures], [self._path('tools/broken.cwl')])
+
+        # a message log per document
+        self.assertEqual(
+            records['tools/goodbye.cwl'].messages_path,
+            os.path.join(messages_dir, 'tools__goodbye.log')
+        )
+        self.assertTrue(os.path.exists(os.path.join(messages_dir, 'workflows__hello_wf.log')))
+
+        path = os.path.join(self.tmpdir.name, 'manifest.json')
+        manifest.write(path)
+        with open(path) as fp:
+            data = json.load(fp)
+        self.assertEqual(data['counts'], {'documents': 4, 'ingested': 2, 'failed': 1, 'dependencies': 1})
+
+    def test_process_pool_translate(self) -> None:
+        outdir = os.path.join(self.tmpdir.name, 'out')
+        manifest = ingest_many(
+            [self._path('tools/goodbye.cwl'), self._path('workflows/hello_wf.cwl')],
+            'cwl',
+            jobs=2,
+            translate_to='wdl',
+            export_dir=outdir,
+            messages_dir=os.path.join(self.tmpdir.name, 'messages'),
+        )
+        self.assertEqual([r.status for r in manifest.records], ['ok', 'ok'])
+        for record in manifest.records:
+            # tools stay in the worker processes
+            self.assertIsNone(record.tool)
+            self.assertEqual(record.translation_errors, {})
+            self.assertTrue(os.path.isdir(record.translations['wdl']))
+        self.assertEqual(manifest.records[0].translations['wdl'], os.path.join(outdir, 'tools', 'goodbye', 'wdl'))
+
+    def test_worker_settings(self) -> None:
+        # spawned workers are given the settings of the parent process
+        default = settings.ingest.cwl.INGEST_JAVASCRIPT_EXPRESSIONS
+        self.addCleanup(setattr, settings.ingest.cwl, 'INGEST_JAVASCRIPT_EXPRESSIONS', default)
+        settings.ingest.cwl.INGEST_JAVASCRIPT_EXPRESSIONS = not default
+        snapshot = _settings_snapshot()
+        settings.ingest.cwl.INGEST_JAVASCRIPT_EXPRESSIONS = default
+        _init_worker(snapshot)
+        self.assertEqual(settings.ingest.cwl.INGEST_JAVASCRIPT_EXPRESSIONS, not default)
+
+    def test_cache(self) -> None:
+        cache_dir = os.path.join(self.tmpdir.name, 'cache')
+        self.addCleanup(setattr, settings.ingest, 'CACHE_DIR', settings.ingest.CACHE_DIR)
+        settings.ingest.CACHE_DIR = cache_dir
+        messages_dir = os.path.join(self.tmpdir.name, 'messages')
+        for _ in range(2):
+            manifest = ingest_many([self.src], 'cwl', messages_dir=messages_dir, cache=True)
+            self.assertEqual([r.status for r in manifest.records], ['failed', 'ok', 'dependency', 'ok'])
+        self.assertEqual(len(IngestCache(cache_dir).keys()), 2)
+
+    def test_translate_requires_export_dir(self) -> None:
+        with self.assertRaises(ValueError):
+            ingest_many([self.src], 'cwl', translate_to='wdl')
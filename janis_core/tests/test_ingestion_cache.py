@@ -0,0 +1,175 @@
+import os
+import time
+import tempfile
+import unittest
+from unittest import mock
+
+from janis_core import settings
+from janis_core import WorkflowBuilder
+from janis_core.messages import main as messages_main
+from janis_core.messages import configure_logging, log_warning, get_messages
+from janis_core.ingestion import ingest
+from janis_core.ingestion.cache import IngestCache, CacheEntry
+from janis_core.ingestion.cache import cached_ingest, cache_key, source_documents
+from janis_core.ingestion.galaxy.gxtool.model import XMLCondaRequirement
+from janis_core.ingestion.galaxy.containers import fetch
+from janis_core.ingestion.galaxy.containers.fetching import utils as fetch_utils
+
+
+TOOL = """\
+cwlVersion: v1.2
+class: CommandLineTool
+id: hello
+baseCommand: [echo]
+inputs:
+  text:
+    type: string
+    inputBinding:
+      position: 1
+outputs:
+  out:
+    type: stdout
+"""
+
+WORKFLOW = """\
+cwlVersion: v1.2
+class: Workflow
+id: hello_wf
+inputs:
+  text: string
+outputs:
+  out:
+    type: File
+    outputSource: stp1/out
+steps:
+  stp1:
+    run: ../tools/hello.cwl
+    in:
+      text: text
+    out: [out]
+"""
+
+
+class TestIngestCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        settings.ingest.SAFE_MODE = False
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        for name in ['CACHE', 'CACHE_DIR', 'CACHE_MAX_SIZE_MB', 'CACHE_MAX_AGE_DAYS']:
+            self.addCleanup(setattr, settings.ingest, name, getattr(settings.ingest, name))
+        default_log_path = messages_main.MESSAGE_LOG_PATH
+        self.addCleanup(setattr, messages_main, 'MESSAGE_LOG_PATH', default_log_path)
+        self.addCleanup(setattr, settings.ingest.cwl, 'INGEST_JAVASCRIPT_EXPRESSIONS', settings.ingest.cwl.INGEST_JAVASCRIPT_EXPRESSIONS)
+        self.addCleanup(setattr, settings.translate, 'MODE', settings.translate.MODE)
+        self.addCleanup(setattr, settings.testing, 'TESTING_USE_DEFAULT_CONTAINER', settings.testing.TESTING_USE_DEFAULT_CONTAINER)
+
+        settings.ingest.CACHE_DIR = os.path.join(self.tmpdir.name, 'cache')
+        messages_main.MESSAGE_LOG_PATH = os.path.join(self.tmpdir.name, 'messages.log')
+        self.tool_path = self._write('tools/hello.cwl', TOOL)
+        self.wf_path = self._write('workflows/hello_wf.cwl', WORKFLOW)
+
+    def _write(self, relpath: str, contents: str) -> str:
+        path = os.path.join(self.tmpdir.name, 'src', relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as fp:
+            fp.write(contents)
+        return os.path.realpath(path)
+
+    def test_source_documents(self) -> None:
+        self.assertEqual(source_documents(self.wf_path, 'cwl'), [self.wf_path, self.tool_path])
+
+    def test_key(self) -> None:
+        key = cache_key(self.wf_path, 'cwl')
+        self.assertEqual(cache_key(self.wf_path, 'cwl'), key)
+        self.assertIsNone(cache_key('toolshed.g2.bx.psu.edu/repos/devteam/fastqc/fastqc/0.74+galaxy0', 'galaxy'))
+
+        # dependencies
+        self._write('tools/hello.cwl', TOOL.replace('echo', 'printf'))
+        changed_key = cache_key(self.wf_path, 'cwl')
+        self.assertNotEqual(changed_key, key)
+
+        # settings
+        keys = {changed_key}
+        settings.ingest.cwl.INGEST_JAVASCRIPT_EXPRESSIONS = not settings.ingest.cwl.INGEST_JAVASCRIPT_EXPRESSIONS
+        keys.add(cache_key(self.wf_path, 'cwl'))
+        settings.translate.MODE = 'skeleton'
+        keys.add(cache_key(self.wf_path, 'cwl'))
+        settings.testing.TESTING_USE_DEFAULT_CONTAINER = not settings.testing.TESTING_USE_DEFAULT_CONTAINER
+        keys.add(cache_key(self.wf_path, 'cwl'))
+        self.assertEqual(len(keys), 4)
+
+    def test_hit(self) -> None:
+        calls: list[str] = []
+        def ingest_func(path: str) -> WorkflowBuilder:
+            calls.append(path)
+            tool = ingest(path, 'cwl', cache=False)
+            log_warning('general', 'logged while ingesting')
+            assert(isinstance(tool, WorkflowBuilder))
+            return tool
+
+        configure_logging()
+        original = cached_ingest(self.wf_path, 'cwl', ingest_func)
+        configure_logging()
+        cached = cached_ingest(self.wf_path, 'cwl', ingest_func)
+        self.assertEqual(calls, [self.wf_path])
+        self.assertIsNot(cached, original)
+        self.assertEqual(list(cached.step_nodes), list(original.step_nodes))
+        self.assertEqual(get_messages('general'), ['logged while ingesting'])
+
+        # unpickled nodes don't share ids with the nodes they were pickled from
+        self.assertNotEqual(cached.step_nodes['stp1']._nodeId, original.step_nodes['stp1']._nodeId)
+        self.assertEqual(len(IngestCache().keys()), 1)
+
+    def test_unreachable_container_not_cached(self) -> None:
+        # the tool would be stored with a default container in place of the real one
+        tool = ingest(self.tool_path, 'cwl', cache=False)
+        xml_path = self._write('galaxy/hello.xml', '<tool id="hello"/>')
+        requirement = XMLCondaRequirement(_name='hello', _version='1.0')
+
+        def unreachable(requirement: XMLCondaRequirement) -> None:
+            fetch_utils._local.unreachable = True
+            return None
+
+        def ingest_func(path: str):
+            fetch.fetch_online(requirement)
+            return tool
+
+        with mock.patch.object(fetch, '_fetch_online', unreachable):
+            cached_ingest(xml_path, 'galaxy', ingest_func)
+        self.assertEqual(IngestCache().keys(), [])
+        cached_ingest(xml_path, 'galaxy', lambda path: tool)
+        self.assertEqual(len(IngestCache().keys()), 1)
+
+    def test_ingest_setting(self) -> None:
+        settings.ingest.CACHE = True
+        ingest(self.wf_path, 'cwl')
+        self.assertEqual(IngestCache().keys(), [cache_key(self.wf_path, 'cwl')])
+        ingest(self.tool_path, 'cwl', cache=False)
+        self.assertEqual(len(IngestCache().keys()), 1)
+
+    def test_unreadable_entry(self) -> None:
+        cache = IngestCache()
+        os.makedirs(cache.directory)
+        with open(os.path.join(cache.directory, 'bad.pickle'), 'wb') as fp:
+            fp.write(b'not a pickle')
+        self.assertIsNone(cache.get('bad'))
+        self.assertEqual(cache.keys(), [])
+
+    def test_evict(self) -> None:
+        cache = IngestCache()
+        tool = ingest(self.tool_path, 'cwl', cache=False)
+        now = time.time()
+        for i, key in enumerate(['old', 'a', 'b', 'c']):
+            cache.add(key, CacheEntry(tool))
+            os.utime(cache._path(key), (now - 100 + i, now - 100 + i))
+        os.utime(cache._path('old'), (now - 3 * 24 * 60 * 60, now - 3 * 24 * 60 * 60))
+        self.assertEqual(cache.evict(max_age_days=1), ['old'])
+
+        # a hit counts as a use
+        self.assertIsNotNone(cache.get('a'))
+        size = os.path.getsize(cache._path('a'))
+        self.assertEqual(cache.evict(max_size_mb=(size * 2) / (1024 * 1024), max_age_days=1), ['b'])
+        self.assertEqual(sorted(cache.keys()), ['a', 'c'])
+        cache.clear()
+        self.assertEqual(cache.keys(), [])
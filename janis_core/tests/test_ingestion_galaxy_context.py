@@ -0,0 +1,84 @@
+
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from janis_core import settings
+from janis_core.ingestion.galaxy import datatypes
+from janis_core.ingestion.galaxy.ingest import ingest_tool
+from janis_core.ingestion.galaxy import runtime
+from janis_core.ingestion.galaxy.gxworkflow import context as context_module
+from janis_core.ingestion.galaxy.gxworkflow import get_step_context
+from janis_core.ingestion.galaxy.gxworkflow import clear_step_contexts
+from janis_core.ingestion.galaxy.gxworkflow import load_tool_state
+
+
+GALAXY_TESTDATA_PATH = os.path.join(os.getcwd(), 'janis_core/tests/data/galaxy')
+FASTQC_XML = os.path.relpath(f'{GALAXY_TESTDATA_PATH}/fastqc-5ec9f6bceaee/rgFastQC.xml')
+
+
+def _load_gxstep(filepath: str, step: int) -> dict:
+    with open(filepath, 'r') as fp:
+        return json.load(fp)['steps'][str(step)]
+
+
+class TestStepIngestContext(unittest.TestCase):
+
+    def setUp(self) -> None:
+        datatypes.populate()
+        runtime.tool.tool_path = FASTQC_XML
+        clear_step_contexts()
+        self.addCleanup(clear_step_contexts)
+        self.gxstep = _load_gxstep(f'{GALAXY_TESTDATA_PATH}/fastqc_wf.ga', 2)
+
+    def test_xmltool_parsed_once(self) -> None:
+        with mock.patch.object(context_module, 'load_xmltool', wraps=context_module.load_xmltool) as loader:
+            context = get_step_context(self.gxstep, tool_path=FASTQC_XML)
+            xmltool1 = context.xmltool
+            xmltool2 = get_step_context(self.gxstep, tool_path=FASTQC_XML).xmltool
+        self.assertIs(xmltool1, xmltool2)
+        self.assertEqual(loader.call_count, 1)
+
+    def test_tool_state_memoised(self) -> None:
+        context = get_step_context(self.gxstep, tool_path=FASTQC_XML)
+        state1 = context.tool_state(['Flatten', 'DeNestClass'])
+        state2 = context.tool_state(['DeNestClass', 'Flatten'])
+        self.assertIs(state1, state2)
+        self.assertEqual(state1['adapters'], 'RuntimeValue')
+        self.assertEqual(state1['input_file'], 'ConnectedValue')
+        self.assertEqual(state1['kmers'], '7')
+        
+        state3 = context.tool_state(['ReplaceConnectedWithVarname', 'ReplaceRuntimeWithVarname'])
+        self.assertIsNot(state1, state3)
+        self.assertEqual(state3['input_file'], '$input_file')
+        self.assertEqual(state3['adapters'], '$adapters')
+
+    def test_contexts_per_step(self) -> None:
+        other = _load_gxstep(f'{GALAXY_TESTDATA_PATH}/fastqc_wf.ga', 3)
+        context1 = get_step_context(self.gxstep, tool_path=FASTQC_XML)
+        context2 = get_step_context(other, tool_path=FASTQC_XML)
+        self.assertIsNot(context1, context2)
+        self.assertEqual(context2.tool_state(['DeNestClass'])['input_file'], 'RuntimeValue')
+
+    def test_load_tool_state_uses_context(self) -> None:
+        state1 = load_tool_state(self.gxstep, additional_filters=['Flatten'])
+        state2 = get_step_context(self.gxstep, tool_path=FASTQC_XML).tool_state(['Flatten'])
+        self.assertIs(state1, state2)
+
+    def test_standalone_tool_reparsed(self) -> None:
+        # an edited tool xml ingested again in the same process is parsed again
+        self.addCleanup(setattr, settings.testing, 'TESTING_USE_DEFAULT_CONTAINER', settings.testing.TESTING_USE_DEFAULT_CONTAINER)
+        settings.testing.TESTING_USE_DEFAULT_CONTAINER = True
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for filename in ['abricate.xml', 'macros.xml']:
+                shutil.copy(f'{GALAXY_TESTDATA_PATH}/abricate/{filename}', tmpdir)
+            path = os.path.join(tmpdir, 'abricate.xml')
+            self.assertEqual(ingest_tool(path).metadata.id, 'abricate')
+            with open(path, 'r') as fp:
+                text = fp.read()
+            with open(path, 'w') as fp:
+                fp.write(text.replace('id="abricate"', 'id="abricate_edited"', 1))
+            self.assertEqual(ingest_tool(path).metadata.id, 'abricate_edited')
@@ -0,0 +1,55 @@
+import unittest
+
+import yaml
+
+from janis_core import File, JanisShed
+from janis_core.settings.ingest.galaxy import DATATYPES_YAML
+from janis_core.ingestion.galaxy import datatypes
+from janis_core.ingestion.galaxy.datatypes import galaxy
+from janis_core.ingestion.galaxy.datatypes.register import register
+
+
+class TestGalaxyDatatypeCatalogue(unittest.TestCase):
+
+    def test_generated_class(self) -> None:
+        from janis_core.ingestion.galaxy.datatypes.galaxy import AccNos
+        self.assertIs(AccNos, galaxy.AccNos)
+        self.assertTrue(issubclass(AccNos, File))
+        self.assertEqual(AccNos.__name__, 'AccNos')
+        self.assertEqual(AccNos.__module__, galaxy.__name__)
+        dtype = AccNos()
+        self.assertEqual(dtype.name(), 'AccNos')
+        self.assertEqual(dtype.id(), 'AccNos')
+        self.assertEqual(dtype.extension, '.mothur.accnos')
+        self.assertEqual(dtype.alternate_extensions, {'.mothur.otulabels'})
+        self.assertFalse(dtype.optional)
+        self.assertTrue(AccNos(optional=True).optional)
+
+    def test_doc(self) -> None:
+        self.assertIn("'ab1' format", galaxy.Ab1().doc())
+        self.assertEqual(galaxy.Acedb().doc(), '')
+
+    def test_unknown_class(self) -> None:
+        with self.assertRaises(AttributeError):
+            galaxy.NotADatatype
+
+    def test_dir(self) -> None:
+        self.assertIn('Fastq', dir(galaxy))
+
+    def test_classes_not_traversed(self) -> None:
+        # classes only exist once looked up, so module traversal doesn't see the whole catalogue
+        JanisShed.traverse_module(galaxy, seen_modules=set(), seen_classes=set())
+        self.assertLess(len([v for v in vars(galaxy).values() if isinstance(v, type) and issubclass(v, File)]), 50)
+
+    def test_yaml_references_resolve(self) -> None:
+        with open(DATATYPES_YAML, 'r') as fp:
+            types = yaml.safe_load(fp)['types']
+        for type_data in types:
+            jtype = register._init_type(type_data)
+            dtype = datatypes.get_class(jtype)()
+            self.assertEqual(type(dtype).__name__, jtype.classname)
+
+    def test_all_classes(self) -> None:
+        classes = galaxy.all_classes()
+        self.assertGreater(len(classes), 500)
+        self.assertEqual(len(set(classes)), len(classes))
@@ -0,0 +1,69 @@
+import unittest
+import regex as re
+
+from janis_core import settings
+from janis_core.ingestion.galaxy.gxtool.command.tokens import Token, TokenType
+from janis_core.ingestion.galaxy.gxtool.command.cmdstr.RealisedTokenValues import RealisedTokens
+from janis_core.ingestion.galaxy.gxtool.command.cmdstr.DynamicCommandStatement import DynamicCommandStatement
+from janis_core.ingestion.galaxy.gxtool.command.components import Flag
+from janis_core.ingestion.galaxy.gxtool.command.epath.ExecutionPath import ExecutionPath
+
+
+def _token(text: str) -> Token:
+    match = re.match(r'.+', text)
+    assert(match)
+    return Token(match, TokenType.STRING)
+
+def _realised(*values: str) -> RealisedTokens:
+    # each value is a space separated list of words
+    tlists = [[_token(word) for word in value.split()] for value in values]
+    return RealisedTokens(tlists, _token(values[0]))
+
+def _texts(epath: ExecutionPath) -> list[str]:
+    return [pos.token.text for pos in epath.positions[:-1]]
+
+
+class TestExecutionPaths(unittest.TestCase):
+
+    def setUp(self) -> None:
+        default_max_paths = settings.ingest.galaxy.MAX_EXECUTION_PATHS
+        self.addCleanup(setattr, settings.ingest.galaxy, 'MAX_EXECUTION_PATHS', default_max_paths)
+        self.realised_tokens = [
+            _realised('bowtie2'),
+            _realised('--very-fast', '--fast', '--sensitive'),
+            _realised('-q'),
+            _realised('--no-mixed --no-discordant', ''),
+        ]
+
+    def test_paths(self) -> None:
+        stmt = DynamicCommandStatement('', self.realised_tokens)
+        epaths = stmt.get_execution_paths()
+        self.assertEqual([_texts(e) for e in epaths], [
+            ['bowtie2', '--very-fast', '-q', '--no-mixed', '--no-discordant'],
+            ['bowtie2', '--fast', '-q'],
+            ['bowtie2', '--sensitive', '-q', '--no-mixed'],
+            ['bowtie2', '--very-fast', '-q', '--no-mixed'],     # defaults
+        ])
+
+    def test_tokens_shared(self) -> None:
+        # paths hold their own positions, but not copies of tokens
+        stmt = DynamicCommandStatement('', self.realised_tokens)
+        epaths = stmt.get_execution_paths()
+        base_cmd = self.realised_tokens[0].get_default_token()
+        for epath in epaths:
+            self.assertIs(epath.positions[0].token, base_cmd)
+        self.assertIsNot(epaths[0].positions[0], epaths[1].positions[0])
+
+    def test_path_budget(self) -> None:
+        settings.ingest.galaxy.MAX_EXECUTION_PATHS = 1
+        stmt = DynamicCommandStatement('', self.realised_tokens)
+        self.assertEqual(len(stmt.get_execution_paths()), 2)   # first realisation & defaults
+
+    def test_components_unique(self) -> None:
+        stmt = DynamicCommandStatement('', self.realised_tokens)
+        epath = stmt.get_execution_paths()[0]
+        flag = Flag('--no-mixed')
+        for pos in epath.positions[3:5]:
+            pos.component = flag
+        epath.positions[1].component = Flag('--very-fast')
+        self.assertEqual([c.prefix for c in epath._get_component_list()], ['--very-fast', '--no-mixed'])
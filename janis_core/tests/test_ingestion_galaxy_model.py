@@ -0,0 +1,76 @@
+import unittest
+from types import SimpleNamespace
+from typing import Any
+
+from janis_core.ingestion.galaxy import tags
+from janis_core.ingestion.galaxy.internal_model.workflow import (
+    Workflow,
+    WorkflowMetadata,
+    WorkflowInput,
+    WorkflowStep,
+    StepMetadata,
+    StepOutput,
+    ConnectionInputValue,
+    WorkflowInputInputValue,
+)
+
+
+def _step(step_id: int, tool_id: str) -> WorkflowStep:
+    wrapper: Any = SimpleNamespace(tool_id=tool_id)
+    metadata = StepMetadata(wrapper, step_id, tool_id, {}, [])
+    return WorkflowStep(metadata)
+
+def _input(name: str) -> WorkflowInput:
+    return WorkflowInput(name, array=False, optional=False, is_runtime=False, datatype=None)  # type: ignore
+
+
+class TestWorkflowIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.wf = Workflow()
+        self.wf.set_metadata(WorkflowMetadata('wf', self.wf.uuid, '', '1', []))
+        self.winp = _input('reads')
+        self.wf.add_input(self.winp)
+
+        # steps added out of step_id order
+        self.stp3 = _step(3, 'multiqc')
+        self.stp1 = _step(1, 'fastqc')
+        self.stp2 = _step(2, 'fastqc')
+        for step in [self.stp3, self.stp1, self.stp2]:
+            self.wf.add_step(step)
+
+        # outputs & connections are added after the step joins the workflow
+        self.tool_out = SimpleNamespace(uuid='out-uuid')
+        self.s_out = StepOutput(self.stp1.uuid, False, self.tool_out)  # type: ignore
+        self.stp1.outputs.add(self.s_out)
+        for step in [self.stp2, self.stp1]:
+            step.inputs.add(WorkflowInputInputValue(None, self.winp.uuid, False))  # type: ignore
+        self.stp3.inputs.add(ConnectionInputValue(None, self.stp1.uuid, self.s_out.uuid))  # type: ignore
+        self.stp3.inputs.add(ConnectionInputValue(None, self.stp2.uuid, 'other'))  # type: ignore
+
+    def test_lookup(self) -> None:
+        self.assertIs(self.wf.get_input(self.winp.uuid), self.winp)
+        self.assertIs(self.wf.get_step(self.stp2.uuid), self.stp2)
+        self.assertIs(self.wf.get_step_output('out-uuid'), self.s_out)
+        with self.assertRaises(RuntimeError):
+            self.wf.get_step('missing')
+
+    def test_children(self) -> None:
+        self.assertEqual(self.wf.get_input_children(self.winp.uuid), [self.stp1, self.stp2])
+        self.assertEqual(self.wf.get_step_children(self.stp1.uuid), [self.stp3])
+        self.assertEqual(self.wf.get_step_children(self.stp3.uuid), [])
+
+    def test_steps_sorted(self) -> None:
+        self.assertEqual(self.wf.steps, [self.stp1, self.stp2, self.stp3])
+        stp0 = _step(0, 'cutadapt')
+        self.wf.add_step(stp0)
+        self.assertEqual(self.wf.steps[0], stp0)
+
+    def test_tags(self) -> None:
+        # shared basetags are numbered in registration order
+        self.assertEqual(self.stp1.tag, 'fastqc1')
+        self.assertEqual(self.stp2.tag, 'fastqc2')
+        self.assertEqual(self.stp3.tag, 'multiqc')
+        self.assertEqual(self.winp.tag, 'in_reads')
+        with self.assertRaises(RuntimeError):
+            tags.get('missing')
@@ -0,0 +1,391 @@
+"""
+Tests for galaxy ingestion components which talk to remote services (quay.io, toolshed). 
+These run against local stub servers / fixtures, so do not require network access. 
+"""
+
+import io
+import os
+import json
+import tarfile
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from typing import Any, Optional
+from unittest import mock
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from janis_core import settings
+from janis_core.ingestion.galaxy.gxtool.model import XMLCondaRequirement
+from janis_core.ingestion.galaxy.gxtool.model.metadata import XMLMetadata
+from janis_core.ingestion.galaxy.containers import prefetch_containers
+from janis_core.ingestion.galaxy.containers import fetch
+from janis_core.ingestion.galaxy.containers.fetching import utils as fetch_utils
+from janis_core.ingestion.galaxy.gxwrappers import Wrapper
+from janis_core.ingestion.galaxy.gxwrappers import WrapperCache
+from janis_core.ingestion.galaxy.gxwrappers import get_wrapper
+from janis_core.ingestion.galaxy.gxwrappers.requests import versions
+from janis_core.ingestion.galaxy.gxwrappers.downloads.cache import DownloadCache
+from janis_core.ingestion.galaxy.gxwrappers.downloads.cache import MANIFEST_NAME
+
+
+QUAY_REPOS: dict[str, Any] = {
+    'abricate': {
+        'name': 'abricate',
+        'tags': {
+            '1.0.1--ha8f3691_1': {'name': '1.0.1--ha8f3691_1', 'last_modified': 'Tue, 01 Mar 2022 18:45:00 -0000'},
+            '1.0.1--ha8f3691_0': {'name': '1.0.1--ha8f3691_0', 'last_modified': 'Mon, 01 Mar 2021 18:45:00 -0000'},
+            '0.9.8--h1341992_0': {'name': '0.9.8--h1341992_0', 'last_modified': 'Wed, 01 Mar 2023 18:45:00 -0000'},
+        }
+    },
+    'samtools': {
+        'name': 'samtools',
+        'tags': {
+            '1.15--h1170115_1': {'name': '1.15--h1170115_1', 'last_modified': 'Tue, 01 Mar 2022 18:45:00 -0000'},
+        }
+    },
+}
+
+
+class StubQuayHandler(BaseHTTPRequestHandler):
+    requests_seen: list[str] = []
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        with self.lock:
+            self.requests_seen.append(self.path)
+        name = self.path.rsplit('/', 1)[-1]
+        if name == 'unavailable':
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        elif name in QUAY_REPOS:
+            body = json.dumps(QUAY_REPOS[name]).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def _mock_xmltool(tool_id: str, requirements: list[XMLCondaRequirement]) -> Any:
+    metadata = XMLMetadata(
+        name=tool_id,
+        id=tool_id,
+        version='1.0',
+        description='',
+        help='',
+        requirements=requirements,  # type: ignore
+        citations=[],
+    )
+    return SimpleNamespace(metadata=metadata)
+
+
+class TestContainerPrefetch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubQuayHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_address[1]}/repository/biocontainers'
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        settings.testing.TESTING_USE_DEFAULT_CONTAINER = False
+        settings.ingest.galaxy.DISABLE_CONTAINER_CACHE = True
+        StubQuayHandler.requests_seen = []
+        fetch.clear_fetched()
+        fetch_utils.clear_misses()
+        patcher = mock.patch(
+            'janis_core.ingestion.galaxy.containers.fetching.QuayIOFetcher.QUAY_API_URL', 
+            self.url
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        settings.testing.TESTING_USE_DEFAULT_CONTAINER = True
+        settings.ingest.galaxy.DISABLE_CONTAINER_CACHE = False
+
+    def test_deduplicated(self) -> None:
+        abricate = XMLCondaRequirement(_name='abricate', _version='1.0.1')
+        samtools = XMLCondaRequirement(_name='samtools', _version='1.15')
+        xmltools = [
+            _mock_xmltool('tool1', [abricate]),
+            _mock_xmltool('tool2', [abricate, samtools]),
+            _mock_xmltool('tool3', [samtools]),
+        ]
+        prefetch_containers(xmltools)
+        self.assertEqual(len(StubQuayHandler.requests_seen), 2)
+
+        # per-tool resolution afterwards makes no further requests
+        container = fetch.fetch_online(abricate)
+        assert(container)
+        self.assertEqual(container.uri, 'quay.io/biocontainers/abricate:1.0.1--ha8f3691_1')
+        self.assertEqual(len(StubQuayHandler.requests_seen), 2)
+
+    def test_negative_cache(self) -> None:
+        missing = XMLCondaRequirement(_name='not_a_tool', _version='1.0')
+        prefetch_containers([_mock_xmltool('tool1', [missing])])
+        self.assertIsNone(fetch.fetch_online(missing))
+        self.assertEqual(len(StubQuayHandler.requests_seen), 1)
+
+        # misses are remembered at the request level too
+        fetch.clear_fetched()
+        self.assertIsNone(fetch.fetch_online(missing))
+        self.assertEqual(len(StubQuayHandler.requests_seen), 1)
+
+    def test_outage_not_cached(self) -> None:
+        # a registry which can't be reached isn't a miss: later lookups try again
+        unavailable = XMLCondaRequirement(_name='unavailable', _version='1.0')
+        with mock.patch.object(fetch_utils, 'BACKOFF_FACTOR', 0), mock.patch.object(fetch_utils, 'MAX_ATTEMPTS', 2):
+            self.assertIsNone(fetch.fetch_online(unavailable))
+            self.assertEqual(len(StubQuayHandler.requests_seen), 2)
+            self.assertIsNone(fetch.fetch_online(unavailable))
+            self.assertEqual(len(StubQuayHandler.requests_seen), 4)
+
+    def test_many_concurrent(self) -> None:
+        reqs = [XMLCondaRequirement(_name=f'missing{i}', _version='1.0') for i in range(30)]
+        reqs.append(XMLCondaRequirement(_name='samtools', _version='1.15'))
+        xmltools = [_mock_xmltool(f'tool{i}', [req]) for i, req in enumerate(reqs)]
+        prefetch_containers(xmltools)
+        self.assertEqual(len(StubQuayHandler.requests_seen), 31)
+        container = fetch.fetch_online(reqs[-1])
+        assert(container)
+        self.assertEqual(container.uri, 'quay.io/biocontainers/samtools:1.15--h1170115_1')
+
+    def test_disabled_when_using_default_container(self) -> None:
+        settings.testing.TESTING_USE_DEFAULT_CONTAINER = True
+        abricate = XMLCondaRequirement(_name='abricate', _version='1.0.1')
+        prefetch_containers([_mock_xmltool('tool1', [abricate])])
+        self.assertEqual(len(StubQuayHandler.requests_seen), 0)
+
+
+class StubToolshedRepositories:
+    """mimics bioblend ToolShedInstance.repositories for a single repo"""
+
+    def __init__(self, revisions: dict[str, str]) -> None:
+        # revision -> abricate tool_build available at that revision (oldest first)
+        self.revisions = revisions
+        self.requested: list[str] = []
+        self.lock = threading.Lock()
+
+    def get_ordered_installable_revisions(self, repo: str, owner: str) -> list[str]:
+        return list(self.revisions.keys())
+
+    def get_repository_revision_install_info(self, repo: str, owner: str, revision: str) -> list[dict[str, Any]]:
+        with self.lock:
+            self.requested.append(revision)
+        repository = {'owner': owner, 'name': repo, 'create_time': '2022-03-01T18:45:00.000000'}
+        metadata = {'valid_tools': [{
+            'id': 'abricate', 
+            'version': self.revisions[revision], 
+            'requirements': [{'type': 'package', 'name': 'abricate', 'version': '1.0.1'}]
+        }]}
+        install_info = {repo: ['', '', revision]}
+        return [repository, metadata, install_info]
+
+
+class TestToolshedWrapperLookup(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        patcher = mock.patch.object(
+            settings.ingest.galaxy, 
+            'WRAPPER_CACHE', 
+            os.path.join(self.tmpdir.name, 'cache.json')
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.repositories = StubToolshedRepositories({
+            f'rev{i}': '1.0.0' if i < 10 else '1.0.1' for i in range(20)
+        })
+        patcher = mock.patch.object(
+            versions, 
+            'ToolShedInstance', 
+            lambda url: SimpleNamespace(repositories=self.repositories)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_wrapper(self, tool_build: str) -> Wrapper:
+        return get_wrapper(
+            tool_shed='toolshed.g2.bx.psu.edu',
+            owner='iuc',
+            repo='abricate',
+            tool_id='abricate',
+            tool_build=tool_build,
+        )
+
+    def test_newest_matching_revision(self) -> None:
+        wrapper = self._get_wrapper('1.0.0')
+        self.assertEqual(wrapper.revision, 'rev9')
+        self.assertEqual(wrapper.tool_build, '1.0.0')
+        wrapper = self._get_wrapper('1.0.1')
+        self.assertEqual(wrapper.revision, 'rev19')
+
+    def test_no_matching_revision(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self._get_wrapper('2.0.0')
+        self.assertEqual(len(self.repositories.requested), 20)
+
+    def test_cache_first(self) -> None:
+        self._get_wrapper('1.0.0')
+        num_requests = len(self.repositories.requested)
+        wrapper = self._get_wrapper('1.0.0')
+        self.assertEqual(wrapper.revision, 'rev9')
+        self.assertEqual(len(self.repositories.requested), num_requests)
+        self.assertEqual(len(WrapperCache().get(tool_id='abricate')), 1)
+
+
+def _wrapper_details(tool_id: str, tool_build: str, revision: str, date_created: str='2022-03-01 18:45:00') -> dict[str, Any]:
+    return {
+        'owner': 'iuc',
+        'repo': tool_id,
+        'revision': revision,
+        'tool_id': tool_id,
+        'tool_build': tool_build,
+        'date_created': date_created,
+        'requirements': [],
+    }
+
+
+class TestWrapperCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, 'cache.json')
+        patcher = mock.patch.object(settings.ingest.galaxy, 'WRAPPER_CACHE', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_queries(self) -> None:
+        cache = WrapperCache()
+        cache.add(Wrapper(_wrapper_details('fastqc', '0.73', 'aaa')))
+        cache.add(Wrapper(_wrapper_details('fastqc', '0.74', 'bbb')))
+        cache.add(Wrapper(_wrapper_details('cutadapt', '3.5', 'ccc')))
+        cache.add(Wrapper(_wrapper_details('cutadapt', '3.5', 'ccc')))  # duplicate
+
+        self.assertEqual(len(cache.get()), 3)
+        self.assertEqual(len(cache.get(tool_id='fastqc')), 2)
+        self.assertEqual(len(cache.get(tool_id='fastqc', tool_build='0.74')), 1)
+        self.assertEqual(len(cache.get(revision='ccc')), 1)
+        self.assertEqual(len(cache.get(tool_id='fastqc', tool_build='0.74', owner='iuc', repo='fastqc')), 1)
+        self.assertEqual(len(cache.get(tool_id='fastqc', tool_build='0.74', owner='iuc', repo='fastqc', revision='bbb')), 1)
+        self.assertEqual(len(cache.get(tool_id='fastqc', tool_build='0.74', owner='iuc', repo='fastqc', revision='aaa')), 0)
+        self.assertEqual(len(cache.get(tool_id='samtools')), 0)
+
+    def test_batched_persistence(self) -> None:
+        cache = WrapperCache()
+        cache.add(Wrapper(_wrapper_details('fastqc', '0.73', 'aaa')))
+        with open(self.path) as fp:
+            self.assertEqual(json.load(fp), {})
+        cache.flush()
+        with open(self.path) as fp:
+            data = json.load(fp)
+        self.assertEqual([x['revision'] for x in data['fastqc']], ['aaa'])
+
+    def test_flush_merges_file(self) -> None:
+        # entries written by other processes are preserved
+        cache = WrapperCache()
+        cache.get()
+        with open(self.path, 'w') as fp:
+            json.dump({'cutadapt': [Wrapper(_wrapper_details('cutadapt', '3.5', 'ccc')).to_dict()]}, fp)
+        cache.add(Wrapper(_wrapper_details('fastqc', '0.73', 'aaa')))
+        cache.flush()
+        with open(self.path) as fp:
+            data = json.load(fp)
+        self.assertIn('cutadapt', data)
+        self.assertIn('fastqc', data)
+
+
+class TestDownloadCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        patcher = mock.patch.object(settings.ingest.galaxy, 'DOWNLOADED_WRAPPERS_DIR', self.tmpdir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _make_tar(self, files: dict[str, bytes], mode: str='r:gz', modes: Optional[dict[str, int]]=None) -> tarfile.TarFile:
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode='w:gz') as tar:
+            for name, contents in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(contents)
+                info.mode = (modes or {}).get(name, 0o644)
+                tar.addfile(info, io.BytesIO(contents))
+        buffer.seek(0)
+        return tarfile.open(fileobj=buffer, mode=mode)
+
+    def test_existing_folders(self) -> None:
+        os.makedirs(os.path.join(self.tmpdir.name, 'fastqc-abc123'))
+        cache = DownloadCache()
+        self.assertEqual(cache.get('fastqc', 'abc123'), f'{self.tmpdir.name}{os.sep}fastqc-abc123')
+        self.assertIsNone(cache.get('fastqc', 'def456'))
+
+    def test_add_updates_listing(self) -> None:
+        cache = DownloadCache()
+        self.assertIsNone(cache.get('cutadapt', 'def456'))
+        cache.add(self._make_tar({'cutadapt-def456/cutadapt.xml': b'<tool id="cutadapt"/>'}))
+        self.assertEqual(cache.get('cutadapt', 'def456'), f'{self.tmpdir.name}{os.sep}cutadapt-def456')
+
+    def test_selective_extraction(self) -> None:
+        cache = DownloadCache()
+        tar = self._make_tar({
+            'cutadapt-def456/cutadapt.xml': b'<tool id="cutadapt"/>',
+            'cutadapt-def456/macros.xml': b'<macros/>',
+            'cutadapt-def456/scripts/summarise.py': b'print()',
+            'cutadapt-def456/scripts/run': b'#!/bin/sh',
+            'cutadapt-def456/tool-data/adapters.loc.sample': b'',
+            'cutadapt-def456/test-data/reads.fastq': b'@read1',
+            '../escape.xml': b'',
+        }, mode='r|gz', modes={'cutadapt-def456/scripts/run': 0o755})
+        cache.add(tar, etag='"abc"')
+        folder = os.path.join(self.tmpdir.name, 'cutadapt-def456')
+        extracted = sorted(os.path.relpath(os.path.join(d, f), folder) for d, _, files in os.walk(folder) for f in files)
+        self.assertEqual(extracted, [
+            MANIFEST_NAME,
+            'cutadapt.xml',
+            'macros.xml',
+            os.path.join('scripts', 'run'),
+            os.path.join('scripts', 'summarise.py'),
+            os.path.join('tool-data', 'adapters.loc.sample'),
+        ])
+        self.assertEqual(os.stat(os.path.join(folder, 'scripts', 'run')).st_mode & 0o777, 0o755)
+        self.assertEqual(os.stat(os.path.join(folder, 'cutadapt.xml')).st_mode & 0o777, 0o644)
+        with open(os.path.join(folder, MANIFEST_NAME)) as fp:
+            manifest = json.load(fp)
+        self.assertEqual(manifest['etag'], '"abc"')
+        self.assertEqual(manifest['size'], 46)
+        self.assertEqual(manifest['files']['scripts/summarise.py'], 7)
+        # staging directories are removed
+        self.assertEqual(os.listdir(self.tmpdir.name), ['cutadapt-def456'])
+
+    def test_incomplete_folder_replaced(self) -> None:
+        folder = os.path.join(self.tmpdir.name, 'cutadapt-def456')
+        os.makedirs(folder)
+        with open(os.path.join(folder, MANIFEST_NAME), 'w') as fp:
+            json.dump({'size': 10, 'files': {'cutadapt.xml': 10}, 'etag': None}, fp)
+        cache = DownloadCache()
+        self.assertIsNone(cache.get('cutadapt', 'def456'))
+        cache.add(self._make_tar({'cutadapt-def456/cutadapt.xml': b'<tool id="cutadapt"/>'}))
+        self.assertEqual(cache.get('cutadapt', 'def456'), folder)
+        self.assertTrue(os.path.exists(os.path.join(folder, 'cutadapt.xml')))
@@ -6,11 +6,13 @@ from typing import Any
 from janis_core import settings
 from janis_core.ingestion import ingest
 from janis_core.translations import translate
+from janis_core.translations import translate_many
 from janis_core.tests.testtools import FileOutputPythonTestTool
 from janis_core.tests.testtools import GridssTestTool
 from janis_core.tests.testworkflows import PruneFlatTW
 from janis_core.tests.testworkflows import PruneNestedTW
 from janis_core.tests.testworkflows import AssemblyTestWF
+from janis_core.tests.benchmarks.synthetic import ScatterHeavyWorkflow
 from janis_core.redefinitions.tools import Cat
 from janis_core.redefinitions.tools import GenerateVardictHeaderLines
 from janis_core.redefinitions.workflows import BwaAligner
@@ -23,9 +25,11 @@ from janis_core import CodeTool
 from janis_core.translations import nextflow
 from janis_core.translations.common import to_builders
 from janis_core.translations.common import prune_workflow
+from janis_core.translation_deps.exportpath import ExportPathKeywords
 from janis_core import settings
 
 import os 
+import tempfile
 import regex as re
 import yaml
 
@@ -124,6 +128,7 @@ def _reset_global_settings() -> None:
     
     nextflow.task_inputs.clear()
     nextflow.params.clear()
+    nextflow.naming.table.clear()
     settings.ingest.SAFE_MODE = False
     settings.ingest.galaxy.GEN_IMAGES = False
     settings.ingest.galaxy.DISABLE_CONTAINER_CACHE = False
@@ -815,6 +820,52 @@ class TestPreprocessingModes(unittest.TestCase):
 
 
 
+# ---- MULTI-TARGET TRANSLATION ------------------------------
+
+
+
+class TestTranslateMany(unittest.TestCase):
+    
+    def setUp(self) -> None:
+        _reset_global_settings()
+        settings.translate.TO_DISK = False
+        settings.translate.TO_CONSOLE = False
+        self.dests = ['cwl', 'nextflow', 'wdl']
+        self.filepath = f'{CWL_TESTDATA_PATH}/workflows/m-unlock/workflows/ngtax.cwl'
+        self.expected: dict[str, Any] = {}
+        for dest in self.dests:
+            _reset_global_settings()
+            wf = ingest(self.filepath, 'cwl')
+            self.expected[dest] = translate(wf, dest, to_console=False)
+        _reset_global_settings()
+
+    def test_serial(self) -> None:
+        wf = ingest(self.filepath, 'cwl')
+        actual = translate_many(wf, self.dests, to_console=False)
+        self.assertEqual(list(actual), self.dests)
+        for dest in self.dests:
+            self.assertEqual(actual[dest], self.expected[dest])
+
+    def test_parallel(self) -> None:
+        wf = ingest(self.filepath, 'cwl')
+        actual = translate_many(wf, self.dests, parallel=True, to_console=False)
+        for dest in self.dests:
+            self.assertEqual(actual[dest], self.expected[dest])
+
+    def test_export_paths(self) -> None:
+        wf = ingest(self.filepath, 'cwl')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            translate_many(wf, self.dests, parallel=True, export_path=tmpdir, to_console=False)
+            self.assertEqual(sorted(os.listdir(tmpdir)), self.dests)
+            for dest in self.dests:
+                self.assertGreater(len(os.listdir(os.path.join(tmpdir, dest))), 0)
+            # the per-backend directory isn't kept in the setting
+            self.assertEqual(settings.translate.EXPORT_PATH, tmpdir)
+        settings.translate.TO_DISK = False
+        settings.translate.EXPORT_PATH = ExportPathKeywords.default
+
+
+
 # ---- PREPROCESSING: TO BUILDERS ------------------------------
 
 
@@ -842,6 +893,32 @@ class TestPreprocessingToBuilders(unittest.TestCase):
         for step in entity.step_nodes.values():
             self.assertIsInstance(step.tool, CommandToolBuilder)
 
+    def test_shared_tool_identity(self) -> None:
+        entity = ScatterHeavyWorkflow()
+        entity = to_builders(entity)
+        assert(isinstance(entity, WorkflowBuilder))
+        tools: dict[str, Any] = {}
+        for step in entity.step_nodes.values():
+            self.assertIsInstance(step.tool, CommandToolBuilder)
+            self.assertIs(tools.setdefault(step.tool.versioned_id(), step.tool), step.tool)
+        self.assertEqual(len(tools), 2)
+
+    def test_shared_tool_identity_nested(self) -> None:
+        # tools are shared across subworkflows, not just within one workflow
+        entity = WGSGermlineMultiCallers()
+        entity = to_builders(entity)
+        assert(isinstance(entity, WorkflowBuilder))
+        tools: dict[str, Any] = {}
+        def check(wf: WorkflowBuilder) -> None:
+            for step in wf.step_nodes.values():
+                if isinstance(step.tool, WorkflowBuilder):
+                    check(step.tool)
+                else:
+                    self.assertIs(tools.setdefault(step.tool.versioned_id(), step.tool), step.tool)
+        check(entity)
+        # converting again is a no-op
+        self.assertIs(to_builders(entity), entity)
+
 
 
 # ---- FROM CWL ---------------------------
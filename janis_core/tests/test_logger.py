@@ -1,3 +1,4 @@
+import os
 from unittest import TestCase
 from janis_core.utils.logger import Logger, LogLevel, _bcolors
 
@@ -45,3 +46,54 @@ class TestLogger(TestCase):
 
     def test_set_console_level(self):
         Logger.set_console_level(LogLevel.DEBUG)
+
+
+class TestLoggerWrite(TestCase):
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "janis.log")
+        self.console_level = Logger.CONSOLE_LEVEL
+        Logger.set_console_level(None)
+        Logger.WRITE_LEVEL = LogLevel.DEBUG
+        Logger.set_write_location(self.path)
+
+    def tearDown(self):
+        Logger.set_write_location(None)
+        Logger.set_console_level(self.console_level)
+        self.tmpdir.cleanup()
+
+    def read_log(self) -> list[str]:
+        Logger.flush()
+        with open(self.path) as fp:
+            return fp.read().splitlines()
+
+    def test_written_in_order(self):
+        for i in range(100):
+            Logger.info(f"message {i}")
+        lines = self.read_log()
+        self.assertEqual(100, len(lines))
+        self.assertTrue(lines[0].endswith("[INFO]: message 0"))
+        self.assertTrue(lines[-1].endswith("[INFO]: message 99"))
+
+    def test_percent_args(self):
+        Logger.debug("tool %s (%d inputs)", "bwa", 3)
+        lines = self.read_log()
+        self.assertTrue(lines[0].endswith("[DEBUG]: tool bwa (3 inputs)"))
+
+    def test_callable_message(self):
+        Logger.info(lambda: "lazy")
+        lines = self.read_log()
+        self.assertTrue(lines[0].endswith("[INFO]: lazy"))
+
+    def test_level_gated_skips_formatting(self):
+        def fail():
+            raise AssertionError("message should not be formatted")
+        Logger.log(fail, LogLevel.VERBOSE)
+        self.assertEqual([], self.read_log())
+
+    def test_close_file_flushes(self):
+        Logger.info("before close")
+        Logger.close_file()
+        with open(self.path) as fp:
+            self.assertIn("before close", fp.read())
@@ -0,0 +1,172 @@
+import os
+import csv
+import json
+import tempfile
+import threading
+import unittest
+
+from janis_core import settings
+from janis_core.utils import profiling
+from janis_core.ingestion import ingest
+from janis_core.translations import translate
+from janis_core.translations import nextflow
+
+CWL_TESTDATA_PATH = os.path.join(os.getcwd(), 'janis_core/tests/data/cwl')
+
+
+def _reset_settings() -> None:
+    settings.profiling.ENABLED = False
+    settings.profiling.CPROFILE_PHASE = None
+    settings.profiling.CPROFILE_PATH = None
+    profiling.clear()
+
+
+class TestSpans(unittest.TestCase):
+
+    def setUp(self) -> None:
+        _reset_settings()
+        settings.profiling.ENABLED = True
+
+    def tearDown(self) -> None:
+        _reset_settings()
+
+    def test_disabled(self) -> None:
+        settings.profiling.ENABLED = False
+        with profiling.span('phase') as span:
+            profiling.count('items')
+        self.assertIsNone(span)
+        self.assertEqual(profiling.spans(), [])
+
+    def test_nesting(self) -> None:
+        with profiling.span('outer', tool='bwa'):
+            with profiling.span('inner'):
+                pass
+            with profiling.span('inner'):
+                pass
+        spans = profiling.spans()
+        self.assertEqual([s.name for s in spans], ['outer', 'inner', 'inner'])
+        outer, inner, _ = spans
+        self.assertEqual(outer.depth, 0)
+        self.assertIsNone(outer.parent)
+        self.assertEqual(outer.args, {'tool': 'bwa'})
+        self.assertEqual(inner.depth, 1)
+        self.assertEqual(inner.parent, 'outer')
+        self.assertGreaterEqual(outer.duration, inner.duration)
+
+    def test_count(self) -> None:
+        with profiling.span('outer'):
+            profiling.count('edges')
+            with profiling.span('inner'):
+                profiling.count('edges', 5)
+            profiling.count('edges')
+        outer, inner = profiling.spans()
+        self.assertEqual(outer.args['edges'], 2)
+        self.assertEqual(inner.args['edges'], 5)
+
+    def test_span_recorded_on_error(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with profiling.span('failing'):
+                raise RuntimeError
+        self.assertEqual([s.name for s in profiling.spans()], ['failing'])
+
+    def test_threads(self) -> None:
+        def work() -> None:
+            with profiling.span('worker'):
+                pass
+        with profiling.span('main'):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+        worker = [s for s in profiling.spans() if s.name == 'worker'][0]
+        self.assertEqual(worker.depth, 0)
+        self.assertIsNone(worker.parent)
+
+
+class TestExport(unittest.TestCase):
+
+    def setUp(self) -> None:
+        _reset_settings()
+        settings.profiling.ENABLED = True
+        with profiling.span('outer', category='translate', tool=object()):
+            with profiling.span('inner'):
+                profiling.count('files', 3)
+
+    def tearDown(self) -> None:
+        _reset_settings()
+
+    def test_chrome_trace(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'trace.json')
+            profiling.export_chrome_trace(path)
+            with open(path) as fp:
+                trace = json.load(fp)
+        events = trace['traceEvents']
+        self.assertEqual([e['name'] for e in events], ['outer', 'inner'])
+        self.assertTrue(all(e['ph'] == 'X' for e in events))
+        self.assertEqual(events[0]['cat'], 'translate')
+        self.assertEqual(events[0]['ts'], 0)
+        self.assertIsInstance(events[0]['args']['tool'], str)
+        self.assertEqual(events[1]['args'], {'files': 3})
+
+    def test_csv(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'trace.csv')
+            profiling.export_csv(path)
+            with open(path, newline='') as fp:
+                rows = list(csv.DictReader(fp))
+        self.assertEqual([r['name'] for r in rows], ['outer', 'inner'])
+        self.assertEqual(rows[1]['parent'], 'outer')
+        self.assertEqual(rows[1]['depth'], '1')
+        self.assertEqual(json.loads(rows[1]['args']), {'files': 3})
+
+
+class TestCProfile(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        _reset_settings()
+
+    def test_cprofile_phase(self) -> None:
+        _reset_settings()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'phase.prof')
+            settings.profiling.CPROFILE_PHASE = 'profiled'
+            settings.profiling.CPROFILE_PATH = path
+            with profiling.span('other'):
+                pass
+            with profiling.span('profiled'):
+                with profiling.span('profiled'):
+                    sorted(range(1000))
+            self.assertTrue(os.path.exists(path))
+        # cProfile capture doesn't require span recording
+        self.assertEqual(profiling.spans(), [])
+        stats = profiling.cprofile_stats()
+        self.assertIsNotNone(stats)
+        self.assertGreater(stats.total_calls, 0)  # type: ignore
+
+
+class TestPhases(unittest.TestCase):
+
+    def setUp(self) -> None:
+        _reset_settings()
+        nextflow.task_inputs.clear()
+        nextflow.params.clear()
+        nextflow.naming.table.clear()
+        settings.ingest.SAFE_MODE = False
+        settings.translate.MODE = 'regular'
+        settings.profiling.ENABLED = True
+
+    def tearDown(self) -> None:
+        _reset_settings()
+
+    def test_ingest_translate(self) -> None:
+        filepath = f'{CWL_TESTDATA_PATH}/workflows/m-unlock/workflows/ngtax.cwl'
+        wf = ingest(filepath, 'cwl')
+        translate(wf, 'cwl', to_console=False)
+        spans = profiling.spans()
+        names = [s.name for s in spans]
+        for phase in ['ingest', 'to_builders', 'prune_workflow', 'translate_workflow_internal', 'stringify', 'build_inputs']:
+            self.assertIn(phase, names)
+        tools = [s for s in spans if s.name == 'translate_tool']
+        self.assertGreater(len(tools), 0)
+        self.assertTrue(all(s.parent == 'translate_workflow_internal' or s.parent == 'translate_tool' for s in tools))
+        self.assertTrue(all('tool' in s.args for s in tools))
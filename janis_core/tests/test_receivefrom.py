@@ -4,6 +4,8 @@ from janis_core.types import UnionType
 
 from janis_core import String, Array, File, Int, Stdout
 from janis_core.types.common_data_types import Filename
+from janis_core.types import data_types
+from janis_core.types.data_types import clear_receive_cache
 
 
 class FileSubclass(File):
@@ -125,3 +127,49 @@ class TestReceiveFromUnion(unittest.TestCase):
         s1 = UnionType(String, Int)
         s2 = String()
         self.assertFalse(s2.can_receive_from(s1))
+
+
+class TestReceiveFromCache(unittest.TestCase):
+    def setUp(self):
+        clear_receive_cache()
+
+    def test_cached_result_matches(self):
+        pairs = [
+            (String(), String(optional=True)),
+            (Array(File()), Array(FileSubclass())),
+            (Array(FileSubclass()), Array(File())),
+            (UnionType(String, Int), Int()),
+            (Array(UnionType(String, Int)), Array(String())),
+            (Stdout(FileSubclass()), FileSubclass()),
+            (Filename(), String()),
+        ]
+        first = [a.can_receive_from(b) for a, b in pairs]
+        self.assertGreater(len(data_types._receive_cache), 0)
+        second = [a.can_receive_from(b) for a, b in pairs]
+        self.assertEqual(first, second)
+        self.assertEqual(first, [False, True, False, True, True, True, True])
+
+    def test_optional_is_part_of_key(self):
+        s1 = String()
+        s2 = String()
+        self.assertTrue(s2.can_receive_from(s1))
+        s1.optional = True
+        self.assertFalse(s2.can_receive_from(s1))
+        self.assertTrue(s2.can_receive_from(s1, source_has_default=True))
+
+    def test_nested_types_are_part_of_key(self):
+        a = Array(String())
+        self.assertTrue(a.can_receive_from(Array(String())))
+        self.assertFalse(a.can_receive_from(Array(Int())))
+        self.assertFalse(Array(Array(String())).can_receive_from(Array(Array(Int()))))
+
+    def test_super_call_not_cached_as_subclass(self):
+        # Filename overrides can_receive_from and calls super(): the parent
+        # implementation's answer must not be stored under the Filename key
+        self.assertTrue(Filename().can_receive_from(String()))
+        self.assertTrue(Filename().can_receive_from(String()))
+        self.assertFalse(String().can_receive_from(Int()))
+
+    def test_class_sources_not_cached(self):
+        self.assertTrue(File().can_receive_from(FileSubclass))
+        self.assertEqual(len(data_types._receive_cache), 0)
@@ -1,9 +1,10 @@
 import operator
 import os
 import importlib
+import tempfile
 from typing import Optional, List, Dict, Union
 from unittest import TestCase, mock
-from janis_core.tool.test_suite_runner import ToolTestSuiteRunner
+from janis_core.tool.test_suite_runner import ToolTestSuiteRunner, summarise_file
 from janis_core.tool.test_classes import (
     TTestCase,
     TTestExpectedOutput,
@@ -424,3 +425,93 @@ class TestToolTestRunner(TestCase):
             runner._extract_workflow_output(t, "/dir/sample.bam", File())
             == "/dir/sample.bai"
         )
+
+    def test_summarise_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "out.txt")
+            with open(path, "w") as f:
+                f.write("a\nb\nc")
+            summary = summarise_file(path)
+            assert summary.line_count == 3
+            assert summary.size == 5
+            assert summary.md5 == ToolTestSuiteRunner(self.tool).read_md5(path)
+            assert summarise_file(path) is summary
+
+            # rewritten files are summarised again
+            with open(path, "w") as f:
+                f.write("a\n")
+            os.utime(path, ns=(0, 0))
+            assert summarise_file(path).line_count == 1
+
+            # \r\n and lone \r end lines too, as when reading in text mode
+            with open(path, "wb") as f:
+                f.write(b"a\r\nb\rc\r")
+            os.utime(path, ns=(1, 1))
+            assert summarise_file(path).line_count == 3
+
+    def test_file_diff_identical(self):
+        runner = ToolTestSuiteRunner(self.tool)
+        file_path = os.path.join(self.test_data_dir, "test.txt")
+        assert runner.file_diff(file_path, file_path) == []
+
+    def test_file_diff_large(self):
+        runner = ToolTestSuiteRunner(self.tool)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            expected_path = os.path.join(tmpdir, "expected.txt")
+            output_path = os.path.join(tmpdir, "output.txt")
+            with open(expected_path, "w") as f:
+                f.write("a\nb\nc\nd\n")
+            with open(output_path, "w") as f:
+                f.write("a\nB\nc\nd\ne\n")
+
+            small = runner.file_diff(expected_path, output_path)
+            with mock.patch("janis_core.tool.test_suite_runner._DIFF_MAX_FILE_BYTES", 4):
+                streamed = runner.file_diff(expected_path, output_path)
+                assert streamed == [
+                    "--- expected",
+                    "+++ actual",
+                    "@@ -2,1 +2,1 @@",
+                    "-b\n",
+                    "+B\n",
+                    "@@ -4,0 +5,1 @@",
+                    "+e\n",
+                ]
+                assert runner.lines_diff(expected_path, output_path) == (2, 1)
+                with mock.patch("janis_core.tool.test_suite_runner._DIFF_MAX_HUNKS", 1):
+                    truncated = runner.file_diff(expected_path, output_path)
+                    assert truncated[-1] == "@@ diff truncated after 1 hunks @@"
+                    assert len(truncated) == 6
+            assert runner.lines_diff(expected_path, output_path) == (2, 1)
+            assert [l for l in small if l[:1] in "+-"] == [l for l in streamed if l[:1] in "+-"]
+
+    def test_run_test_cases(self):
+        runner = ToolTestSuiteRunner(self.tool)
+        test_cases = [
+            TTestCase(
+                name=f"test{i}",
+                input={"inp": f"input {i}"},
+                output=[
+                    TTestExpectedOutput(
+                        tag="tool_output",
+                        preprocessor=TTestPreprocessor.Value,
+                        operator=operator.eq,
+                        expected_value=f"input {i}",
+                    )
+                ],
+            )
+            for i in range(4)
+        ]
+
+        def run(input, engine, output_dir=None):
+            return {"tool_output": input["inp"], "output_dir": output_dir}
+
+        for workers in [1, 4]:
+            with mock.patch.object(runner, "run", side_effect=run):
+                results = runner.run_test_cases(
+                    test_cases, engine="cromwell", workers=workers
+                )
+            assert list(results) == [t.name for t in test_cases]
+            for name, (failed, succeeded, output) in results.items():
+                assert failed == []
+                assert len(succeeded) == 1
+                assert output["output_dir"] == os.path.join(runner.output_dir, name)
@@ -137,6 +137,30 @@ id: tid
 
         self.assertEqual(expected, self.translator.stringify_translated_tool(cwlobj))
 
+    def test_stringify_formatted_matches_cwlformat(self):
+        from cwlformat.formatter import cwl_format
+        from ruamel.yaml.scalarstring import DoubleQuotedScalarString
+
+        saved = {
+            "id": "tid",
+            "inputs": [
+                {
+                    "id": "inp",
+                    "type": ["File", "null"],
+                    "inputBinding": {"prefix": DoubleQuotedScalarString("-L")},
+                    "doc": "a" * 100,
+                }
+            ],
+            "outputs": [],
+            "arguments": [{"valueFrom": "a\nb", "position": 0.5}],
+            "cwlVersion": "v1.2",
+            "class": "CommandLineTool",
+        }
+        expected = cwl_format(
+            cwltranslate.SHEBANG + "\n" + self.translator.stringify_commentedmap(saved)
+        )
+        self.assertEqual(expected, cwltranslate.stringify_formatted(saved))
+
     def test_stringify_inputs(self):
         d = {"inp1": 1}
         self.assertEqual("inp1: 1\n", self.translator.stringify_translated_inputs(d))
@@ -117,7 +117,10 @@ from janis_core import (
     Tool,
     WorkflowBuilder,
     Workflow,
-    CommandToolBuilder
+    CommandToolBuilder,
+    ToolInput,
+    ToolOutput,
+    Stdout,
 )
 
 from janis_core.translations import translate
@@ -125,6 +128,7 @@ from janis_core.translations import NextflowTranslator as NextflowTranslator
 translator = NextflowTranslator()
 from janis_core.translations import nextflow
 
+from janis_core.translations.nextflow.generate.tasks import TaskGraph
 from janis_core.translations.nextflow.variables import VariableManager
 from janis_core.translations.nextflow.variables import VariableType
 from janis_core.translations.nextflow.variables import init_variable_manager_for_task
@@ -137,6 +141,7 @@ from janis_core import (
     Boolean,
     UnionType,
     Array,
+    Filename,
 )
 
 from janis_core.redefinitions.types import (
@@ -200,6 +205,7 @@ def reset_globals() -> None:
     settings.translate.nextflow.BASE_OUTDIR = os.getcwd()
     nextflow.task_inputs.clear()
     nextflow.params.clear()
+    nextflow.naming.table.clear()
 
 def do_preprocessing_workflow(wf: Workflow, ignore_task_inputs: bool=False) -> WorkflowBuilder:
     from janis_core.translations.common import prune_workflow
@@ -980,6 +986,80 @@ class TestVariableManager(unittest.TestCase):
 
 
 
+class TestNameTable(unittest.TestCase):
+
+    def setUp(self) -> None:
+        reset_globals()
+
+    def test_memoised(self) -> None:
+        first = nextflow.naming.constructs.gen_varname_channel('inFastq')
+        second = nextflow.naming.constructs.gen_varname_channel('inFastq')
+        self.assertEqual(first, 'ch_in_fastq')
+        self.assertIs(first, second)
+        self.assertEqual(len(nextflow.naming.table.name_table.names), 1)
+
+    def test_kinds_separate(self) -> None:
+        self.assertEqual(nextflow.naming.constructs.gen_varname_process('fastqc'), 'FASTQC')
+        self.assertEqual(nextflow.naming.constructs.gen_varname_file('fastqc'), 'fastqc')
+        self.assertEqual(nextflow.naming.table.collisions(), {})
+
+    def test_collisions(self) -> None:
+        nextflow.naming.constructs.gen_varname_channel('inFastq')
+        nextflow.naming.constructs.gen_varname_channel('in_fastq')
+        self.assertEqual(
+            nextflow.naming.table.collisions(),
+            {('channel', 'ch_in_fastq'): ['inFastq', 'in_fastq']}
+        )
+
+    def test_collisions_already_formatted(self) -> None:
+        # an identifier already in the target case still collides with others generating its name
+        nextflow.naming.constructs.gen_varname_file('foo_bar')
+        nextflow.naming.constructs.gen_varname_file('fooBar')
+        self.assertEqual(
+            nextflow.naming.table.collisions(),
+            {('file', 'foo_bar'): ['foo_bar', 'fooBar']}
+        )
+
+    def test_step_alias_not_process(self) -> None:
+        # a step's alias can match the name of the process it calls
+        nextflow.naming.constructs.gen_varname_process('QC_FLAG')
+        nextflow.naming.constructs.gen_varname_step('qc_flag')
+        self.assertEqual(nextflow.naming.table.collisions(), {})
+
+    def test_params_scoped_by_task(self) -> None:
+        name1 = nextflow.naming.constructs.gen_varname_param('stepA', 'process', 'inFastq')
+        name2 = nextflow.naming.constructs.gen_varname_param('stepB', 'process', 'in_fastq')
+        self.assertEqual(name1, 'step_a.in_fastq')
+        self.assertEqual(name2, 'step_b.in_fastq')
+        self.assertEqual(nextflow.naming.table.collisions(), {})
+
+    def test_wide_workflow(self) -> None:
+        # benchmark: 5,000 workflow inputs feeding 100 steps.
+        # budget is generous - this previously took minutes due to per-input rescans.
+        import time
+        tool = CommandToolBuilder(
+            tool='wideTool',
+            base_command='echo',
+            inputs=[ToolInput(f'inp{j}', String(optional=True), prefix=f'--inp{j}') for j in range(50)],
+            outputs=[ToolOutput('out', Stdout())],
+            container='ubuntu:latest',
+            version='1',
+        )
+        wf = WorkflowBuilder('wideWorkflow')
+        for i in range(5000):
+            wf.input(f'sampleInput{i}', String(optional=True))
+        for s in range(100):
+            wf.step(f'stepNumber{s}', tool(**{f'inp{j}': wf[f'sampleInput{s*50+j}'] for j in range(50)}))
+        wf.output('out', source=wf['stepNumber0'].out)
+
+        start = time.perf_counter()
+        _, inputs_str, _ = translate(wf, dest_fmt='nextflow', to_console=False)
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 60)
+        self.assertIn('sample_input4999', inputs_str)
+        self.assertEqual(nextflow.naming.table.collisions(), {})
+
+
 
 
 class TestToGroovyStr(unittest.TestCase):
@@ -2594,6 +2674,39 @@ class TestSubWorkflows(unittest.TestCase):
     def setUp(self) -> None:
         reset_globals()
 
+    def test_task_graph_order(self) -> None:
+        wf = do_preprocessing_workflow(SubworkflowTestWF())
+        graph = TaskGraph(wf)
+        self.assertEqual(
+            list(graph.processes), 
+            ['FileTestTool', 'StringTestTool', 'StringOptTestTool', 'IntTestTool']
+        )
+        # subworkflows before the workflows which call them
+        self.assertEqual(
+            list(graph.workflows), 
+            ['OrangesWorkflow', 'ApplesWorkflow', 'SubworkflowTestWF']
+        )
+        self.assertEqual(graph.workflows['ApplesWorkflow'].dependencies, ['OrangesWorkflow'])
+        self.assertTrue(graph.workflows['ApplesWorkflow'].is_subworkflow)
+        self.assertFalse(graph.workflows['SubworkflowTestWF'].is_subworkflow)
+
+    def test_task_graph_run(self) -> None:
+        wf = do_preprocessing_workflow(SubworkflowTestWF())
+        graph = TaskGraph(wf)
+        results: dict[str, list[str]] = {}
+        def func(node: Any) -> list[str]:
+            # dependencies are always done first
+            for dep in node.dependencies:
+                self.assertIn(dep, results)
+            return node.dependencies
+        nodes = list(graph.workflows.values())
+        out = graph.run(nodes, func, results=results)
+        self.assertEqual(list(out), ['OrangesWorkflow', 'ApplesWorkflow', 'SubworkflowTestWF'])
+
+        # callers which haven't generated a workflow's subworkflows first
+        with self.assertRaises(RuntimeError):
+            graph.run(list(reversed(nodes)), func)
+
 
 
 
@@ -2883,6 +2996,35 @@ class TestEntityTracing(unittest.TestCase):
         expected_scatter = True
         self.assertEqual(actual_scatter, expected_scatter)
 
+    def test_analysis_memoised(self) -> None:
+        src = self.wf.step_nodes['stp4'].sources['inp']
+        analysis = trace.analyse(src)
+        self.assertIs(trace.analyse(src), analysis)
+        # public functions return copies
+        entities = trace.trace_entities(src)
+        entities.clear()
+        self.assertEqual(len(trace.trace_entities(src)), 9)
+        trace.clear_cache()
+        self.assertIsNot(trace.analyse(src), analysis)
+
+    def test_referenced_variables_filename(self) -> None:
+        tool = CommandToolBuilder(
+            tool='FilenameRefTestTool',
+            base_command='echo',
+            inputs=[
+                ToolInput('reads', File, position=1),
+                ToolInput('outname', Filename(prefix=InputSelector('reads'), extension='.txt'), position=2),
+                ToolInput('label', Filename(extension='.log'), position=3),
+            ],
+            outputs=[ToolOutput('out', File, selector=InputSelector('outname'))],
+            container='ubuntu:latest',
+            version='TEST',
+        )
+        tinputs = {x.id(): x for x in tool._inputs}  # type: ignore
+        self.assertEqual(trace.trace_referenced_variables(tinputs['outname'], tool), {'reads'})
+        self.assertEqual(trace.trace_referenced_variables(tool._outputs[0], tool), {'reads'})  # type: ignore
+        self.assertEqual(trace.trace_referenced_variables(InputSelector('label'), tool), {'label'})
+
 
 class TestPlumbingModule(unittest.TestCase):
     """tests the public functions in nfgen.plumbing."""
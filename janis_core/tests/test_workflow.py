@@ -1,3 +1,5 @@
+import gc
+import copy
 from unittest import TestCase
 
 from janis_core.operators import InputNodeSelector
@@ -12,6 +14,7 @@ from janis_core import (
     InputDocumentation,
     InputQualityType,
 )
+from janis_core.graph.node import Node
 from janis_core.graph.steptaginput import StepTagInput, first_value, Edge
 from janis_core.tests.testtools import SingleTestTool, ArrayStepTool
 
@@ -358,3 +361,86 @@ class TestCaptureInputsFromTool(TestCase):
 
         self.assertEqual(len(Tool.tool_inputs()) - 1, len(d))
         self.assertNotIn("input1", d)
+
+
+class TestWorkflowGraphIndex(TestCase):
+    def setUp(self):
+        Logger.mute()
+        self.w = WorkflowBuilder("graphindex")
+        self.w.input("inp", String)
+        self.w.input("inp2", String(optional=True))
+        self.w.step("stpA", SingleTestTool(input1=self.w.inp))
+        self.w.step("stpB", SingleTestTool(input1=self.w.stpA.out, input2=self.w.inp))
+        self.w.output("out", source=self.w.stpB.out)
+
+    def tearDown(self):
+        Logger.unmute()
+
+    def test_consumers(self):
+        self.assertListEqual([("stpA", "input1"), ("stpB", "input2")], self.w.consumers_of("inp"))
+        self.assertListEqual([("stpB", "input1")], self.w.consumers_of("stpA"))
+        self.assertListEqual([("out", None)], self.w.consumers_of("stpB"))
+        self.assertListEqual([], self.w.consumers_of("inp2"))
+
+    def test_producers(self):
+        self.assertListEqual(["inp"], self.w.producers_of("stpA"))
+        self.assertListEqual(["stpA", "inp"], self.w.producers_of("stpB"))
+        self.assertListEqual(["stpB"], self.w.producers_of("out"))
+
+    def test_updated_by_step(self):
+        self.assertListEqual([], self.w.consumers_of("inp2"))
+        self.w.step("stpC", SingleTestTool(input1=self.w.stpB.out, input2=self.w.inp2))
+        self.assertListEqual([("stpC", "input2")], self.w.consumers_of("inp2"))
+        self.assertListEqual(["stpA", "stpB", "stpC"], self.w.topological_order())
+
+    def test_operator_sources(self):
+        self.w.step("stpC", SingleTestTool(input1=self.w.inp.as_str() + self.w.stpA.out))
+        self.assertListEqual(["inp", "stpA"], self.w.producers_of("stpC"))
+
+    def test_invalidate(self):
+        self.assertListEqual(["stpA", "inp"], self.w.producers_of("stpB"))
+        del self.w.stpB.sources["input2"]
+        self.w.invalidate_graph_index()
+        self.assertListEqual(["stpA"], self.w.producers_of("stpB"))
+        self.assertListEqual([("stpA", "input1")], self.w.consumers_of("inp"))
+
+    def test_topological_order(self):
+        self.assertListEqual(["stpA", "stpB"], self.w.topological_order())
+        self.assertEqual(
+            {"stpB"}, WorkflowBuilder.get_step_ids_from_selector(self.w.stpB.out)
+        )
+
+
+class TestWorkflowGraphMemory(TestCase):
+    def setUp(self):
+        Logger.mute()
+        self.w = WorkflowBuilder("graphmemory")
+        self.w.input("inp", String)
+        self.w.step("stp", SingleTestTool(input1=self.w.inp))
+        self.w.output("out", source=self.w.stp.out)
+
+    def tearDown(self):
+        Logger.unmute()
+
+    def test_slotted(self):
+        stptag = self.w.stp.sources["input1"]
+        for obj in [self.w.input_nodes["inp"], self.w.output_nodes["out"], stptag, stptag.source_map[0], self.w.stp.out]:
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_copy(self):
+        edge = self.w.stp.sources["input1"].source_map[0]
+        edge_copy = copy.copy(edge)
+        self.assertIs(edge.source, edge_copy.source)
+        self.assertIs(edge.finish, edge_copy.finish)
+        self.assertEqual(edge.ftag, edge_copy.ftag)
+        inp = self.w.input_nodes["inp"]
+        inp_copy = copy.copy(inp)
+        self.assertEqual("inp", inp_copy.id())
+        self.assertIs(inp.datatype, inp_copy.datatype)
+
+    def test_nodes_released(self):
+        nodeid = self.w.input_nodes["inp"]._nodeId
+        self.assertIs(self.w.input_nodes["inp"], Node._N_nodeId_map[nodeid])
+        del self.w
+        gc.collect()
+        self.assertNotIn(nodeid, Node._N_nodeId_map)
@@ -1,6 +1,8 @@
 
 
 import re
+import functools
+from copy import copy
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional, Any, Union, Callable, Set, Tuple
 from uuid import uuid4
@@ -278,6 +280,37 @@ class ToolOutput:
         return f"{self.__class__.__name__}({attrs})"
 
 
+# (definition method, tool class) -> value. see CommandTool.SHARED_DEFINITIONS
+_shared_definitions: dict[tuple[Callable, type], Any] = {}
+
+SHARED_DEFINITION_METHODS = ("inputs", "arguments", "outputs")
+
+
+def shared_definition(method: Callable) -> Callable:
+    """
+    Caches the result of a definition method (eg inputs()) per tool class, for
+    classes with SHARED_DEFINITIONS set. Lists & dicts are shallow-copied on return
+    so callers can't alter the cached value; the items themselves are shared.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self):
+        cls = type(self)
+        if not cls.SHARED_DEFINITIONS:
+            return method(self)
+        key = (method, cls)
+        if key not in _shared_definitions:
+            _shared_definitions[key] = method(self)
+        value = _shared_definitions[key]
+        if isinstance(value, list):
+            return list(value)
+        if isinstance(value, dict):
+            return dict(value)
+        return value
+
+    return wrapper
+
+
 class CommandTool(Tool, ABC):
     """
     A CommandTool is an interface between Janis and a program to be executed.
@@ -286,6 +319,17 @@ class CommandTool(Tool, ABC):
     This class can be inherited to created a CommandTool, else a CommandToolBuilder may be used.
     """
 
+    # Set to True on tools whose inputs(), arguments() and outputs() don't depend on
+    # instance state: each is then built once per class and shared by every instance.
+    SHARED_DEFINITIONS: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in SHARED_DEFINITION_METHODS:
+            method = cls.__dict__.get(name)
+            if callable(method) and not getattr(method, "__isabstractmethod__", False):
+                setattr(cls, name, shared_definition(method))
+
     def __init__(self, **connections):
         super().__init__(metadata_class=ToolMetadata, **connections)
 
@@ -450,15 +494,25 @@ class CommandTool(Tool, ABC):
     def type(cls):
         return ToolType.CommandTool
 
+    @shared_definition
     def tool_inputs(self) -> List[TInput]:
         return [
             TInput(t.id(), t.input_type, default=t.default, doc=t.doc)
             for t in self.inputs()
         ]
 
+    @shared_definition
     def tool_outputs(self) -> List[TOutput]:
         return [TOutput(t.id(), t.output_type, doc=t.doc) for t in self.outputs()]
 
+    @shared_definition
+    def inputs_map(self) -> Dict[str, TInput]:
+        return super().inputs_map()
+
+    @shared_definition
+    def outputs_map(self) -> Dict[str, TOutput]:
+        return super().outputs_map()
+
     def all_input_keys(self):
         return super().all_input_keys() + [
             "runtime_memory",
@@ -638,15 +692,19 @@ OUTPUTS:
         return wf
 
     def to_command_tool_builder(self):
+        # copied: builders are modified during translation, and these may be shared (see SHARED_DEFINITIONS)
+        arguments = self.arguments()
+        if arguments is not None:
+            arguments = [copy(a) for a in arguments]
         return CommandToolBuilder(
             tool=self.tool(),
             base_command=self.base_command(),
-            inputs=self.inputs(),
-            outputs=self.outputs(),
+            inputs=[copy(i) for i in self.inputs()],
+            outputs=[copy(o) for o in self.outputs()],
             container=self.container(),
             version=self.version(),
             friendly_name=self.friendly_name(),
-            arguments=self.arguments(),
+            arguments=arguments,
             env_vars=self.env_vars(),
             tool_module=self.tool_module(),
             tool_provider=self.tool_provider(),
@@ -1,9 +1,15 @@
 import difflib
 import hashlib
+import itertools
 import os
+import threading
 import urllib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple, Set
 
+from janis_core import settings
+
 from janis_core.tool.tool import Tool
 from janis_core.tool.test_classes import (
     TTestExpectedOutput,
@@ -17,6 +23,123 @@ from janis_core.utils.secondary import apply_secondary_file_format_to_filename
 from janis_core import Logger
 
 
+@dataclass(frozen=True)
+class FileSummary:
+    md5: str
+    size: int
+    line_count: int
+
+
+_CHUNK_SIZE = 1024 * 1024
+# files up to this size are diffed with difflib; larger files get a streamed, bounded diff
+_DIFF_MAX_FILE_BYTES = 10 * 1024 * 1024
+_DIFF_MAX_HUNKS = 100
+_DIFF_MAX_OUTPUT_BYTES = 1024 * 1024
+_summary_cache: Dict[Tuple[str, int, int], FileSummary] = {}
+_summary_lock = threading.Lock()
+
+
+def summarise_file(file_path: str) -> FileSummary:
+    """
+    Stream a file once, computing its md5 checksum, size and line count.
+    Lines are counted as when reading the file in text mode: \\n, \\r\\n and a lone \\r
+    all end a line. Results are cached by (path, mtime, size), so expected files shared between
+    test cases, and outputs checked by several expected outputs, are only read once.
+
+    :param file_path: full path to a file
+    :type file_path: str
+
+    :return: md5, size and line count of the file
+    :rtype: FileSummary
+    """
+    stat = os.stat(file_path)
+    key = (os.path.realpath(file_path), stat.st_mtime_ns, stat.st_size)
+    with _summary_lock:
+        if key in _summary_cache:
+            return _summary_cache[key]
+
+    hash_md5 = hashlib.md5()
+    size = 0
+    line_count = 0
+    last_byte = b""
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            hash_md5.update(chunk)
+            size += len(chunk)
+            line_count += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+            # \r\n split across chunks
+            if last_byte == b"\r" and chunk[:1] == b"\n":
+                line_count -= 1
+            last_byte = chunk[-1:]
+    # a final line without a trailing newline still counts
+    if size and last_byte not in (b"\n", b"\r"):
+        line_count += 1
+
+    summary = FileSummary(md5=hash_md5.hexdigest(), size=size, line_count=line_count)
+    with _summary_lock:
+        _summary_cache[key] = summary
+    return summary
+
+
+def _streamed_diff(expected_file_path: str, output_file_path: str) -> List[str]:
+    """
+    Diff two files without loading either, for files too large for difflib.
+    Lines are compared by position (insertions and deletions aren't realigned),
+    and the diff stops after _DIFF_MAX_HUNKS hunks or _DIFF_MAX_OUTPUT_BYTES of diff lines.
+
+    :return: a list of unified diff style lines
+    :rtype: List[str]
+    """
+    diff = ["--- expected", "+++ actual"]
+    with open(expected_file_path) as expected_file, open(output_file_path) as output_file:
+        runs = _differing_runs(expected_file, output_file)
+        size = 0
+        for n_hunks, (start, removed, added) in enumerate(runs, 1):
+            diff.append(
+                f"@@ -{_hunk_range(start, len(removed))} +{_hunk_range(start, len(added))} @@"
+            )
+            diff.extend("-" + line for line in removed)
+            diff.extend("+" + line for line in added)
+            size += sum(len(line) for line in removed) + sum(len(line) for line in added)
+            if n_hunks >= _DIFF_MAX_HUNKS or size >= _DIFF_MAX_OUTPUT_BYTES:
+                diff.append(f"@@ diff truncated after {n_hunks} hunks @@")
+                break
+    return diff
+
+
+def _differing_runs(expected_lines, output_lines):
+    # yields (first line number, expected lines, actual lines) for each run of differing lines.
+    # a run is cut short once it holds _DIFF_MAX_OUTPUT_BYTES, as the diff stops there anyway
+    removed: List[str] = []
+    added: List[str] = []
+    start = size = 0
+    for number, (expected, actual) in enumerate(
+        itertools.zip_longest(expected_lines, output_lines), 1
+    ):
+        if expected == actual:
+            if removed or added:
+                yield start, removed, added
+                removed, added, size = [], [], 0
+            continue
+        if not (removed or added):
+            start = number
+        if expected is not None:
+            removed.append(expected)
+            size += len(expected)
+        if actual is not None:
+            added.append(actual)
+            size += len(actual)
+        if size >= _DIFF_MAX_OUTPUT_BYTES:
+            break
+    if removed or added:
+        yield start, removed, added
+
+
+def _hunk_range(start: int, length: int) -> str:
+    # unified diff ranges: an empty range refers to the line before it
+    return f"{start if length else start - 1},{length}"
+
+
 class ToolTestSuiteRunner:
     """
     A class to read tool test cases, run the test cases, and assert the expected output
@@ -52,7 +175,9 @@ class ToolTestSuiteRunner:
                 )
         return self._config
 
-    def run(self, input: Dict[str, str], engine: str) -> Dict[str, Any]:
+    def run(
+        self, input: Dict[str, str], engine: str, output_dir: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Run a tool or workflow given a list of input using the specified engine
 
@@ -60,6 +185,8 @@ class ToolTestSuiteRunner:
         :type input: Dict[str, str]
         :param engine: name of engine to run this workflow/tool on
         :type engine: str
+        :param output_dir: directory to run in, defaults to the runner's output_dir
+        :type output_dir: Optional[str]
 
         :return:
         :rtype: Dict[str, Any]
@@ -74,15 +201,48 @@ class ToolTestSuiteRunner:
         output = run_with_outputs(
             tool=self.tool,
             inputs=input,
-            output_dir=self.output_dir,
+            output_dir=output_dir or self.output_dir,
             engine=engine,
             config=self.config,
         )
 
         return output
 
+    def run_test_cases(
+        self, test_cases: List[TTestCase], engine: str, workers: Optional[int] = None
+    ) -> Dict[str, Tuple[Set, Set, Dict]]:
+        """
+        Run test cases concurrently, each in its own output directory
+
+        :param test_cases: test cases to run
+        :type test_cases: List[TTestCase]
+        :param engine: name of engine to run this workflow/tool on
+        :type engine: str
+        :param workers: how many test cases to run at once, defaults to settings.testing.TEST_SUITE_WORKERS
+        :type workers: Optional[int]
+
+        :return: (failed, succeeded, output) for each test case, keyed by test case name
+        :rtype: Dict[str, Tuple[Set, Set, Dict]]
+        """
+        workers = workers or settings.testing.TEST_SUITE_WORKERS
+
+        def run_test_case(t: TTestCase) -> Tuple[Set, Set, Dict]:
+            output_dir = os.path.join(self.output_dir, t.name)
+            return self.run_one_test_case(t, engine=engine, output_dir=output_dir)
+
+        if workers <= 1 or len(test_cases) <= 1:
+            return {t.name: run_test_case(t) for t in test_cases}
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {t.name: pool.submit(run_test_case, t) for t in test_cases}
+            return {name: future.result() for name, future in futures.items()}
+
     def run_one_test_case(
-        self, t: TTestCase, engine: str, output: Optional[Dict] = None
+        self,
+        t: TTestCase,
+        engine: str,
+        output: Optional[Dict] = None,
+        output_dir: Optional[str] = None,
     ) -> Tuple[Set, Set, Dict]:
         """
         Run one test case and assert multiple expected output
@@ -91,13 +251,15 @@ class ToolTestSuiteRunner:
         :type t: TTestCase
         :param engine: name of engine to run this workflow/tool on
         :type engine: str
+        :param output_dir: directory to run in, defaults to the runner's output_dir
+        :type output_dir: Optional[str]
 
         :return: A tuple of failed error messages and successful expected output
         :rtype: Tuple[Set, Set]
         """
         # If output is provided, we don't want to re-run the workflow
         if output is None:
-            output = self.run(input=t.input, engine=engine)
+            output = self.run(input=t.input, engine=engine, output_dir=output_dir)
 
         failed = []
         succeeded = []
@@ -223,7 +385,7 @@ class ToolTestSuiteRunner:
         elif test_logic.preprocessor == TTestPreprocessor.FileMd5:
             value = self.read_md5(output_value)
         elif test_logic.preprocessor == TTestPreprocessor.FileSize:
-            value = os.path.getsize(output_value)
+            value = summarise_file(output_value).size
         elif test_logic.preprocessor == TTestPreprocessor.LineCount:
             value = self.line_count(output_type=output_type, output_value=output_value)
         elif test_logic.preprocessor == TTestPreprocessor.ListSize:
@@ -364,11 +526,7 @@ class ToolTestSuiteRunner:
         :return: md5 checksum of a file
         :rtype: str
         """
-        hash_md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        return summarise_file(file_path).md5
 
     def file_diff(
         self,
@@ -377,7 +535,8 @@ class ToolTestSuiteRunner:
         output_content: Optional[str] = None,
     ) -> List[str]:
         """
-        Create a list if file diff result between two files
+        Create a list if file diff result between two files.
+        Files larger than _DIFF_MAX_FILE_BYTES get a bounded, line by line diff (see _streamed_diff)
 
         :param expected_file_path: path to the source file to perform diff with
         :type expected_file_path: str
@@ -389,6 +548,15 @@ class ToolTestSuiteRunner:
         :return: a list of diff output
         :rtype: List[str]
         """
+        # identical files have an empty diff: compare digests without loading either file
+        if output_file_path is not None:
+            expected_summary = summarise_file(expected_file_path)
+            output_summary = summarise_file(output_file_path)
+            if expected_summary == output_summary:
+                return []
+            if max(expected_summary.size, output_summary.size) > _DIFF_MAX_FILE_BYTES:
+                return _streamed_diff(expected_file_path, output_file_path)
+
         with open(expected_file_path) as expected_file:
             expected_content = list(expected_file)
 
@@ -443,8 +611,7 @@ class ToolTestSuiteRunner:
 
         if isinstance(output_type, File):
             # text file only here
-            with open(output_value) as fp:
-                value = sum(1 for _ in fp)
+            value = summarise_file(output_value).line_count
         elif isinstance(output_type, String):
             value = len(output_value.splitlines())
         else:
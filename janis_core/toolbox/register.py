@@ -90,7 +90,7 @@ class TaggedRegistry(Generic[T]):
             versions_without_default.remove(self.default_tag)
 
         Logger.debug(
-            f"'{type_name}' has {len(versions_without_default)} versions ({', '.join(versions_without_default)})"
+            lambda: f"'{type_name}' has {len(versions_without_default)} versions ({', '.join(versions_without_default)})"
         )
         if tag is None or tag == self.default_tag:
             if self.default_tag in tagged_objs:
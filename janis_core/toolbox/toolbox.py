@@ -71,7 +71,7 @@ class JanisShed:
             t = f"The tool {tool.id()} did not have a version and will not be registered"
             Logger.critical(t)
             return False
-        Logger.log("Adding tool: " + tool.id())
+        Logger.log("Adding tool: %s", LogLevel.VERBOSE, tool.id())
 
         JanisShed._byclassname.register(tool.__class__.__name__, tool)
         return JanisShed._toolshed.register(tool.id().lower(), v.lower(), tool)
@@ -205,7 +205,7 @@ class JanisShed:
     def traverse_module(module, seen_modules: set, seen_classes: set, current_layer=1):
         if module.__name__ in seen_modules:
             return
-        Logger.log("Traversing module " + str(module.__name__))
+        Logger.log("Traversing module %s", LogLevel.VERBOSE, module.__name__)
         seen_modules.add(module.__name__)
 
         q = {
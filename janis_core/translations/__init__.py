@@ -1,12 +1,26 @@
 
 
 from . import common
-from .wdl import WdlTranslator
-from .cwl import CwlTranslator
-from .nextflow import NextflowTranslator
 from .translationbase import TranslatorBase
 
 from .main import translate
+from .main import translate_many
 from .main import get_translator
 from .main import build_resources_input
-from .main import build_resources_file
\ No newline at end of file
+from .main import build_resources_file
+
+
+# translators are imported on first access (see get_translator()). 
+# this keeps 'import janis_core.translations' cheap when only one backend is used.
+_LAZY_TRANSLATORS = {
+    'CwlTranslator': '.cwl',
+    'WdlTranslator': '.wdl',
+    'NextflowTranslator': '.nextflow',
+}
+
+def __getattr__(name: str):
+    if name in _LAZY_TRANSLATORS:
+        from importlib import import_module
+        module = import_module(_LAZY_TRANSLATORS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,61 @@
 
+
+from typing import Optional
+
 from janis_core import Workflow, WorkflowBuilder
 from janis_core import CommandTool, CommandToolBuilder
 from janis_core import Tool
 
 
-def to_builders(entity: Tool) -> Tool:
+class BuilderMemo:
+    """
+    conversions made during a single to_builders() call.
+    'by_identity' maps id(original) -> converted entity, so an object reached through
+    many steps is converted once. 'by_id' maps (class, versioned_id) -> converted entity,
+    so separate instances of the same tool / subworkflow definition share one builder.
+    the class is part of the key as distinct definitions occasionally reuse an id.
+    """
+    def __init__(self) -> None:
+        self.by_identity: dict[int, Tool] = {}
+        self.by_id: dict[tuple[type, str], Tool] = {}
+
+    def get(self, entity: Tool) -> Optional[Tool]:
+        if id(entity) in self.by_identity:
+            return self.by_identity[id(entity)]
+        return self.by_id.get((type(entity), entity.versioned_id()))
+
+    def add(self, original: Tool, converted: Tool) -> None:
+        self.by_identity[id(original)] = converted
+        self.by_identity[id(converted)] = converted
+        self.by_id.setdefault((type(original), original.versioned_id()), converted)
+
+
+def to_builders(entity: Tool, memo: Optional[BuilderMemo]=None) -> Tool:
+    memo = memo if memo is not None else BuilderMemo()
     if isinstance(entity, Workflow):
+        if id(entity) in memo.by_identity:
+            return memo.by_identity[id(entity)]
+        if not isinstance(entity, WorkflowBuilder):
+            converted = memo.get(entity)
+            if converted is not None:
+                memo.by_identity[id(entity)] = converted
+                return converted
+        # mark as visited so steps are only walked once per workflow object
+        memo.by_identity[id(entity)] = entity
         for step in entity.step_nodes.values():
-            step.tool = to_builders(step.tool)
+            step.tool = to_builders(step.tool, memo)
         if not isinstance(entity, WorkflowBuilder):
-            entity = to_workflow_builder(entity)
+            builder = to_workflow_builder(entity)
+            memo.add(entity, builder)
+            entity = builder
     elif isinstance(entity, CommandTool) and not isinstance(entity, CommandToolBuilder):
-        entity = to_commandtool_builder(entity)
+        converted = memo.get(entity)
+        if converted is None:
+            converted = to_commandtool_builder(entity)
+            memo.add(entity, converted)
+        else:
+            memo.by_identity[id(entity)] = converted
+        entity = converted
     return entity
 
 def to_workflow_builder(workflow: Workflow) -> WorkflowBuilder:
@@ -42,4 +86,3 @@ def to_workflow_builder(workflow: Workflow) -> WorkflowBuilder:
 
 def to_commandtool_builder(tool: CommandTool) -> CommandToolBuilder:
     return tool.to_command_tool_builder()
-
@@ -4,7 +4,6 @@ from collections import Counter
 from janis_core.workflow.workflow import Workflow, InputNode
 from janis_core.types import File, Filename
 from janis_core import translation_utils as utils
-from janis_core.translations.common import trace
 
 
 
@@ -49,21 +48,12 @@ def _get_input_node_reference_counts(wf: Workflow) -> dict[str, int]:
     """
     counts = Counter()
 
-    for step in wf.step_nodes.values():
-        for tinput_id, src in step.sources.items():
-            refs = trace.trace_referenced_variables(src, wf)
-            refs = _filter_to_input_node_refs(refs, wf)
-            for ref in refs:
-                counts[ref] += 1
+    for input_node_id in wf.input_nodes:
+        for consumer_id, _ in wf.consumers_of(input_node_id):
+            if consumer_id in wf.step_nodes:
+                counts[input_node_id] += 1
     return counts
 
-def _filter_to_input_node_refs(references: set[str], wf: Workflow) -> set[str]:
-    out: set[str] = set()
-    for ref in references:
-        if ref in wf.input_nodes:
-            out.add(ref)
-    return out
-
 def get_file_wf_inputs(wf: Workflow) -> set[str]:
     # wf inputs with file type
     out: set[str] = set()
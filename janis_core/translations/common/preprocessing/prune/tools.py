@@ -104,6 +104,7 @@ def prune_sources(local_wf: WorkflowBuilder, tool_id: str, valid_tinput_ids: set
             do_prune_sources(step, valid_tinput_ids)
         else:
             continue
+    local_wf.invalidate_graph_index()
 
 def do_prune_sources(step: StepNode, valid_tinput_ids: set[str]) -> None:
     # remove sources which are not needed
@@ -165,6 +166,10 @@ def do_prune_tool_inputs(tool: CommandToolBuilder, valid_tinput_ids: set[str]) -
     
     for i in sorted(items_to_delete, reverse=True):
         del tool._inputs[i]     # type: ignore
+    
+    # previous traces may have followed InputSelectors into the removed tinputs
+    if items_to_delete:
+        trace.clear_cache()
 
 def do_prune_tool_arguments(tool: CommandToolBuilder, valid_tinput_ids: set[str]) -> None:
     # early exit
@@ -184,4 +189,7 @@ def do_prune_tool_arguments(tool: CommandToolBuilder, valid_tinput_ids: set[str]
     for i in sorted(items_to_delete, reverse=True):
         del tool._arguments[i]     # type: ignore
     
+    if items_to_delete:
+        trace.clear_cache()
+    
 
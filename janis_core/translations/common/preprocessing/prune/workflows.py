@@ -1,8 +1,6 @@
 
 
 from janis_core import WorkflowBuilder
-from janis_core.operators import InputNodeSelector
-from janis_core.translations.common import trace
 
 
 def prune_main_workflow_inputs(wf: WorkflowBuilder) -> None:
@@ -12,6 +10,7 @@ def prune_main_workflow_inputs(wf: WorkflowBuilder) -> None:
     invalid_workflow_inputs = set(wf.input_nodes.keys()) - valid_workflow_inputs
     for tinput_id in invalid_workflow_inputs:
         del wf.input_nodes[tinput_id]
+    wf.invalidate_graph_index()
 
 def get_mandatory_input_ids(wf: WorkflowBuilder) -> set[str]:
     collected_ids: set[str] = set()
@@ -25,11 +24,10 @@ def get_mandatory_input_ids(wf: WorkflowBuilder) -> set[str]:
 def get_referenced_input_ids(wf: WorkflowBuilder) -> set[str]:
     collected_ids: set[str] = set()
     
-    for step in wf.step_nodes.values():
-        for src in step.sources.values():
-            entities = trace.trace_entities(src)
-            for entity in entities:
-                if isinstance(entity, InputNodeSelector):
-                    collected_ids.add(entity.input_node.id())
+    for tinput_id in wf.input_nodes:
+        for consumer_id, _ in wf.consumers_of(tinput_id):
+            if consumer_id in wf.step_nodes:
+                collected_ids.add(tinput_id)
+                break
 
     return collected_ids
\ No newline at end of file
@@ -1,8 +1,8 @@
 
 
-from abc import ABC, abstractmethod
 from typing import Any, Optional
 from collections import defaultdict
+from dataclasses import dataclass, field
 
 
 from janis_core.graph.steptaginput import Edge, StepTagInput
@@ -63,23 +63,13 @@ from janis_core import translation_utils as utils
 
 
 def trace_entities(entity: Any, tool: Optional[Tool]=None) -> list[Any]:
-    tracer = EntityTracer(tool)
-    tracer.trace(entity)
-    return tracer.entities
+    return list(analyse(entity, tool).entities)
 
 def trace_entity_counts(entity: Any, tool: Optional[Tool]=None) -> dict[str, int]:
-    tracer = EntityTracer(tool)
-    tracer.trace(entity)
-    counter: dict[str, int] = defaultdict(int)
-    for e in tracer.entities:
-        ename = e.__class__.__name__
-        counter[ename] += 1
-    return counter
+    return defaultdict(int, analyse(entity, tool).entity_counts)
 
 def trace_source_datatype(entity: Any, tool: Optional[Tool]=None) -> Optional[DataType]:
-    tracer = SourceDatatypeTracer(tool)
-    tracer.trace(entity)
-    src_types = tracer.datatypes
+    src_types = analyse(entity, tool).datatypes
     if len(src_types) == 0:
         return None
     elif len(src_types) == 1:
@@ -92,269 +82,181 @@ def trace_source_datatype(entity: Any, tool: Optional[Tool]=None) -> Optional[Da
     return 
 
 def trace_source_scatter(entity: Any, tool: Optional[Tool]=None) -> bool:
-    tracer = SourceScatterTracer(tool)
-    tracer.trace(entity)
-    return tracer.source_scatter
+    return analyse(entity, tool).source_scatter
 
 def trace_referenced_variables(entity: Any, tool: Optional[Tool]=None) -> set[str]:
-    tracer = ReferencedVariableTracer(tool)
+    return set(analyse(entity, tool).variables)
+
+
+
+### ANALYSIS ###
+
+# facts gathered while walking an entity. 
+# each stops at a different point, so the walk tracks which are still collecting.
+ENTITIES = 1
+DATATYPES = 2
+SCATTER = 4
+VARIABLES = 8
+ALL = ENTITIES | DATATYPES | SCATTER | VARIABLES
+
+
+@dataclass
+class TraceAnalysis:
+    entities: list[Any] = field(default_factory=list)
+    datatypes: list[DataType] = field(default_factory=list)
+    source_scatter: bool = False
+    variables: set[str] = field(default_factory=set)
+    entity_counts: dict[str, int] = field(default_factory=dict)
+
+
+# (id(entity), id(tool)) -> (entity, tool, analysis).
+# entity & tool are held so their ids can't be reused while cached.
+_cache: dict[tuple[int, int], tuple[Any, Optional[Tool], TraceAnalysis]] = {}
+
+# id(tool) -> (tool, {input id: tool input})
+_tool_inputs: dict[int, tuple[Tool, dict[str, ToolInput | TInput]]] = {}
+
+def clear_cache() -> None:
+    """
+    forgets previous analyses. 
+    must be called whenever tool inputs / arguments / outputs are modified (eg pruning).
+    """
+    _cache.clear()
+    _tool_inputs.clear()
+
+def analyse(entity: Any, tool: Optional[Tool]=None, pending: Optional[set[int]]=None) -> TraceAnalysis:
+    """
+    walks 'entity' once, gathering each fact used by the trace_* functions.
+    results are memoised by entity & tool identity. callers must not modify them.
+    """
+    key = (id(entity), id(tool))
+    if key in _cache:
+        return _cache[key][2]
     
+    analyser = TraceAnalyser(tool, pending)
+    analyser.pending.add(id(entity))
+    if isinstance(entity, (ToolInput, ToolArgument, ToolOutput)):
+        # referenced variables look inside the tool component itself
+        analyser.trace(entity, ALL & ~VARIABLES)
+        for item in tool_component_items(entity):
+            analyser.trace(item, VARIABLES)
+    else:
+        analyser.trace(entity, ALL)
+    analyser.pending.discard(id(entity))
+
+    analysis = analyser.analysis
+    counter: dict[str, int] = defaultdict(int)
+    for e in analysis.entities:
+        counter[e.__class__.__name__] += 1
+    analysis.entity_counts = dict(counter)
+    _cache[key] = (entity, tool, analysis)
+    return analysis
+
+def tool_component_items(entity: ToolInput | ToolArgument | ToolOutput) -> list[Any]:
     if isinstance(entity, ToolInput):
         # value, prefix, datatype
-        items_to_trace = [entity.value, entity.prefix, entity.input_type]
-        items_to_trace = [x for x in items_to_trace if x is not None]
-        for item in items_to_trace:
-            tracer.trace(item)
-    
+        items = [entity.value, entity.prefix, entity.input_type]
+        return [x for x in items if x is not None]
     elif isinstance(entity, ToolArgument):
-        tracer.trace(entity.prefix)
-        tracer.trace(entity.value)
-    
-    elif isinstance(entity, ToolOutput):
-        tracer.trace(entity.selector)
-    
+        return [entity.prefix, entity.value]
     else:
-        tracer.trace(entity)
+        return [entity.selector]
 
-    return tracer.variables
+def tool_inputs_index(tool: Tool) -> dict[str, ToolInput | TInput]:
+    if id(tool) not in _tool_inputs:
+        index: dict[str, ToolInput | TInput] = {}
+        for tinput in tool.inputs():
+            index.setdefault(tinput.id(), tinput)
+        _tool_inputs[id(tool)] = (tool, index)
+    return _tool_inputs[id(tool)][1]
 
 
 
-class Tracer(ABC):
+class TraceAnalyser:
     
-    def __init__(self, tool: Optional[Tool]=None):
+    def __init__(self, tool: Optional[Tool]=None, pending: Optional[set[int]]=None):
         self.tool = tool
-        self.single_arg_trace_types = {
-            IsDefined,
-            AssertNotNull,
-            FloorOperator,
-            CeilOperator,
-            RoundOperator,
-            AsStringOperator,
-            AsBoolOperator,
-            AsIntOperator,
-            AsFloatOperator,
-            ReadContents,
-            ReadJsonOperator,
-            BasenameOperator,
-            NamerootOperator,
-            NameextOperator,
-            TransposeOperator,
-            LengthOperator,
-            RangeOperator,
-            FlattenOperator,
-            FileSizeOperator,
-            FirstOperator,
-            FilterNullOperator,
-        }
-
-        self.multi_arg_trace_types = {
-            If,
-            IndexOperator,
-            JoinOperator,
-            ApplyPrefixOperator,
-            ReplaceOperator,
-        }
-
-        self.custom_trace_funcs = {
-            # primitives
-            list: self.trace_list,
-
-            # datatypes
-            Filename: self.filename,
-
-            # selectors
-            ToolInput: self.tool_input,
-            ToolArgument: self.tool_argument,
-            AliasSelector: self.alias_selector,
-            InputNodeSelector: self.input_node_selector,
-            WildcardSelector: self.wildcard_selector,
-            InputSelector: self.input_selector,
-            StepOutputSelector: self.step_output_selector,
-            MemorySelector: self.resource_selector,
-            CpuSelector: self.resource_selector,
-            DiskSelector: self.resource_selector,
-            TimeSelector: self.resource_selector,
-
-            # misc 
-            StepTagInput: self.step_tag_input,
-            Edge: self.edge,
-            StringFormatter: self.string_formatter,
-            # InputNode: self.input_node,
-        }
-
-    @abstractmethod
-    def trace(self, entity: Any) -> None:
-        ...
-    
-    def do_trace(self, entity: Any) -> None:
+        self.analysis = TraceAnalysis()
+        # entities whose referenced variables are currently being analysed (avoids self-reference loops)
+        self.pending: set[int] = pending if pending is not None else set()
+
+    def trace(self, entity: Any, active: int) -> None:
+        ### ENTITIES ###
+        if active & ENTITIES:
+            self.analysis.entities.append(entity)
+        
+        ### SOURCE DATATYPE ###
+        if active & DATATYPES:
+            # reached a leaf node (a data source)
+            if isinstance(entity, (InputNodeSelector, StepOutputSelector)):
+                self.handle_source(entity)
+                active &= ~DATATYPES
+            
+            # edge case: IndexOperator, where the target is the source
+            elif isinstance(entity, IndexOperator):
+                target: Any = entity.args[0]  # type: ignore
+                if isinstance(target, (InputNodeSelector, StepOutputSelector)):
+                    self.handle_source(target, array_to_single=True)
+                    active &= ~DATATYPES
+        
+        ### SOURCE SCATTER ###
+        # only steps have scatter, so only StepOutputSelector needs to be checked. 
+        if active & SCATTER and isinstance(entity, StepOutputSelector):
+            if entity.node.scatter:
+                self.analysis.source_scatter = True
+            active &= ~SCATTER
+
+        ### REFERENCED VARIABLES ###
+        # reached a leaf node (variable reference to tool input)
+        if active & VARIABLES and isinstance(entity, (ToolInput, TInput, InputNode)):
+            # we need to check whether the TInput is a deadend.
+            # in the case of a Filename type, can always guarantee a value? I hope?
+            dtype = self.get_datatype(entity)
+            if isinstance(dtype, Filename):
+                referenced_ids: set[str] = set()
+                if id(entity) not in self.pending:
+                    referenced_ids = analyse(entity, self.tool, self.pending).variables
+                if not referenced_ids:
+                    self.analysis.variables.add(entity.id())
+                    active &= ~VARIABLES
+            else:
+                self.analysis.variables.add(entity.id())
+                active &= ~VARIABLES
+
+        ### CONTINUE TRACING ###
+        if active:
+            self.do_trace(entity, active)
+
+    def do_trace(self, entity: Any, active: int) -> None:
         etype = type(entity)
 
         if etype in self.custom_trace_funcs:
             func = self.custom_trace_funcs[etype]
-            func(entity)
+            func(self, entity, active)
         
         elif isinstance(entity, SingleValueOperator):
-            self.operator_single_arg_trace(entity)
+            self.operator_single_arg_trace(entity, active)
         
         elif isinstance(entity, TwoValueOperator):
-            self.operator_multi_arg_trace(entity)
+            self.operator_multi_arg_trace(entity, active)
         
         elif etype in self.single_arg_trace_types:
-            self.operator_single_arg_trace(entity)
+            self.operator_single_arg_trace(entity, active)
         
         elif etype in self.multi_arg_trace_types:
-            self.operator_multi_arg_trace(entity)
+            self.operator_multi_arg_trace(entity, active)
         
         else:
             pass
 
-    def operator_single_arg_trace(self, entity: Operator) -> None:
-        self.trace(entity.args[0])
-    
-    def operator_multi_arg_trace(self, entity: Operator) -> None:
-        for arg in entity.args:
-            self.trace(arg)
-
-    def trace_list(self, entity: list[Any]) -> None:
-        for item in entity:
-            self.trace(item)
-            
-    def tool_input(self, entity: ToolInput | TInput) -> None:
-        # the toolinput name
-        self.trace(entity.id())
-        dtype = entity.input_type if isinstance(entity, ToolInput) else entity.intype
-        # the datatype if it is a Filename type
-        if isinstance(dtype, Filename):
-            self.trace(dtype)
-    
-    def tool_argument(self, entity: ToolArgument) -> None:
-        self.trace(entity.prefix)
-        self.trace(entity.value)
-    
-    def tool_output(self, entity: ToolOutput) -> None:
-        self.trace(entity.selector)
-
-    def alias_selector(self, entity: AliasSelector) -> None:
-        self.trace(entity.inner_selector)
-        self.trace(entity.data_type)
-
-    def input_node_selector(self, entity: InputNodeSelector) -> None:
-        self.trace(entity.input_node)
-
-    def wildcard_selector(self, entity: WildcardSelector) -> None:
-        # TODO check
-        self.trace(entity.wildcard)
-
-    def input_selector(self, entity: InputSelector) -> None:
-        # a tool input
-        assert(isinstance(self.tool, CommandTool | CodeTool))
-        tinputs = [x for x in self.tool.inputs() if x.id() == entity.input_to_select]
-        if not tinputs:
-            return
-        self.trace(tinputs[0])
-
-    def step_output_selector(self, entity: StepOutputSelector) -> None:
-        # TODO check
-        self.trace(entity.node)
-        self.trace(entity.tag)
-
-    def resource_selector(self, entity: ResourceSelector) -> None:
-        if hasattr(entity, 'resource_to_select'):
-            self.trace(entity.resource_to_select)
-        if hasattr(entity, 'resource_type'):
-            self.trace(entity.resource_type)
-        if hasattr(entity, 'default'):
-            self.trace(entity.default)
-
-    # def cpu_selector(self, entity: CpuSelector) -> None:
-    #     if hasattr(entity, 'resource_to_select'):
-    #         self.trace(entity.resource_to_select)
-    #     if hasattr(entity, 'resource_type'):
-    #         self.trace(entity.resource_type)
-    #     if hasattr(entity, 'default'):
-    #         self.trace(entity.default)
-
-    # def disk_selector(self, entity: DiskSelector) -> None:
-    #     if hasattr(entity, 'resource_to_select'):
-    #         self.trace(entity.resource_to_select)
-    #     if hasattr(entity, 'resource_type'):
-    #         self.trace(entity.resource_type)
-    #     if hasattr(entity, 'default'):
-    #         self.trace(entity.default)
-
-    # def time_selector(self, entity: TimeSelector) -> None:
-    #     if hasattr(entity, 'resource_to_select'):
-    #         self.trace(entity.resource_to_select)
-    #     if hasattr(entity, 'resource_type'):
-    #         self.trace(entity.resource_type)
-    #     if hasattr(entity, 'default'):
-    #         self.trace(entity.default)
-
-    def step_tag_input(self, entity: StepTagInput) -> None:
-        for src in entity.source_map:
-            self.trace(src)
-
-    def edge(self, entity: Edge) -> None:
-        self.trace(entity.source)
-
-    def string_formatter(self, entity: StringFormatter) -> None:
-        # trace the value of each keyword
-        for item in entity.kwargs.values():
-            self.trace(item)
-
-    def filename(self, entity: Filename) -> None:
-        self.trace(entity.prefix)
-        self.trace(entity.suffix)
-        self.trace(entity.extension)
-
-
-
-class EntityTracer(Tracer):
-
-    def __init__(self, tool: Optional[Tool]=None):
-        super().__init__(tool)
-        self.entities: list[Any] = []
-        self.is_first_call = True
-    
-    def trace(self, entity: Any) -> None:
-        ### CLASS SPECIFIC ###
-        # if self.is_first_call:
-        #     self.is_first_call = False
-        # else:
-        self.entities.append(entity)
-        
-        ### CONTINUE TRACING ###
-        self.do_trace(entity)
-
-
-class SourceDatatypeTracer(Tracer):
-
-    def __init__(self, tool: Optional[Tool]=None):
-        super().__init__(tool)
-        self.datatypes: list[DataType] = []
-    
-    def trace(self, entity: Any) -> None:
-        ### CLASS SPECIFIC ###
-        # reached a leaf node (a data source)
-        if self.have_reached_source(entity):
-            self.handle_source(entity)
-            return 
-
-        # edge case: IndexOperator, where the target is the source
-        elif isinstance(entity, IndexOperator):
-            target: Any = entity.args[0]  # type: ignore
-            if self.have_reached_source(target):
-                self.handle_source(target, array_to_single=True)
-                return 
-        
-        ### CONTINUE TRACING ###
-        self.do_trace(entity)
-
-    def have_reached_source(self, entity: Any) -> bool:
-        if isinstance(entity, InputNodeSelector) or isinstance(entity, StepOutputSelector):
-            return True
-        return False
+    def get_datatype(self, entity: Any) -> Optional[DataType]:
+        if isinstance(entity, ToolInput):
+            return entity.input_type
+        elif isinstance(entity, TInput):
+            return entity.intype
+        elif isinstance(entity, InputNode):
+            return entity.datatype
+        return None
 
     def handle_source(self, entity: InputNodeSelector | StepOutputSelector, array_to_single: bool=False) -> None:
         # reached an InputNodeSelector: get source datatype from InputNode
@@ -378,67 +280,139 @@ class SourceDatatypeTracer(Tracer):
             dtype = utils.get_base_type(dtype)
             dtype = utils.ensure_single_type(dtype)
         
-        self.datatypes.append(dtype)
-
-
+        self.analysis.datatypes.append(dtype)
 
-class SourceScatterTracer(Tracer):
+    def operator_single_arg_trace(self, entity: Operator, active: int) -> None:
+        self.trace(entity.args[0], active)
     
-    def __init__(self, tool: Optional[Tool]=None):
-        super().__init__(tool)
-        self.source_scatter: bool = False
+    def operator_multi_arg_trace(self, entity: Operator, active: int) -> None:
+        for arg in entity.args:
+            self.trace(arg, active)
 
-    def trace(self, entity: Any) -> None:
-        ### CLASS SPECIFIC ###
-        # only steps have scatter, so only StepOutputSelector needs to be checked. 
-        if isinstance(entity, StepOutputSelector):
-            self.handle_step_output_selector(entity)
-            return
+    def trace_list(self, entity: list[Any], active: int) -> None:
+        for item in entity:
+            self.trace(item, active)
+            
+    def tool_input(self, entity: ToolInput | TInput, active: int) -> None:
+        # the toolinput name
+        self.trace(entity.id(), active)
+        dtype = entity.input_type if isinstance(entity, ToolInput) else entity.intype
+        # the datatype if it is a Filename type
+        if isinstance(dtype, Filename):
+            self.trace(dtype, active)
+    
+    def tool_argument(self, entity: ToolArgument, active: int) -> None:
+        self.trace(entity.prefix, active)
+        self.trace(entity.value, active)
 
-        ### CONTINUE TRACING ###
-        self.do_trace(entity)
+    def alias_selector(self, entity: AliasSelector, active: int) -> None:
+        self.trace(entity.inner_selector, active)
+        self.trace(entity.data_type, active)
 
-    def handle_step_output_selector(self, entity: StepOutputSelector) -> None:
-        # we have found the step which feeds the data.
-        # check if the step is scattered. 
-        step = entity.node
-        if step.scatter:
-            self.source_scatter = True
+    def input_node_selector(self, entity: InputNodeSelector, active: int) -> None:
+        self.trace(entity.input_node, active)
 
-        
+    def wildcard_selector(self, entity: WildcardSelector, active: int) -> None:
+        # TODO check
+        self.trace(entity.wildcard, active)
 
-class ReferencedVariableTracer(Tracer):
+    def input_selector(self, entity: InputSelector, active: int) -> None:
+        # a tool input
+        if not isinstance(self.tool, CommandTool | CodeTool):
+            return
+        tinput = tool_inputs_index(self.tool).get(entity.input_to_select)
+        if tinput is None:
+            return
+        self.trace(tinput, active)
 
-    def __init__(self, tool: Optional[Tool]=None):
-        super().__init__(tool)
-        self.variables: set[str] = set()
+    def step_output_selector(self, entity: StepOutputSelector, active: int) -> None:
+        # TODO check
+        self.trace(entity.node, active)
+        self.trace(entity.tag, active)
 
-    def get_datatype(self, entity: Any) -> Optional[DataType]:
-        if isinstance(entity, ToolInput):
-            return entity.input_type
-        elif isinstance(entity, TInput):
-            return entity.intype
-        elif isinstance(entity, InputNode):
-            return entity.datatype
-        return None
-    
-    def trace(self, entity: Any) -> None:
-        ### CLASS SPECIFIC ###
-        # reached a leaf node (variable reference to tool input)
-        if isinstance(entity, (ToolInput, TInput, InputNode)):
-            # we need to check whether the TInput is a deadend.
-            # in the case of a Filename type, can always guarantee a value? I hope?
-            dtype = self.get_datatype(entity)
-            if isinstance(dtype, Filename):
-                referenced_ids = trace_referenced_variables(entity, self.tool)
-                if not referenced_ids:
-                    self.variables.add(entity.id())
-                    return
+    def resource_selector(self, entity: ResourceSelector, active: int) -> None:
+        if hasattr(entity, 'resource_to_select'):
+            self.trace(entity.resource_to_select, active)
+        if hasattr(entity, 'resource_type'):
+            self.trace(entity.resource_type, active)
+        if hasattr(entity, 'default'):
+            self.trace(entity.default, active)
 
-            else:
-                self.variables.add(entity.id())
-                return
+    def step_tag_input(self, entity: StepTagInput, active: int) -> None:
+        for src in entity.source_map:
+            self.trace(src, active)
 
-        ### CONTINUE TRACING ###
-        self.do_trace(entity)
+    def edge(self, entity: Edge, active: int) -> None:
+        self.trace(entity.source, active)
 
+    def string_formatter(self, entity: StringFormatter, active: int) -> None:
+        # trace the value of each keyword
+        for item in entity.kwargs.values():
+            self.trace(item, active)
+
+    def filename(self, entity: Filename, active: int) -> None:
+        self.trace(entity.prefix, active)
+        self.trace(entity.suffix, active)
+        self.trace(entity.extension, active)
+
+    ### DISPATCH TABLES ###
+    # shared by all instances. custom_trace_funcs are looked up by exact type.
+
+    single_arg_trace_types = frozenset({
+        IsDefined,
+        AssertNotNull,
+        FloorOperator,
+        CeilOperator,
+        RoundOperator,
+        AsStringOperator,
+        AsBoolOperator,
+        AsIntOperator,
+        AsFloatOperator,
+        ReadContents,
+        ReadJsonOperator,
+        BasenameOperator,
+        NamerootOperator,
+        NameextOperator,
+        TransposeOperator,
+        LengthOperator,
+        RangeOperator,
+        FlattenOperator,
+        FileSizeOperator,
+        FirstOperator,
+        FilterNullOperator,
+    })
+
+    multi_arg_trace_types = frozenset({
+        If,
+        IndexOperator,
+        JoinOperator,
+        ApplyPrefixOperator,
+        ReplaceOperator,
+    })
+
+    custom_trace_funcs = {
+        # primitives
+        list: trace_list,
+
+        # datatypes
+        Filename: filename,
+
+        # selectors
+        ToolInput: tool_input,
+        ToolArgument: tool_argument,
+        AliasSelector: alias_selector,
+        InputNodeSelector: input_node_selector,
+        WildcardSelector: wildcard_selector,
+        InputSelector: input_selector,
+        StepOutputSelector: step_output_selector,
+        MemorySelector: resource_selector,
+        CpuSelector: resource_selector,
+        DiskSelector: resource_selector,
+        TimeSelector: resource_selector,
+
+        # misc 
+        StepTagInput: step_tag_input,
+        Edge: edge,
+        StringFormatter: string_formatter,
+        # InputNode: self.input_node,
+    }
@@ -26,6 +26,8 @@ from typing import Union
 
 
 import ruamel.yaml
+from ruamel.yaml.comments import CommentedMap
+from ruamel.yaml.scalarstring import FoldedScalarString
 import cwl_utils.parser.cwl_v1_2 as cwlgen
 
 from janis_core import settings
@@ -68,6 +70,7 @@ from janis_core.types.common_data_types import (
     Directory,
 )
 from janis_core.utils.logger import Logger
+from janis_core.utils import profiling
 from janis_core.utils.metadata import ToolMetadata
 from janis_core.workflow.workflow import StepNode, InputNode, OutputNode
 
@@ -101,13 +104,10 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
         if as_json:
             return json.dumps(saved)
 
-        formatted = SHEBANG + "\n" + CwlTranslator.stringify_commentedmap(saved)
         if should_format:
-            from cwlformat.formatter import cwl_format
+            return stringify_formatted(saved)
 
-            formatted = cwl_format(formatted)
-
-        return formatted
+        return SHEBANG + "\n" + CwlTranslator.stringify_commentedmap(saved)
 
     @staticmethod
     def stringify_translated_tool(
@@ -118,13 +118,10 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
         if as_json:
             return json.dumps(saved)
 
-        formatted = SHEBANG + "\n" + CwlTranslator.stringify_commentedmap(saved)
         if should_format:
-            from cwlformat.formatter import cwl_format
-
-            formatted = cwl_format(formatted)
+            return stringify_formatted(saved)
 
-        return formatted
+        return SHEBANG + "\n" + CwlTranslator.stringify_commentedmap(saved)
 
     @staticmethod
     def stringify_translated_inputs(inputs):
@@ -209,11 +206,13 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
                 tools.update(subtools)
             
             elif isinstance(tool, CommandTool):
-                tool_cwl = cls.translate_tool_internal(tool)
+                with profiling.span('translate_tool', category='translate', tool=tool.id()):
+                    tool_cwl = cls.translate_tool_internal(tool)
                 tools[tool.versioned_id()] = tool_cwl
             
             elif isinstance(tool, CodeTool):
-                tool_cwl = cls.translate_code_tool_internal(tool)
+                with profiling.span('translate_tool', category='translate', tool=tool.id()):
+                    tool_cwl = cls.translate_code_tool_internal(tool)
                 tools[tool.versioned_id()] = tool_cwl
             
             else:
@@ -999,6 +998,55 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
 # matcher_single_quote = re.compile("[^\\\]'")
 
 
+def stringify_formatted(saved: dict[str, Any]) -> str:
+    """
+    Single-pass equivalent of cwlformat's cwl_format(SHEBANG + yaml.dump(saved)).
+    Rather than dumping the saved document, re-parsing it and dumping it again,
+    the saved dict is reordered and styled directly then dumped once.
+    """
+    from cwlformat.formatter import yaml as cwlformat_yaml
+
+    stream = StringIO()
+    cwlformat_yaml.dump(format_cwl_node(saved, []), stream)
+    return SHEBANG + "\n" + stream.getvalue()
+
+
+def format_cwl_node(node: Any, node_path: list[Any]) -> Any:
+    """
+    Mirrors cwlformat.formatter.format_node(). The old dump -> reparse roundtrip
+    dropped quoting styles carried over from ingested documents (eg prefix: "-L"),
+    so quoted scalars are normalised to plain str here to keep output identical.
+    """
+    from cwlformat.formatter import (
+        Literal,
+        reorder_node,
+        add_space_between_main_sections,
+    )
+
+    if isinstance(node, str):
+        if len(node) > 80:
+            return Literal(node)
+        elif isinstance(node, (Literal, FoldedScalarString)):
+            return node
+        return str(node)
+
+    elif isinstance(node, dict):
+        formatted = CommentedMap(
+            [
+                (str(k) if isinstance(k, str) else k, format_cwl_node(v, node_path + [k]))
+                for k, v in reorder_node(node, node_path)
+            ]
+        )
+        if formatted.get("class") in ["CommandLineTool", "ExpressionTool", "Workflow"]:
+            add_space_between_main_sections(formatted)
+        return formatted
+
+    elif isinstance(node, list):
+        return [format_cwl_node(v, node_path) for v in node]
+
+    return node
+
+
 def prepare_escaped_string(value: str):
     return json.dumps(value)[1:-1]
 
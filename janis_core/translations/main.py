@@ -1,15 +1,20 @@
 
 
+import os
 from typing import Optional, Any
 from inspect import isclass
+from concurrent.futures import ThreadPoolExecutor
 
 from janis_core import settings
 from janis_core import CodeTool, CommandTool, WorkflowBase, WorkflowBuilder
 from janis_core import Tool
 from janis_core.utils import lowercase_dictkeys
+from janis_core.utils import profiling
 from janis_core.translation_deps.supportedtranslations import SupportedTranslation
+from janis_core.translation_deps.exportpath import ExportPathKeywords
 from janis_core.translations.common import to_builders
 from janis_core.translations.common import prune_workflow
+from janis_core.translations.common import trace
 from .translationbase import TranslatorBase
 
 
@@ -51,6 +56,105 @@ def translate(
     
     # settings 
     settings.translate.DEST = dest_fmt             # set translate dest
+    _apply_settings(
+        entity,
+        mode=mode,
+        to_disk=to_disk,
+        export_path=export_path,
+        should_zip=should_zip,
+        to_console=to_console,
+        tool_to_console=tool_to_console,
+        write_inputs_file=write_inputs_file,
+        source_files=source_files,
+        additional_inputs=additional_inputs,
+        hints=hints,
+        with_container=with_container,
+        allow_empty_container=allow_empty_container,
+        container_override=container_override,
+        with_resource_overrides=with_resource_overrides,
+        merge_resources=merge_resources,
+        max_cores=max_cores,
+        max_mem=max_mem,
+        max_duration=max_duration,
+        render_comments=render_comments,
+        should_validate=should_validate,
+    )
+
+    # preprocessing
+    entity = _preprocess(entity)
+
+    # select the translation unit 
+    translator = get_translator(dest_fmt)
+
+    # do translation 
+    return _translate_entity(translator, entity)
+
+def translate_many(
+    entity: Tool,
+    dest_fmts: list[str],
+    parallel: bool = False,
+    **options: Any,
+) -> dict[str, Any]:
+    """
+    Translates an entity to several destination formats.
+    Preprocessing (to_builders, prune_workflow) runs once, and every backend
+    translates the same preprocessed model, which backends must not mutate.
+
+    'options' are the keyword arguments of translate(). When writing to disk,
+    each backend writes to its own directory: '{language}' is appended to
+    the export path (for the duration of the call) unless it already contains it.
+    settings.translate.DEST is left unchanged, as backends share settings.
+
+    With 'parallel', backends run concurrently on a thread pool.
+    Returns {dest_fmt: translate() result}.
+    """
+    _apply_settings(entity, **options)
+    export_path = settings.translate.EXPORT_PATH
+    if settings.translate.TO_DISK and ExportPathKeywords.workflow_spec not in export_path:
+        settings.translate.EXPORT_PATH = os.path.join(export_path, ExportPathKeywords.workflow_spec)
+
+    try:
+        entity = _preprocess(entity)
+        translators = {dest_fmt: get_translator(dest_fmt) for dest_fmt in dest_fmts}
+
+        if not parallel or len(translators) <= 1:
+            return {
+                dest_fmt: _translate_entity(translator, entity)
+                for dest_fmt, translator in translators.items()
+            }
+
+        with ThreadPoolExecutor(max_workers=len(translators)) as pool:
+            futures = {
+                dest_fmt: pool.submit(_translate_entity, translator, entity)
+                for dest_fmt, translator in translators.items()
+            }
+            return {dest_fmt: future.result() for dest_fmt, future in futures.items()}
+    finally:
+        settings.translate.EXPORT_PATH = export_path
+
+def _apply_settings(
+    entity: Tool,
+    mode: Optional[str] = None,
+    to_disk: Optional[bool] = None,
+    export_path: Optional[str] = None,
+    should_zip: Optional[bool] = None,   
+    to_console: Optional[bool] = None,
+    tool_to_console: Optional[bool] = None,
+    write_inputs_file: Optional[bool] = None,
+    source_files: Optional[list[str]] = None,
+    additional_inputs: Optional[dict[str, str]] = None,
+    hints: Optional[dict[str, str]] = None,
+    with_container: Optional[bool] = None,
+    allow_empty_container: Optional[bool] = None,
+    container_override: Optional[str | dict[str, Any]] = None,
+    with_resource_overrides: Optional[bool] = None,
+    merge_resources: Optional[bool] = None,
+    max_cores: Optional[int] = None,
+    max_mem: Optional[int] = None,
+    max_duration: Optional[int] = None,
+    render_comments: Optional[bool] = None,
+    should_validate: Optional[bool] = None,
+) -> None:
     settings.validation.STRICT_IDENTIFIERS = False
     settings.validation.VALIDATE_STRINGFORMATTERS = False
     
@@ -98,16 +202,18 @@ def translate(
     if max_mem is not None:
         settings.translate.MAX_MEM = max_mem
 
-    # preprocessing
-    entity = to_builders(entity)
+def _preprocess(entity: Tool) -> Tool:
+    # analyses from a previous translation may describe since-modified entities
+    trace.clear_cache()
+    with profiling.span('to_builders', category='translate', entity=entity.id()):
+        entity = to_builders(entity)
     if settings.translate.MODE in ['skeleton', 'regular'] and isinstance(entity, WorkflowBuilder):
         assert(isinstance(entity, WorkflowBuilder))
-        prune_workflow(entity)
+        with profiling.span('prune_workflow', category='translate', entity=entity.id()):
+            prune_workflow(entity)
+    return entity
 
-    # select the translation unit 
-    translator = get_translator(dest_fmt)
-
-    # do translation 
+def _translate_entity(translator: TranslatorBase, entity: Tool) -> Any:
     if isinstance(entity, WorkflowBase):
         return translator.translate_workflow(entity)
     elif isinstance(entity, CommandTool):
@@ -2,9 +2,11 @@
 from . import patterns
 from . import mapping
 import regex as re 
+from functools import lru_cache
 
 
 # module entry
+@lru_cache(maxsize=8192)
 def to_case(text: str, case: str='snake') -> str:
     """
     casts text to specific case format.
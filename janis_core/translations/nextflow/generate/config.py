@@ -82,8 +82,10 @@ class ParamGroup:
         heading = f'{INDENT}// {self.heading}\n'
         out: str = ''
         out += heading
+        # widths are properties over the whole group: compute once, not per param
+        name_width, value_width, dtype_width = self.name_width, self.value_width, self.dtype_width
         for param in self.params:
-            formatter = ParamFormatterClosedForm(param, self.name_width, self.value_width, self.dtype_width)
+            formatter = ParamFormatterClosedForm(param, name_width, value_width, dtype_width)
             out += f'{formatter.to_string()}\n'
         return out
 
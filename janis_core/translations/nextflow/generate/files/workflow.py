@@ -5,6 +5,7 @@ from typing import Optional
 from janis_core import Workflow
 from janis_core import settings
 
+from ... import naming
 from ...casefmt import to_case
 
 from ...model.files import NFFile
@@ -67,7 +68,7 @@ def gen_imports_for_workflow_file(
         task_id = step.tool.id()
         task = _get_task(task_id, nf_processes, nf_workflows)
         relpath = _get_relpath(task, nf_workflow)
-        alias = to_case(step.id(), settings.translate.nextflow.NF_PROCESS_CASE) 
+        alias = naming.constructs.gen_varname_step(step.id())
         
         # get the task definition we want to import.
         # only 1 task per file.
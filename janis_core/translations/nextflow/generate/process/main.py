@@ -1,13 +1,15 @@
 
-from typing import Any
+from typing import Any, Optional
 
 from janis_core import settings
 from janis_core import CommandTool, PythonTool, Workflow
+from janis_core.utils import profiling
 from janis_core.types import DataType, Array, Int, Float, Double, Boolean
 NoneType = type(None)
 
 from ... import naming
 from ...model.process import NFProcess
+from ..tasks import TaskGraph, TaskNode
 
 from .directives import gen_nf_process_directives
 from .inputs import gen_nf_process_inputs
@@ -18,29 +20,16 @@ from ...variables import init_variable_manager_for_task
 from ...variables import VariableType
 
 
-def generate_processes(wf: Workflow) -> dict[str, NFProcess]:
-    """for each CommandTool | PythonTool in workflow, generate a nextflow process"""
-    process_dict = {}
-    return do_generate_processes(wf, process_dict)
+def generate_processes(wf: Workflow, graph: Optional[TaskGraph]=None) -> dict[str, NFProcess]:
+    """
+    for each CommandTool | PythonTool in workflow, generate a nextflow process.
+    """
+    graph = graph if graph is not None else TaskGraph(wf)
+    return graph.run(list(graph.processes.values()), _generate_process_task)
 
-def do_generate_processes(wf: Workflow, process_dict: dict[str, NFProcess]) -> dict[str, NFProcess]:
-    for step in wf.step_nodes.values():
-        
-        # create process for each cmdtool / pytool if not already done
-        if isinstance(step.tool, CommandTool) or isinstance(step.tool, PythonTool):
-            tool_id = step.tool.id()
-            if tool_id not in process_dict:
-                process = generate_process(step.tool)
-                process_dict[tool_id] = process
-        
-        # recursively do for subworkflows 
-        elif isinstance(step.tool, Workflow):
-            process_dict = do_generate_processes(step.tool, process_dict)
-        
-        else:
-            raise RuntimeError
-    
-    return process_dict
+def _generate_process_task(node: TaskNode) -> NFProcess:
+    with profiling.span('translate_tool', category='translate', tool=node.task_id):
+        return generate_process(node.tool)  # type: ignore
 
 def generate_process(tool: CommandTool | PythonTool) -> NFProcess:
     if isinstance(tool, CommandTool):
@@ -0,0 +1,81 @@
+
+"""
+Dependency graph of the nextflow processes & workflows generated for a workflow.
+
+Each distinct CommandTool / PythonTool is a process task. Each distinct workflow
+(the main workflow & every subworkflow) is a workflow task, which depends on the
+subworkflows its steps call (these must be generated before it can call them).
+Processes don't depend on each other, and are all generated before workflows.
+
+TaskGraph.run() generates tasks in that order, each after its dependencies. Results
+are returned in depth-first step order (the order tools are reached in the workflow).
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional, TypeVar
+
+from janis_core import CommandTool, PythonTool, Workflow, Tool
+
+T = TypeVar('T')
+
+
+@dataclass
+class TaskNode:
+    task_id: str
+    tool: Tool
+    is_subworkflow: bool = False
+    dependencies: list[str] = field(default_factory=list)  # ids of workflow tasks called by steps
+
+
+class TaskGraph:
+    def __init__(self, main_wf: Workflow) -> None:
+        self.main_wf = main_wf
+        self.processes: dict[str, TaskNode] = {}
+        self.workflows: dict[str, TaskNode] = {}
+        self._add_workflow(main_wf, is_subworkflow=False)
+
+    def _add_workflow(self, wf: Workflow, is_subworkflow: bool) -> None:
+        # processes in the order first reached, workflows after their subworkflows (post-order)
+        dependencies: list[str] = []
+        for step in wf.step_nodes.values():
+            tool_id = step.tool.id()
+            if isinstance(step.tool, (CommandTool, PythonTool)):
+                self.processes.setdefault(tool_id, TaskNode(tool_id, step.tool))
+            elif isinstance(step.tool, Workflow):
+                self._add_workflow(step.tool, is_subworkflow=True)
+                if tool_id not in dependencies:
+                    dependencies.append(tool_id)
+            else:
+                raise RuntimeError
+        self.workflows.setdefault(wf.id(), TaskNode(wf.id(), wf, is_subworkflow, dependencies))
+
+    def get_tool(self, tool_id: str) -> CommandTool | PythonTool:
+        if tool_id not in self.processes:
+            raise Exception(f"Tool '{tool_id}' not found in workflow")
+        return self.processes[tool_id].tool  # type: ignore
+
+    def get_workflow(self, workflow_id: str) -> Workflow:
+        if workflow_id not in self.workflows:
+            raise Exception(f"Workflow '{workflow_id}' not found in workflow")
+        return self.workflows[workflow_id].tool  # type: ignore
+
+    def run(
+        self,
+        nodes: list[TaskNode],
+        func: Callable[[TaskNode], T],
+        results: Optional[dict[str, T]]=None,
+    ) -> dict[str, T]:
+        """
+        calls 'func' for each node, in order. 'nodes' must be in dependency order (as
+        TaskGraph.workflows is). each result is added to 'results' (keyed by task id)
+        before the next node is started, so 'func' may read the results of its dependencies there.
+        returns the results for 'nodes', in the order of 'nodes'.
+        """
+        results = results if results is not None else {}
+        node_ids = {node.task_id for node in nodes}
+        for node in nodes:
+            pending = [d for d in node.dependencies if d in node_ids and d not in results]
+            if pending:
+                raise RuntimeError(f'nextflow task {node.task_id} depends on tasks which are not yet generated: {pending}')
+            results[node.task_id] = func(node)
+        return {node.task_id: results[node.task_id] for node in nodes}
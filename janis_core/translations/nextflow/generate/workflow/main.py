@@ -1,5 +1,6 @@
 
 from dataclasses import dataclass
+from typing import Optional
 from abc import ABC, abstractmethod
 
 from janis_core import settings
@@ -8,7 +9,6 @@ from janis_core.workflow.workflow import StepNode, Workflow
 from ... import naming
 from ... import unwrap
 
-from ...casefmt import to_case
 from ...variables import init_variable_manager_for_task
 from ...variables import VariableType
 
@@ -19,6 +19,7 @@ from ...model.workflow import NFSubWorkflow
 from ...model.workflow import NFWorkflowTake
 from ...model.workflow import NFWorkflowEmit
 
+from ..tasks import TaskGraph, TaskNode
 from ..files import should_create_channel_definition
 from ..files import should_create_variable_definition
 
@@ -27,49 +28,36 @@ from ..files import should_create_variable_definition
 from .call import gen_task_call
 
 
-def generate_workflows(wf: Workflow, process_dict: dict[str, NFProcess]) -> dict[str, NFWorkflow]:
+def generate_workflows(
+    wf: Workflow, 
+    process_dict: dict[str, NFProcess], 
+    graph: Optional[TaskGraph]=None
+    ) -> dict[str, NFWorkflow]:
     """
     for each workflow in workflow, generate a nextflow workflow.
     includes subworkflows, & main workflow.
     """
-    manager = WorkflowGenerationManager(wf, process_dict)
+    manager = WorkflowGenerationManager(wf, process_dict, graph)
     return manager.generate()
 
 
 class WorkflowGenerationManager:
-    def __init__(self, wf: Workflow, process_dict: dict[str, NFProcess]) -> None:
+    def __init__(self, wf: Workflow, process_dict: dict[str, NFProcess], graph: Optional[TaskGraph]=None) -> None:
         self.main_wf = wf
         self.process_dict = process_dict
+        self.graph = graph if graph is not None else TaskGraph(wf)
         self.workflow_dict: dict[str, NFWorkflow] = {}
     
     def generate(self) -> dict[str, NFWorkflow]:
-        self.do_generate(self.main_wf, is_subworkflow=False)
-        return self.workflow_dict
-
-    def do_generate(self, wf: Workflow, is_subworkflow: bool=True) -> None:
         """
-        handles depth-first recursive workflow parsing. 
-        subworkflows are parsed before calling workflows, so that the subworkflow can be called. 
+        subworkflows are generated before the workflows which call them, so that the subworkflow can be called.
         """
-        is_main = True if not is_subworkflow else False
-        is_subworkflow = True
-
-        # depth first 
-        for step in wf.step_nodes.values():
-            if isinstance(step.tool, Workflow):
-                # recursively do for sub-sub-subworkflows 
-                self.do_generate(step.tool, is_subworkflow=True)
-                # do for sub-subworkflow
-                tool_id = step.tool.id()
-                if tool_id not in self.workflow_dict: 
-                    workflow = self.generate_workflow(step.tool, is_subworkflow=True)
-                    self.workflow_dict[tool_id] = workflow
-        
-        # do for this subworkflow
-        tool_id = wf.id()
-        if tool_id not in self.workflow_dict:
-            workflow = self.generate_workflow(wf, is_subworkflow = not is_main)  # im sorry for this, I hate it too. 
-            self.workflow_dict[tool_id] = workflow
+        nodes = list(self.graph.workflows.values())
+        self.workflow_dict = self.graph.run(nodes, self.generate_task, results=self.workflow_dict)
+        return self.workflow_dict
+
+    def generate_task(self, node: TaskNode) -> NFWorkflow:
+        return self.generate_workflow(node.tool, is_subworkflow=node.is_subworkflow)  # type: ignore
     
     def generate_workflow(self, wf: Workflow, is_subworkflow: bool=False) -> NFWorkflow:
         """Generate a Nextflow Workflow object"""
@@ -126,7 +114,7 @@ class WFGenerator(ABC):
         call: list[str] = []
     
         task_id = step.tool.id()
-        alias = to_case(step.id(), settings.translate.nextflow.NF_PROCESS_CASE)
+        alias = naming.constructs.gen_varname_step(step.id())
 
         if task_id in self.process_dict:
             task = self.process_dict[task_id]
@@ -23,7 +23,9 @@ from .generate.process import generate_process
 from .generate.workflow import generate_workflows
 from .generate.files import generate_files 
 from .generate.files import generate_file_process 
+from .generate.tasks import TaskGraph
 
+from . import naming
 from . import params
 from . import generate
 from . import preprocessing
@@ -134,11 +136,13 @@ class NextflowTranslator(TranslatorBase):
     def translate_workflow_internal(self, wf: Workflow) -> Tuple[Any, dict[str, Any]]:
         # set class variables to avoid passing junk params
         settings.translate.nextflow.BASE_OUTDIR = self.basedir
+        naming.table.clear()
 
         preprocessing.populate_task_inputs_workflowmode(wf, wf)
-        processes = generate_processes(wf)
-        workflows = generate_workflows(wf, processes)
-        files = generate_files(wf, processes, workflows)
+        graph = TaskGraph(wf)
+        processes = generate_processes(wf, graph)
+        workflows = generate_workflows(wf, processes, graph)
+        files = generate_files(wf, processes, workflows, graph)
 
         # get the main wf file and all sub files
         main_file = files[wf.id()]
@@ -160,6 +164,7 @@ class NextflowTranslator(TranslatorBase):
         :rtype:
         """
         settings.translate.nextflow.ENTITY = 'tool'
+        naming.table.clear()
 
         preprocessing.populate_task_inputs_toolmode(tool)
         process = generate_process(tool)
@@ -179,6 +184,7 @@ class NextflowTranslator(TranslatorBase):
         """
         assert(isinstance(tool, PythonTool))
         settings.translate.nextflow.ENTITY = 'tool'
+        naming.table.clear()
 
         preprocessing.populate_task_inputs_toolmode(tool)
         process = generate_process(tool)
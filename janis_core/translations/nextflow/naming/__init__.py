@@ -1,6 +1,7 @@
 
 from . import constructs
 from . import process
+from . import table
 
 # from .constructs import get_construct_name
 # from .constructs import gen_varname_workflow
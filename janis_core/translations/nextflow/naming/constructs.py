@@ -9,8 +9,8 @@ from janis_core import (
     PythonTool,
 )
 
-from ..casefmt import to_case
 from ..scope import Scope
+from . import table
 from janis_core import settings
 
 
@@ -30,23 +30,30 @@ def get_construct_name(tool: CommandTool | PythonTool | Workflow, scope: Scope)
     return construct_type
 
 def gen_varname_workflow(basename: str) -> str:
-    return to_case(basename, settings.translate.nextflow.NF_PROCESS_CASE)
+    name = table.get(basename, settings.translate.nextflow.NF_PROCESS_CASE, 'workflow')
+    return table.claim(name, 'workflow', basename)
 
 def gen_varname_process(basename: str) -> str:
-    return to_case(basename, settings.translate.nextflow.NF_PROCESS_CASE)
+    name = table.get(basename, settings.translate.nextflow.NF_PROCESS_CASE, 'process')
+    return table.claim(name, 'process', basename)
+
+def gen_varname_step(step_id: str) -> str:
+    # the alias a step calls its process / workflow by (include { TOOL as STEP })
+    name = table.get(step_id, settings.translate.nextflow.NF_PROCESS_CASE, 'step')
+    return table.claim(name, 'step', step_id)
 
 def gen_varname_channel(janis_tag: str, name_override: Optional[str]=None, dtype: Optional[DataType]=None) -> str:
     basename = name_override if name_override else janis_tag
     # basename = _handle_plurals(basename, dtype)
-    name = to_case(basename, settings.translate.nextflow.NF_CHANNEL_CASE)
+    name = table.get(basename, settings.translate.nextflow.NF_CHANNEL_CASE, 'channel')
     name = f'ch_{name}'
-    return name
+    return table.claim(name, 'channel', basename)
 
 def gen_varname_file(janis_tag: str, name_override: Optional[str]=None, dtype: Optional[DataType]=None) -> str:
     basename = name_override if name_override else janis_tag
     # basename = _handle_plurals(basename, dtype)
-    name = to_case(basename, settings.translate.nextflow.NF_CHANNEL_CASE)
-    return name
+    name = table.get(basename, settings.translate.nextflow.NF_CHANNEL_CASE, 'file')
+    return table.claim(name, 'file', basename)
 
 def gen_varname_param(
     task_id: str, 
@@ -56,10 +63,10 @@ def gen_varname_param(
     ) -> str:
     assert(tinput_id or name_override)
     basename = name_override if name_override else tinput_id
-    basename = to_case(basename, settings.translate.nextflow.NF_PARAM_CASE)
+    basename = table.get(basename, settings.translate.nextflow.NF_PARAM_CASE, 'param')
     if task_id and subtype not in  ['main_workflow', 'defaults']:
-        task_id = to_case(task_id, settings.translate.nextflow.NF_PARAM_CASE)
-        name = f'{task_id}.{basename}'
+        task_name = table.get(task_id, settings.translate.nextflow.NF_PARAM_CASE, 'param')
+        name = f'{task_name}.{basename}'
     else:
         name = basename
-    return name
+    return table.claim(name, 'param', (task_id, name_override if name_override else tinput_id))
@@ -0,0 +1,66 @@
+
+
+import sys
+from typing import Any
+
+from janis_core.utils.logger import Logger
+from ..casefmt import to_case
+
+"""
+Per-translation name table.
+Maps (identifier, case, kind) to its generated nextflow name, so each identifier
+is case-formatted once per translation rather than on every gen_varname_*() call.
+Also the one place naming collisions are detected: two different identifiers
+which generate the same name for the same kind of construct.
+"""
+
+
+class NameTable:
+    def __init__(self):
+        self.names: dict[tuple[str, str, str], str] = {}
+        self.owners: dict[tuple[str, str], Any] = {}
+        self.collisions: dict[tuple[str, str], list[Any]] = {}
+
+    def get(self, identifier: str, case: str, kind: str) -> str:
+        key = (identifier, case, kind)
+        if key not in self.names:
+            self.names[key] = sys.intern(to_case(identifier, case))
+        return self.names[key]
+
+    def claim(self, name: str, kind: str, owner: Any) -> str:
+        """
+        records 'owner' as the source of generated 'name' for this kind of construct.
+        owner is whatever uniquely identifies the source (eg tinput id, (task id, tinput id)).
+        """
+        name = sys.intern(name)
+        key = (kind, name)
+        existing = self.owners.setdefault(key, owner)
+        if existing != owner:
+            if key not in self.collisions:
+                self.collisions[key] = [existing]
+            if owner not in self.collisions[key]:
+                self.collisions[key].append(owner)
+                Logger.warn(f'nextflow {kind} name "{name}" generated for multiple identifiers: {self.collisions[key]}')
+        return name
+
+
+### MODULE ENTRY POINTS
+
+def get(identifier: str, case: str, kind: str) -> str:
+    global name_table
+    return name_table.get(identifier, case, kind)
+
+def claim(name: str, kind: str, owner: Any) -> str:
+    global name_table
+    return name_table.claim(name, kind, owner)
+
+def collisions() -> dict[tuple[str, str], list[Any]]:
+    global name_table
+    return name_table.collisions
+
+def clear() -> None:
+    global name_table
+    name_table = NameTable()
+
+
+name_table = NameTable()
@@ -9,7 +9,6 @@ from janis_core import translation_utils as utils
 from janis_core.workflow.workflow import InputNode
 from janis_core.types import DataType
 
-from janis_core.translations.common import trace
 
 
 @dataclass
@@ -88,12 +87,6 @@ class TaskInputCollector:
         else:
             return self.init_inputs_dict_workflow()
 
-    def get_input_node_references(self, entity: Any, tool: Tool) -> list[str]:
-        referenced_vars = trace.trace_referenced_variables(entity, tool)
-        all_input_keys = tool.inputs_map().keys()
-        input_vars = [x for x in referenced_vars if x in all_input_keys]
-        return input_vars
-            
     def init_inputs_dict_tool(self) -> dict[str, Any]:
         return {tinput.id(): None for tinput in self.tool.tool_inputs()}
 
@@ -130,14 +123,11 @@ class TaskInputCollector:
         assert(isinstance(self.tool, Workflow))
         reference_store = InputNodeReferenceStore(node.id())
 
-        # iterate through each step_input for each step in workflow
-        for step in self.tool.step_nodes.values():
-            for tinput_id, src in step.sources.items():
-                node_names = self.get_input_node_references(src, self.tool)
-                for name in node_names:
-                    if name == node.id():
-                        new_ref = InputNodeReference(step.id(), tinput_id)
-                        reference_store.references.append(new_ref)
+        # each step input which reads from this node
+        for consumer_id, tinput_id in self.tool.consumers_of(node.id()):
+            if consumer_id in self.tool.step_nodes:
+                new_ref = InputNodeReference(consumer_id, tinput_id)
+                reference_store.references.append(new_ref)
         
         return reference_store
 
@@ -48,14 +48,17 @@ def _populate_task_inputs_mainwf(wf: Workflow) -> None:
     how to populate task inputs for main wf.
     all the valid workflow inputs start as a param.
     """
-    all_tinput_ids = set([x.id() for x in wf.tool_inputs()])
+    tinputs: dict[str, Any] = {}
+    for x in wf.tool_inputs():
+        tinputs.setdefault(x.id(), x)
+    all_tinput_ids = set(tinputs.keys())
     param_tinput_ids = get_true_workflow_inputs(wf)
     ignored_tinput_ids = all_tinput_ids - param_tinput_ids
 
     # param inputs
     for tinput_id in param_tinput_ids:
         ti_type = 'param'
-        tinput = [x for x in wf.tool_inputs() if x.id() == tinput_id][0]
+        tinput = tinputs[tinput_id]
         subtype = 'main_workflow'
         param = params.register(tinput, task_id=wf.id(), subtype=subtype)
         value = f'params.{param.name}'
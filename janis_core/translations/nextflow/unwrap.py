@@ -933,7 +933,7 @@ class Unwrapper:
 
         # everything else
         else:
-            upstream_step_id = naming.constructs.gen_varname_process(upstream_step.id())
+            upstream_step_id = naming.constructs.gen_varname_step(upstream_step.id())
             channel_name: str = f'{upstream_step_id}.out.{upstream_out}'
             return self.get_channel_expression(
                 channel_name=channel_name,
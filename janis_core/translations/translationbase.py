@@ -12,6 +12,7 @@ from janis_core.tool.tool import ToolType
 from janis_core.translation_deps.exportpath import ExportPathKeywords
 from janis_core.types.common_data_types import Int
 from janis_core.utils.logger import Logger
+from janis_core.utils import profiling
 from janis_core.operators.selectors import Selector
 from janis_core import settings
 
@@ -111,38 +112,43 @@ class TranslatorBase(ABC):
         str_tool, tr_tools, tr_helpers = None, [], {}
 
         # GENERATE MAIN FILE
-        tr_workflow, tr_tools = self.translate_workflow_internal(wf)
-        str_tool = self.stringify_translated_workflow(tr_workflow)
-
-        # GENERATE SUBFILES - COMMANDTOOLS, PYTHONTOOLS & SUBWORKFLOWS
-        # [filepath, filecontents] for subfiles (tools, subworkflows etc)
-        str_tools = [
-            (
-                os.path.join(self.DIR_TOOLS, self.tool_filename(t)),
-                self.stringify_translated_workflow(tr_tools[t]),
-            )
-            for t in tr_tools
-        ]
+        with profiling.span('translate_workflow_internal', category='translate', dest=self.name, entity=wf.id()):
+            tr_workflow, tr_tools = self.translate_workflow_internal(wf)
+        
+        with profiling.span('stringify', category='translate', dest=self.name, files=len(tr_tools) + 1):
+            str_tool = self.stringify_translated_workflow(tr_workflow)
+
+            # GENERATE SUBFILES - COMMANDTOOLS, PYTHONTOOLS & SUBWORKFLOWS
+            # [filepath, filecontents] for subfiles (tools, subworkflows etc)
+            str_tools = [
+                (
+                    os.path.join(self.DIR_TOOLS, self.tool_filename(t)),
+                    self.stringify_translated_workflow(tr_tools[t]),
+                )
+                for t in tr_tools
+            ]
 
         # GENERATE AUXILIARY FILES
         # {filepath: filecontents} for auxiliary files (PythonTool code.py files etc)
-        tr_helpers = self.translate_helper_files(wf)
+        with profiling.span('translate_helper_files', category='translate', dest=self.name):
+            tr_helpers = self.translate_helper_files(wf)
         str_helpers = [
             (os.path.join(self.DIR_FILES, filename), tr_helpers[filename])
             for filename in tr_helpers.keys()
         ]
 
         # GENERATE INPUT CONFIG
-        # {name: value} for inputs config file (nextflow.config, inputs.yaml etc)
-        tr_inp = self.build_inputs_dict(wf)
-        
-        # inputs config file contents
-        str_inp = self.stringify_translated_inputs(tr_inp)
+        with profiling.span('build_inputs', category='translate', dest=self.name):
+            # {name: value} for inputs config file (nextflow.config, inputs.yaml etc)
+            tr_inp = self.build_inputs_dict(wf)
+            
+            # inputs config file contents
+            str_inp = self.stringify_translated_inputs(tr_inp)
 
-        # {name: value} for resource inputs config
-        tr_res = self.build_resources_input(wf)
-        # resource config file contents
-        str_resources = self.stringify_translated_inputs(tr_res)
+            # {name: value} for resource inputs config
+            tr_res = self.build_resources_input(wf)
+            # resource config file contents
+            str_resources = self.stringify_translated_inputs(tr_res)
 
         # WRITING TO CONSOLE
         if settings.translate.TO_CONSOLE:
@@ -158,116 +164,117 @@ class TranslatorBase(ABC):
 
         # WRITING TO DISK        
         if settings.translate.TO_DISK:
-            # setting filepaths
-            basedir = self.basedir
-            if os.path.isdir(basedir):
-                shutil.rmtree(basedir)
-            fn_workflow = self.workflow_filename(wf)
-            fn_inputs = self.inputs_filename(wf)
-            fn_resources = self.resources_filename(wf)
-
-            # generating subfolders
-            subfolders: list[str] = []
-            subfolders.append(self.DIR_TOOLS)
-            subfolders += self.SUBDIRS_TO_CREATE
-            for subfolder in subfolders:
-                path = os.path.join(basedir, subfolder)
-                if not os.path.isdir(path):
-                    os.makedirs(path)
-
-            # writing inputs config file
-            if settings.translate.WRITE_INPUTS_FILE:
-                if not os.path.isdir(basedir):
-                    os.makedirs(basedir)
-
-                with open(os.path.join(basedir, fn_inputs), "w+") as f:
-                    Logger.log(f"Writing {fn_inputs} to disk")
-                    f.write(str_inp)
-                    Logger.log(f"Written {fn_inputs} to disk")
-            else:
-                Logger.log("Skipping writing input (yaml) job file")
-
-            # writing resources config file
-            if not settings.translate.MERGE_RESOURCES and settings.translate.WITH_RESOURCE_OVERRIDES:
-                print("\n=== RESOURCES ===")
-                with open(os.path.join(basedir, fn_resources), "w+") as wf:
-                    Logger.log(f"Writing {fn_resources} to disk")
-                    wf.write(str_inp)
-                    Logger.log(f"Wrote {fn_resources}  to disk")
-                print(str_resources)
-
-            # writing workflow / tool files
-            Logger.info(f"Exporting tool files to '{basedir}'")
-
-            # writing main workflow
-            with open(os.path.join(basedir, fn_workflow), "w+") as wf:
-                Logger.log(f"Writing {fn_workflow} to disk")
-                wf.write(str_tool)
-                Logger.log(f"Wrote {fn_workflow}  to disk")
-
-            # writing tools, subworkflows
-            for (fn_tool, disk_str_tool) in str_tools:
-                path = os.path.join(basedir, fn_tool)
-                with open(path, "w+") as toolfp:
-                    Logger.log(f"Writing {fn_tool} to disk")
-                    toolfp.write(disk_str_tool)
-                    Logger.log(f"Written {fn_tool} to disk")
+            with profiling.span('write', category='translate', dest=self.name):
+                # setting filepaths
+                basedir = self.basedir
+                if os.path.isdir(basedir):
+                    shutil.rmtree(basedir)
+                fn_workflow = self.workflow_filename(wf)
+                fn_inputs = self.inputs_filename(wf)
+                fn_resources = self.resources_filename(wf)
+
+                # generating subfolders
+                subfolders: list[str] = []
+                subfolders.append(self.DIR_TOOLS)
+                subfolders += self.SUBDIRS_TO_CREATE
+                for subfolder in subfolders:
+                    path = os.path.join(basedir, subfolder)
+                    if not os.path.isdir(path):
+                        os.makedirs(path)
+
+                # writing inputs config file
+                if settings.translate.WRITE_INPUTS_FILE:
+                    if not os.path.isdir(basedir):
+                        os.makedirs(basedir)
+
+                    with open(os.path.join(basedir, fn_inputs), "w+") as f:
+                        Logger.log(f"Writing {fn_inputs} to disk")
+                        f.write(str_inp)
+                        Logger.log(f"Written {fn_inputs} to disk")
+                else:
+                    Logger.log("Skipping writing input (yaml) job file")
+
+                # writing resources config file
+                if not settings.translate.MERGE_RESOURCES and settings.translate.WITH_RESOURCE_OVERRIDES:
+                    print("\n=== RESOURCES ===")
+                    with open(os.path.join(basedir, fn_resources), "w+") as wf:
+                        Logger.log(f"Writing {fn_resources} to disk")
+                        wf.write(str_inp)
+                        Logger.log(f"Wrote {fn_resources}  to disk")
+                    print(str_resources)
+
+                # writing workflow / tool files
+                Logger.info(f"Exporting tool files to '{basedir}'")
+
+                # writing main workflow
+                with open(os.path.join(basedir, fn_workflow), "w+") as wf:
+                    Logger.log(f"Writing {fn_workflow} to disk")
+                    wf.write(str_tool)
+                    Logger.log(f"Wrote {fn_workflow}  to disk")
+
+                # writing tools, subworkflows
+                for (fn_tool, disk_str_tool) in str_tools:
+                    path = os.path.join(basedir, fn_tool)
+                    with open(path, "w+") as toolfp:
+                        Logger.log(f"Writing {fn_tool} to disk")
+                        toolfp.write(disk_str_tool)
+                        Logger.log(f"Written {fn_tool} to disk")
             
-            # copying source files 
-            if settings.general.SOURCE_FILES is not None:
-                # create source folder in basedir
-                source_dir = os.path.join(basedir, 'source')
-                if not os.path.isdir(source_dir):
-                    os.mkdir(source_dir)
+                # copying source files 
+                if settings.general.SOURCE_FILES is not None:
+                    # create source folder in basedir
+                    source_dir = os.path.join(basedir, 'source')
+                    if not os.path.isdir(source_dir):
+                        os.mkdir(source_dir)
                 
-                # copy files
-                for src, dest in settings.general.SOURCE_FILES:
-                    dest = os.path.join(source_dir, dest)
-                    if not os.path.isdir(os.path.dirname(dest)):
-                        os.mkdir(os.path.dirname(dest))
-                    shutil.copy2(src, dest)
-
-            # writing helper files 
-            for (fn_helper, disk_str_helper) in str_helpers:
-                with open(os.path.join(basedir, fn_helper), "w+") as helperfp:
-                    Logger.log(f"Writing {fn_helper} to disk")
-                    helperfp.write(disk_str_helper)
-                    Logger.log(f"Written {fn_helper} to disk")
-
-            # zipping tools file
-            import subprocess
-
-            if settings.translate.SHOULD_ZIP:
-                Logger.debug("Zipping tools")
-                with Path(basedir):
-                    FNULL = open(os.devnull, "w")
-                    zip_result = subprocess.run(
-                        ["zip", "-r", "tools.zip", "tools/"], stdout=FNULL
-                    )
-                    if zip_result.returncode == 0:
-                        Logger.debug("Zipped tools")
-                    else:
-                        Logger.critical(str(zip_result.stderr.decode()))
-
-            if settings.translate.SHOULD_VALIDATE:
-                with Path(basedir):
-
-                    Logger.info(f"Validating outputted {self.name}")
-
-                    enved_vcs = [
-                        (os.getenv(x[1:]) if x.startswith("$") else x)
-                        for x in self.validate_command_for(
-                            fn_workflow, fn_inputs, "tools/", "tools.zip"
-                        )
-                    ]
-
-                    cwltool_result = subprocess.run(enved_vcs)
-                    if cwltool_result.returncode == 0:
-                        Logger.info(
-                            "Exported tool was validated by: " + " ".join(enved_vcs)
+                    # copy files
+                    for src, dest in settings.general.SOURCE_FILES:
+                        dest = os.path.join(source_dir, dest)
+                        if not os.path.isdir(os.path.dirname(dest)):
+                            os.mkdir(os.path.dirname(dest))
+                        shutil.copy2(src, dest)
+
+                # writing helper files 
+                for (fn_helper, disk_str_helper) in str_helpers:
+                    with open(os.path.join(basedir, fn_helper), "w+") as helperfp:
+                        Logger.log(f"Writing {fn_helper} to disk")
+                        helperfp.write(disk_str_helper)
+                        Logger.log(f"Written {fn_helper} to disk")
+
+                # zipping tools file
+                import subprocess
+
+                if settings.translate.SHOULD_ZIP:
+                    Logger.debug("Zipping tools")
+                    with Path(basedir):
+                        FNULL = open(os.devnull, "w")
+                        zip_result = subprocess.run(
+                            ["zip", "-r", "tools.zip", "tools/"], stdout=FNULL
                         )
-                    else:
-                        Logger.critical(str(cwltool_result.stderr))
+                        if zip_result.returncode == 0:
+                            Logger.debug("Zipped tools")
+                        else:
+                            Logger.critical(str(zip_result.stderr.decode()))
+
+                if settings.translate.SHOULD_VALIDATE:
+                    with Path(basedir):
+
+                        Logger.info(f"Validating outputted {self.name}")
+
+                        enved_vcs = [
+                            (os.getenv(x[1:]) if x.startswith("$") else x)
+                            for x in self.validate_command_for(
+                                fn_workflow, fn_inputs, "tools/", "tools.zip"
+                            )
+                        ]
+
+                        cwltool_result = subprocess.run(enved_vcs)
+                        if cwltool_result.returncode == 0:
+                            Logger.info(
+                                "Exported tool was validated by: " + " ".join(enved_vcs)
+                            )
+                        else:
+                            Logger.critical(str(cwltool_result.stderr))
 
         return str_tool, str_inp, str_tools
 
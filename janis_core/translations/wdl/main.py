@@ -71,6 +71,7 @@ from janis_core.utils import (
 )
 from janis_core.utils.generators import generate_new_id_from
 from janis_core.utils.logger import Logger
+from janis_core.utils import profiling
 from janis_core.utils.scatter import ScatterDescription, ScatterMethod
 from janis_core.utils.secondary import (
     split_secondary_file_carats,
@@ -274,9 +275,11 @@ class WdlTranslator(TranslatorBase, metaclass=TranslatorMeta):
                     wtools.update(wf_tools)
 
                 elif isinstance(t, CommandTool):
-                    wtools[t.versioned_id()] = cls.translate_tool_internal(t)
+                    with profiling.span('translate_tool', category='translate', tool=t.id()):
+                        wtools[t.versioned_id()] = cls.translate_tool_internal(t)
                 elif isinstance(t, CodeTool):
-                    wtools[t.versioned_id()] = cls.translate_code_tool_internal(t)
+                    with profiling.span('translate_tool', category='translate', tool=t.id()):
+                        wtools[t.versioned_id()] = cls.translate_code_tool_internal(t)
 
             resource_overrides = {}
 
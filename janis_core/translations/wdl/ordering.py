@@ -41,6 +41,8 @@ tool_input_strategies = [
 ]
 
 def order_tool_inputs(inputs: list[ToolInput]) -> list[ToolInput]:
+    # strategies sort in place: work on a copy so the tool's own inputs are left untouched
+    inputs = list(inputs)
     for strategy in tool_input_strategies:
         inputs = strategy.order(inputs)
     return inputs
@@ -76,6 +78,7 @@ workflow_input_strategies = [
 ]
 
 def order_workflow_inputs(inputs: list[InputNode]) -> list[InputNode]:
+    inputs = list(inputs)
     for strategy in workflow_input_strategies:
         inputs = strategy.order(inputs)
     return inputs
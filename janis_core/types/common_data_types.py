@@ -83,6 +83,9 @@ class UnionType(DataType):
     def id(self):
         return "Union<" + ", ".join(s.id() for s in self.subtypes) + ">"
 
+    def type_signature(self):
+        return (type(self), self.optional, tuple(t.type_signature() for t in self.subtypes))
+
     @staticmethod
     def name() -> str:
         return "Union"
@@ -607,6 +610,10 @@ class Array(DataType):
             return f"Optional<{typed}>"
         return typed
 
+    def type_signature(self):
+        subtype = self._t.type_signature() if self._t is not None else None
+        return (type(self), self.optional, subtype)
+
     def doc(self):
         return "An array"
 
@@ -746,6 +753,10 @@ class Stdout(File):
     def id(self):
         return f"stdout<{self.subtype.id()}>"
 
+    def type_signature(self):
+        # received_type() also syncs the subtype's optionality
+        return (type(self), self.optional, self.received_type().type_signature())
+
     def received_type(self):
         st = self.subtype
         if self.optional is not None:
@@ -795,6 +806,10 @@ class Stderr(File):
     def id(self):
         return f"stderr<{self.subtype.id()}>"
 
+    def type_signature(self):
+        # received_type() also syncs the subtype's optionality
+        return (type(self), self.optional, self.received_type().type_signature())
+
     def received_type(self):
         st = self.subtype
         if self.optional is not None:
@@ -11,8 +11,9 @@
     We are allowed to require that a type must register itself when loaded.
 
 """
+import functools
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Union, Type
+from typing import Any, Callable, Hashable, List, Optional, Union, Type
 
 import cwl_utils.parser.cwl_v1_2 as cwlgen
 import wdlgen
@@ -156,6 +157,39 @@ class NativeTypes:
         )
 
 
+# can_receive_from() results, keyed by 
+# (receiver type_signature(), source type_signature(), source_has_default).
+# compatibility only depends on the type classes, optionality and nested types,
+# so the answer for a pair of signatures never changes.
+_receive_cache: dict[tuple[Hashable, Hashable, bool], bool] = {}
+
+
+def clear_receive_cache() -> None:
+    _receive_cache.clear()
+
+
+def cached_can_receive_from(func: Callable[..., bool]) -> Callable[..., bool]:
+    """
+    Memoises a can_receive_from() implementation. 
+    Only the most derived implementation for type(self) is cached: 
+    super().can_receive_from() calls into parent implementations are run as normal.
+    """
+    @functools.wraps(func)
+    def wrapper(self, other, *args, **kwargs) -> bool:
+        if type(self).can_receive_from is not wrapper or not isinstance(other, DataType):
+            return func(self, other, *args, **kwargs)
+        if len(args) > 1 or any(k != "source_has_default" for k in kwargs):
+            return func(self, other, *args, **kwargs)
+
+        source_has_default = args[0] if args else kwargs.get("source_has_default", False)
+        key = (self.type_signature(), other.type_signature(), bool(source_has_default))
+        if key not in _receive_cache:
+            _receive_cache[key] = func(self, other, *args, **kwargs)
+        return _receive_cache[key]
+
+    return wrapper
+
+
 class DataType(ABC):
     def __init__(self, optional=False):
         self.optional = optional if optional is not None else False
@@ -167,6 +201,11 @@ class DataType(ABC):
     def __hash__(self):
         return hash(self.__class__.__name__)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "can_receive_from" in cls.__dict__:
+            cls.can_receive_from = cached_can_receive_from(cls.__dict__["can_receive_from"])
+
     def __repr__(self):
         return self.id()
 
@@ -218,6 +257,15 @@ class DataType(ABC):
     def identify(self):
         print(self.id())
 
+    def type_signature(self) -> Hashable:
+        """
+        Everything can_receive_from() depends on, used to memoise it. 
+        Types holding nested types (Array, UnionType, Stdout etc) include their signatures. 
+        Override this if a subclass' can_receive_from() depends on other instance state.
+        """
+        return (type(self), self.optional)
+
+    @cached_can_receive_from
     def can_receive_from(self, other, source_has_default=False) -> bool:
         """
         Can this class receive from $other, likely going to be type(a) == type(b)
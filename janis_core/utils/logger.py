@@ -3,8 +3,12 @@
 """
 import sys
 import os
+import time
+import queue
+import atexit
+import threading
 from datetime import datetime
-from typing import Optional, TextIO, Dict, Tuple
+from typing import Any, Callable, Optional, TextIO, Dict, Tuple, Union
 import traceback
 
 
@@ -91,6 +95,76 @@ class LogLevel:
         )
 
 
+class _BackgroundWriter:
+    """
+    Writes log lines to file pointers from a daemon thread. 
+    Lines are passed through a bounded queue (callers block when it is full), 
+    and pointers are flushed + fsync'd at most once per FLUSH_INTERVAL seconds.
+    """
+
+    QUEUE_SIZE = 10_000
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._dirty: set = set()
+        self._last_flush = time.monotonic()
+
+    def put(self, pointer: TextIO, line: str) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._start()
+        self._queue.put((pointer, line))
+
+    def drain(self) -> None:
+        """blocks until every queued line has been written, then flushes"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+        self._flush()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="janis-logger", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                pointer, line = self._queue.get(timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                self._flush()
+                continue
+            try:
+                if not pointer.closed:
+                    pointer.write(line)
+                    with self._lock:
+                        self._dirty.add(pointer)
+                if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+                    self._flush()
+            except (OSError, ValueError):
+                # pointer was closed underneath us, nothing sensible to do
+                pass
+            finally:
+                self._queue.task_done()
+
+    def _flush(self) -> None:
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            self._last_flush = time.monotonic()
+        for pointer in dirty:
+            try:
+                if not pointer.closed:
+                    pointer.flush()
+                    os.fsync(pointer.fileno())
+            except (OSError, ValueError):
+                pass
+
+
 class Logger:
     CONSOLE_LEVEL: Optional[int] = LogLevel.INFO
     __TEMP_CONSOLE_LEVEL: Optional[int] = None
@@ -103,7 +177,13 @@ class Logger:
     WRITE_LOCATION: Optional[str] = None
     __WRITE_POINTER: Optional[TextIO] = None
 
-    last_write: datetime = datetime.now()
+    # file sinks are written from a background thread (see _BackgroundWriter)
+    BACKGROUND_WRITES: bool = True
+    _writer = _BackgroundWriter()
+
+    # prefix timestamps have second resolution, so are only regenerated once per second
+    _prefix_second: int = -1
+    _prefix_timestamp: str = ""
 
     @staticmethod
     def set_console_level(level: Optional[int]):
@@ -132,8 +212,16 @@ class Logger:
         Logger.WRITE_LEVELS = {level: (Logger.WRITE_LOCATION, Logger.__WRITE_POINTER)}
         Logger.WRITE_LEVEL = level
 
+    @staticmethod
+    def flush():
+        """
+        Waits for queued file writes to complete and flushes all file sinks
+        """
+        Logger._writer.drain()
+
     @staticmethod
     def set_write_location(location: str):
+        Logger.flush()
         for p in Logger.WRITE_LEVELS.values():
             (path, pointer) = p
             if pointer is not None and not pointer.closed:
@@ -150,6 +238,7 @@ class Logger:
 
     @staticmethod
     def close_file():
+        Logger.flush()
         nwl = {}
         for k, p in Logger.WRITE_LEVELS.items():
             path, pointer = p
@@ -161,47 +250,63 @@ class Logger:
         Logger.__WRITE_POINTER = None
 
     @staticmethod
-    def log(message: str, level: int = LogLevel.VERBOSE):
+    def log(
+        message: Union[str, Callable[[], str]], 
+        level: int = LogLevel.VERBOSE, 
+        *args: Any
+    ):
+        """
+        Logs a message at the given level. 
+        To avoid formatting messages which no sink accepts, 'message' can be a 
+        callable returning the message, or a %-style format string with 'args'.
+        """
         if level is None:
             # This is a developer error, we should never try to log with no level, it's purely for
             return
 
+        to_console = Logger.CONSOLE_LEVEL is not None and level <= Logger.CONSOLE_LEVEL
+        pointers = [
+            pointer
+            for loglevel, (_, pointer) in Logger.WRITE_LEVELS.items()
+            if level <= loglevel and pointer is not None and not pointer.closed
+        ]
+        if not to_console and not pointers:
+            return
+
+        if callable(message):
+            message = message()
+        elif args:
+            message = message % args
+
         m = f"{Logger.get_prefix(level)}: {message}"
-        if Logger.CONSOLE_LEVEL is not None and level <= Logger.CONSOLE_LEVEL:
+        if to_console:
             print(LogLevel.get_color(level) + m + _bcolors.ENDC, file=sys.stderr)
 
         # if level <= LogLevel.CRITICAL:
         #     traceback.print_stack(limit=12)
         #     raise Exception(traceback.extract_stack(limit=5))
 
-        should_write = (datetime.now() - Logger.last_write).total_seconds() >= 1
-
-        for loglevel, p in Logger.WRITE_LEVELS.items():
-            pointer = p[1]
-            if level > loglevel or pointer is None or pointer.closed:
-                continue
-            pointer.write(m + "\n")
-
-            if should_write:
-                Logger.last_write = datetime.now()
-                pointer.flush()
-                os.fsync(pointer.fileno())
+        for pointer in pointers:
+            if Logger.BACKGROUND_WRITES:
+                Logger._writer.put(pointer, m + "\n")
+            else:
+                pointer.write(m + "\n")
 
     @staticmethod
-    def debug(message: str):
-        Logger.log(message, LogLevel.DEBUG)
+    def debug(message: Union[str, Callable[[], str]], *args: Any):
+        Logger.log(message, LogLevel.DEBUG, *args)
 
     @staticmethod
-    def info(message: str):
-        Logger.log(message, LogLevel.INFO)
+    def info(message: Union[str, Callable[[], str]], *args: Any):
+        Logger.log(message, LogLevel.INFO, *args)
 
     @staticmethod
-    def warn(message: str):
-        Logger.log(message, LogLevel.WARNING)
+    def warn(message: Union[str, Callable[[], str]], *args: Any):
+        Logger.log(message, LogLevel.WARNING, *args)
 
     @staticmethod
-    def critical(message: str):
-        Logger.log(message, LogLevel.CRITICAL)
+    def critical(message: Union[str, Callable[[], str]], *args: Any):
+        Logger.log(message, LogLevel.CRITICAL, *args)
 
     @staticmethod
     def log_ex(ex: Exception):
@@ -223,4 +328,11 @@ class Logger:
 
     @staticmethod
     def get_prefix(level: int):
-        return f"{datetime.now().replace(microsecond=0).isoformat()} [{LogLevel.get_str(level)}]"
+        second = int(time.time())
+        if second != Logger._prefix_second:
+            Logger._prefix_second = second
+            Logger._prefix_timestamp = datetime.fromtimestamp(second).isoformat()
+        return f"{Logger._prefix_timestamp} [{LogLevel.get_str(level)}]"
+
+
+atexit.register(Logger.flush)
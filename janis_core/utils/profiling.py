@@ -0,0 +1,191 @@
+"""
+    Profiling - opt-in phase-level instrumentation for ingest() and translate()
+
+    Phases are recorded as nestable spans (wall time + counters) when
+    settings.profiling.ENABLED is set. Finished spans can be exported as
+    Chrome trace-event json (chrome://tracing, ui.perfetto.dev) or a flat csv:
+
+        settings.profiling.ENABLED = True
+        wf = ingest('workflow.ga', 'galaxy')
+        translate(wf, 'nextflow')
+        profiling.export_chrome_trace('trace.json')
+
+    settings.profiling.CPROFILE_PHASE additionally captures every span with
+    that name under cProfile.
+"""
+import os
+import csv
+import json
+import time
+import pstats
+import cProfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from janis_core import settings
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start: float                # time.perf_counter() seconds
+    depth: int
+    parent: Optional[str]
+    thread: int
+    duration: float = 0.0       # seconds
+    args: dict[str, Any] = field(default_factory=dict)  # attributes & counters
+
+
+_lock = threading.Lock()
+_local = threading.local()
+_spans: list[Span] = []
+_cprofile: Optional[cProfile.Profile] = None
+_cprofile_active: bool = False
+
+
+def _stack() -> list[Span]:
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+@contextmanager
+def span(name: str, category: str='janis', **args: Any) -> Iterator[Optional[Span]]:
+    """
+    records a phase. nested spans (on the same thread) are recorded as children.
+    'args' are stored on the span and exported alongside it.
+    yields None when profiling is disabled.
+    """
+    profile = settings.profiling.CPROFILE_PHASE is not None and name == settings.profiling.CPROFILE_PHASE
+    if not settings.profiling.ENABLED and not profile:
+        yield None
+        return
+
+    started_cprofile = _start_cprofile() if profile else False
+    stack = _stack()
+    current = Span(
+        name=name,
+        category=category,
+        start=time.perf_counter(),
+        depth=len(stack),
+        parent=stack[-1].name if stack else None,
+        thread=threading.get_ident(),
+        args=dict(args),
+    )
+    stack.append(current)
+    try:
+        yield current
+    finally:
+        current.duration = time.perf_counter() - current.start
+        stack.pop()
+        if started_cprofile:
+            _stop_cprofile()
+        if settings.profiling.ENABLED:
+            with _lock:
+                _spans.append(current)
+
+def count(counter: str, n: int=1) -> None:
+    """increments a counter on the innermost active span of this thread"""
+    if not settings.profiling.ENABLED:
+        return
+    stack = _stack()
+    if stack:
+        args = stack[-1].args
+        args[counter] = args.get(counter, 0) + n
+
+def spans() -> list[Span]:
+    """finished spans, ordered by start time"""
+    with _lock:
+        return sorted(_spans, key=lambda s: s.start)
+
+def clear() -> None:
+    global _cprofile
+    with _lock:
+        _spans.clear()
+        if not _cprofile_active:
+            _cprofile = None
+
+
+### CPROFILE ###
+
+def _start_cprofile() -> bool:
+    # cProfile cannot nest, so a phase name which recurses (eg nested subworkflows)
+    # is only captured at its outermost span.
+    global _cprofile, _cprofile_active
+    with _lock:
+        if _cprofile_active:
+            return False
+        if _cprofile is None:
+            _cprofile = cProfile.Profile()
+        _cprofile_active = True
+    try:
+        _cprofile.enable()
+    except ValueError:
+        # another profiler is already running (eg the user's own cProfile session)
+        _cprofile_active = False
+        return False
+    return True
+
+def _stop_cprofile() -> None:
+    global _cprofile_active
+    assert(_cprofile is not None)
+    _cprofile.disable()
+    _cprofile_active = False
+    if settings.profiling.CPROFILE_PATH is not None:
+        _cprofile.dump_stats(settings.profiling.CPROFILE_PATH)
+
+def cprofile_stats() -> Optional[pstats.Stats]:
+    """accumulated cProfile stats for settings.profiling.CPROFILE_PHASE spans"""
+    if _cprofile is None or _cprofile_active:
+        return None
+    return pstats.Stats(_cprofile)
+
+
+### EXPORT ###
+
+def to_chrome_trace() -> dict[str, Any]:
+    """complete ('X') trace events for each finished span. timestamps are in microseconds."""
+    finished = spans()
+    origin = finished[0].start if finished else 0.0
+    pid = os.getpid()
+    events: list[dict[str, Any]] = []
+    for s in finished:
+        events.append({
+            'name': s.name,
+            'cat': s.category,
+            'ph': 'X',
+            'ts': round((s.start - origin) * 1e6, 3),
+            'dur': round(s.duration * 1e6, 3),
+            'pid': pid,
+            'tid': s.thread,
+            'args': _jsonable(s.args),
+        })
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+def export_chrome_trace(path: str) -> None:
+    with open(path, 'w') as fp:
+        json.dump(to_chrome_trace(), fp)
+
+def export_csv(path: str) -> None:
+    """one row per span. 'args' is a json object."""
+    finished = spans()
+    origin = finished[0].start if finished else 0.0
+    with open(path, 'w', newline='') as fp:
+        writer = csv.writer(fp)
+        writer.writerow(['name', 'category', 'parent', 'depth', 'thread', 'start_ms', 'duration_ms', 'args'])
+        for s in finished:
+            writer.writerow([
+                s.name,
+                s.category,
+                s.parent or '',
+                s.depth,
+                s.thread,
+                f'{(s.start - origin) * 1e3:.3f}',
+                f'{s.duration * 1e3:.3f}',
+                json.dumps(_jsonable(s.args), sort_keys=True),
+            ])
+
+def _jsonable(args: dict[str, Any]) -> dict[str, Any]:
+    return {k: v if isinstance(v, (str, int, float, bool)) or v is None else str(v) for k, v in args.items()}
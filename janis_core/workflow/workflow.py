@@ -1,6 +1,7 @@
 import copy
 import os
 from abc import abstractmethod
+from collections import deque
 from inspect import isclass
 from typing import List, Union, Optional, Dict, Tuple, Any, Set, Iterable, Type
 from uuid import uuid4
@@ -92,7 +93,36 @@ def verify_or_try_get_source(
     return StepOutputSelector(node, tag)
 
 
+def get_source_nodes(source: Any) -> List[Node]:
+    """
+    The nodes (InputNodes / StepNodes) which a connection source reads from.
+    Walks selectors, operators and string formatters down to their node references.
+    """
+    if isinstance(source, InputNodeSelector):
+        return [source.input_node]
+    if isinstance(source, StepOutputSelector):
+        return [source.node]
+    if isinstance(source, AliasSelector):
+        return get_source_nodes(source.inner_selector)
+
+    if isinstance(source, list):
+        items = source
+    elif isinstance(source, StringFormatter):
+        items = list(source.kwargs.values())
+    elif isinstance(source, Operator):
+        items = source.args
+    else:
+        return []
+
+    nodes = []
+    for item in items:
+        nodes.extend(get_source_nodes(item))
+    return nodes
+
+
 class InputNode(Node):
+    __slots__ = ('uuid', 'datatype', 'default', 'doc', 'value')
+
     def __init__(
         self,
         wf,
@@ -188,11 +218,16 @@ class StepNode(Node):
         # If tag is in scatter.fields, then we can
         scatter = self.scatter and tag in self.scatter.fields
 
-        return self.sources[tag].add_source(source, should_scatter=scatter)
+        edge = self.sources[tag].add_source(source, should_scatter=scatter)
+        self.wf.index_edge(self, tag, source)
+        return edge
 
     def __getattr__(self, item):
         if item in self.__dict__:
             return self.__dict__[item]
+        if item.startswith("__"):
+            # eg __setstate__ while unpickling, before 'tool' is set
+            raise AttributeError(item)
 
         return self.get_item(item)
 
@@ -247,6 +282,8 @@ class StepNode(Node):
 
 
 class OutputNode(Node):
+    __slots__ = ('uuid', 'datatype', 'source', 'doc', 'output_folder', 'output_name', 'extension')
+
     def __init__(
         self,
         wf,
@@ -333,6 +370,13 @@ class WorkflowBase(Tool):
         self.has_subworkflow = False
         self.has_multiple_inputs = False
 
+        # Adjacency index, built on first query (see consumers_of / producers_of)
+        # producer node id -> {(consumer node id, consumer tag)}
+        self._consumers: Optional[Dict[str, Dict[Tuple[str, Optional[str]], None]]] = None
+        # consumer node id -> {producer node id}
+        self._producers: Optional[Dict[str, Dict[str, None]]] = None
+        self._topological_order: Optional[List[str]] = None
+
     @abstractmethod
     def friendly_name(self):
         pass
@@ -485,6 +529,7 @@ class WorkflowBase(Tool):
         )
         self.nodes[identifier] = otp
         self.output_nodes[identifier] = otp
+        self.index_edge(otp, None, otp.source)
         return otp
 
     def forward_inputs_from_tool(
@@ -855,6 +900,7 @@ class WorkflowBase(Tool):
         self.has_subworkflow = self.has_subworkflow or isinstance(tool, WorkflowBase)
         self.nodes[identifier] = stp
         self.step_nodes[identifier] = stp
+        self._topological_order = None
 
         return stp
 
@@ -1100,18 +1146,89 @@ class WorkflowBase(Tool):
 
     @staticmethod
     def get_step_ids_from_selector(selector: Selector) -> Set[str]:
-        if isinstance(selector, StepOutputSelector):
-            return {selector.node.id()}
-        elif isinstance(selector, Operator):
-            from itertools import chain
-
-            return set(
-                chain.from_iterable(
-                    Workflow.get_step_ids_from_selector(s)
-                    for s in selector.get_leaves()
-                )
-            )
-        return set()
+        return {
+            node.id()
+            for node in get_source_nodes(selector)
+            if isinstance(node, StepNode)
+        }
+
+    # ADJACENCY INDEX
+
+    def index_edge(self, consumer: Node, tag: Optional[str], source: Any) -> None:
+        """
+        Record that 'consumer.tag' reads from the nodes referenced by 'source'.
+        Called as edges are added. A no-op until the index has been built.
+        """
+        self._topological_order = None
+        if self._consumers is None or self._producers is None:
+            return
+        for producer in get_source_nodes(source):
+            self._consumers.setdefault(producer.id(), {})[(consumer.id(), tag)] = None
+            self._producers.setdefault(consumer.id(), {})[producer.id()] = None
+
+    def invalidate_graph_index(self) -> None:
+        """Discard the adjacency index. Call after removing nodes or step sources."""
+        self._consumers = None
+        self._producers = None
+        self._topological_order = None
+
+    def _build_graph_index(self) -> None:
+        self._consumers = {}
+        self._producers = {}
+        for step in self.step_nodes.values():
+            for tag, stepinput in step.sources.items():
+                for edge in stepinput.source_map:
+                    self.index_edge(step, tag, edge.source)
+        for out in self.output_nodes.values():
+            self.index_edge(out, None, out.source)
+
+    def consumers_of(self, node_id: str) -> List[Tuple[str, Optional[str]]]:
+        """
+        The (node id, tag) pairs which read from node 'node_id'.
+        Steps are reported with the step input tag, OutputNodes with a tag of None.
+        """
+        if self._consumers is None:
+            self._build_graph_index()
+        assert self._consumers is not None
+        return list(self._consumers.get(node_id, {}))
+
+    def producers_of(self, node_id: str) -> List[str]:
+        """The ids of the InputNodes / StepNodes which node 'node_id' reads from."""
+        if self._producers is None:
+            self._build_graph_index()
+        assert self._producers is not None
+        return list(self._producers.get(node_id, {}))
+
+    def topological_order(self) -> List[str]:
+        """
+        Step ids ordered so that each step comes after the steps it reads from.
+        Ties keep the order in which steps were added.
+        """
+        if self._topological_order is not None:
+            return list(self._topological_order)
+
+        step_ids = list(self.step_nodes.keys())
+        indegree = {
+            step_id: len([p for p in self.producers_of(step_id) if p in self.step_nodes])
+            for step_id in step_ids
+        }
+        ready = deque(step_id for step_id in step_ids if indegree[step_id] == 0)
+        order: List[str] = []
+        while ready:
+            step_id = ready.popleft()
+            order.append(step_id)
+            consumer_ids = {consumer_id: None for consumer_id, _ in self.consumers_of(step_id)}
+            for consumer_id in consumer_ids:
+                if consumer_id in indegree:
+                    indegree[consumer_id] -= 1
+                    if indegree[consumer_id] == 0:
+                        ready.append(consumer_id)
+
+        # cycles can't be ordered: keep the remaining steps in insertion order
+        ordered = set(order)
+        order.extend(step_id for step_id in step_ids if step_id not in ordered)
+        self._topological_order = order
+        return list(order)
 
     @staticmethod
     def get_dot_plot_internal(